@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🏋️ Teste de estresse de concorrência do TicketFlow
+Vários processos criam tickets ao mesmo tempo no mesmo arquivo de dados e,
+no final, verifica-se que nenhum ticket foi perdido. Com --mesmo-ticket,
+todos comentam e alteram o status de um único ticket e confere-se que
+nenhum comentário ou entrada de histórico foi perdido.
+
+Uso:
+    python bench_concorrencia.py [--processos N] [--tickets M] [--dados ENDERECO]
+    python bench_concorrencia.py --mesmo-ticket [--processos N] [--alteracoes M]
+
+Exemplos:
+    python bench_concorrencia.py --processos 8 --tickets 50
+    python bench_concorrencia.py --dados journal://estresse.json
+    python bench_concorrencia.py --mesmo-ticket --processos 4 --alteracoes 40
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+
+
+def _trabalhador(arquivo_dados, indice, quantidade, fila):
+    from main import SistemaTickets
+
+    sistema = SistemaTickets(arquivo_dados)
+    sistema.definir_usuario(f"processo-{indice}")
+    ids = []
+    for i in range(quantidade):
+        ticket = sistema.criar_ticket(titulo=f"Estresse {indice}-{i}", descricao="Teste de concorrência")
+        ids.append(ticket.id)
+    fila.put(ids)
+
+
+def _alterador(arquivo_dados, indice, ticket_id, quantidade, fila):
+    from main import SistemaTickets
+
+    sistema = SistemaTickets(arquivo_dados)
+    sistema.definir_usuario(f"processo-{indice}")
+    comentarios = status = 0
+    for i in range(quantidade):
+        comentarios += sistema.adicionar_comentario(ticket_id, f"Comentário {indice}-{i}")
+        status += sistema.atualizar_status(ticket_id, "em_andamento" if i % 2 else "pausado")
+    fila.put((comentarios, status))
+
+
+def _remover_arquivos(caminho):
+    for sufixo in ("", ".lock", ".journal", ".ids.lock"):
+        if os.path.isdir(caminho + sufixo):
+            shutil.rmtree(caminho + sufixo)
+        elif os.path.exists(caminho + sufixo):
+            os.remove(caminho + sufixo)
+
+
+def executar_estresse(arquivo_dados="estresse.json", processos=4, tickets_por_processo=25):
+    """Executa o teste e retorna (esperados, encontrados, perdidos, segundos)."""
+    from main import criar_gerenciador
+
+    caminho = arquivo_dados.split("://", 1)[-1]
+    _remover_arquivos(caminho)
+    fila = multiprocessing.Queue()
+    trabalhadores = [
+        multiprocessing.Process(target=_trabalhador, args=(arquivo_dados, i, tickets_por_processo, fila))
+        for i in range(processos)
+    ]
+    inicio = time.perf_counter()
+    for p in trabalhadores:
+        p.start()
+    criados = []
+    for _ in trabalhadores:
+        criados.extend(fila.get())
+    for p in trabalhadores:
+        p.join()
+    segundos = time.perf_counter() - inicio
+
+    gerenciador = criar_gerenciador(arquivo_dados)
+    encontrados = {t.id for t in gerenciador.obter_todos_tickets()}
+    perdidos = [ticket_id for ticket_id in criados if ticket_id not in encontrados]
+    _remover_arquivos(caminho)
+    return len(criados), len(encontrados), perdidos, segundos
+
+
+def executar_estresse_mesmo_ticket(arquivo_dados="estresse.json", processos=4, alteracoes_por_processo=25):
+    """Todos os processos comentam e alteram o status do mesmo ticket.
+    Retorna (comentários esperados, encontrados, histórico esperado,
+    encontrado, segundos); só contam as alterações que retornaram True."""
+    from main import SistemaTickets, criar_gerenciador
+
+    caminho = arquivo_dados.split("://", 1)[-1]
+    _remover_arquivos(caminho)
+    ticket = SistemaTickets(arquivo_dados).criar_ticket(titulo="Disputado", descricao="Teste de concorrência")
+    fila = multiprocessing.Queue()
+    trabalhadores = [
+        multiprocessing.Process(target=_alterador, args=(arquivo_dados, i, ticket.id, alteracoes_por_processo, fila))
+        for i in range(processos)
+    ]
+    inicio = time.perf_counter()
+    for p in trabalhadores:
+        p.start()
+    comentarios = status = 0
+    for _ in trabalhadores:
+        c, s = fila.get()
+        comentarios, status = comentarios + c, status + s
+    for p in trabalhadores:
+        p.join()
+    segundos = time.perf_counter() - inicio
+
+    final = criar_gerenciador(arquivo_dados).obter_ticket(ticket.id)
+    _remover_arquivos(caminho)
+    # Histórico: a criação, mais uma entrada por comentário e por mudança de status
+    return comentarios, len(final.comentarios), 1 + comentarios + status, len(final.historico), segundos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de estresse de concorrência do TicketFlow")
+    parser.add_argument("--processos", type=int, default=4)
+    parser.add_argument("--tickets", type=int, default=25, help="tickets criados por processo")
+    parser.add_argument("--dados", default="estresse.json", help="endereço dos dados (ex.: journal://estresse.json)")
+    parser.add_argument("--mesmo-ticket", action="store_true", help="todos os processos alteram o mesmo ticket")
+    parser.add_argument("--alteracoes", type=int, default=25, help="comentários/status por processo (--mesmo-ticket)")
+    args = parser.parse_args()
+
+    if args.mesmo_ticket:
+        print(f"🏋️ {args.processos} processos x {args.alteracoes} alterações no mesmo ticket em {args.dados}")
+        comentarios, encontrados, historico, historico_final, segundos = executar_estresse_mesmo_ticket(
+            args.dados, args.processos, args.alteracoes)
+        print(f"Comentários: {encontrados} de {comentarios}")
+        print(f"Histórico:   {historico_final} de {historico} entradas")
+        print(f"Tempo total: {segundos:.2f}s")
+        if (encontrados, historico_final) != (comentarios, historico):
+            print("❌ Alterações perdidas no mesmo ticket")
+            return 1
+        print("✅ Nenhuma alteração perdida")
+        return 0
+
+    print(f"🏋️ {args.processos} processos x {args.tickets} tickets em {args.dados}")
+    esperados, encontrados, perdidos, segundos = executar_estresse(args.dados, args.processos, args.tickets)
+    print(f"Tickets criados:    {esperados}")
+    print(f"Tickets no arquivo: {encontrados}")
+    print(f"Tempo total:        {segundos:.2f}s ({esperados / segundos:.1f} tickets/s)")
+    if perdidos:
+        print(f"❌ {len(perdidos)} ticket(s) perdido(s)")
+        return 1
+    print("✅ Nenhum ticket perdido")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+📊 Benchmark das camadas de armazenamento e serviço do TicketFlow
+Gera bases sintéticas reprodutíveis (histórico e comentários realistas) em
+cada backend e mede vazão e latência (p50/p95/p99) de criar_ticket,
+obter_ticket, listar_tickets com filtros, gerar_relatorio,
+adicionar_comentario e deletar_ticket, além do tempo de abertura e do pico
+de memória do processo. Os resultados vão para um arquivo JSON que pode
+servir de baseline para as próximas execuções.
+
+Uso:
+    python bench_desempenho.py [--tamanhos 1000 10000] [--backends json sqlite]
+                               [--operacoes N] [--saida resultados.json]
+                               [--baseline baseline.json] [--tolerancia 0.25]
+
+Cada base é gerada num processo e medida em outro, novo, para que o pico de
+memória seja só o da abertura e das operações. Com --baseline, regressões
+acima da tolerância são listadas e o código de saída é 1. Bases de
+1.000.000 de tickets levam minutos e vários GB de RAM no backend JSON.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import random
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime, timedelta
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+FORMATO = 1
+BACKENDS = {
+    "json": "{pasta}/tickets.json",
+    "journal": "journal://{pasta}/tickets.json",
+    "sqlite": "{pasta}/tickets.db",
+    "fragmentos": "fragmentos://{pasta}/fragmentos",
+}
+OPERACOES = ("criar_ticket", "obter_ticket", "listar_tickets", "gerar_relatorio",
+             "adicionar_comentario", "deletar_ticket")
+FILTROS = (
+    {"status": "aberto"},
+    {"prioridade": "ALTA"},
+    {"usuario": "agente7"},
+    {"categoria": "Bug"},
+    {"status": "em_andamento", "prioridade": "CRITICA"},
+)
+# Diferenças menores que isto (ms) não contam como regressão: é ruído
+DIFERENCA_MINIMA_MS = 0.05
+
+
+def gerar_tickets(quantidade, historico_medio=5, comentarios_medio=2, semente=42):
+    """Gera tickets sintéticos determinísticos para a semente dada."""
+    from main import Ticket, StatusEnum, PrioridadeEnum
+
+    rnd = random.Random(semente)
+    usuarios = [f"agente{i}" for i in range(50)]
+    categorias = ["Bug", "Feature", "Infraestrutura", "Dúvida", "Acesso", None]
+    status = [s.value for s in StatusEnum]
+    pesos_status = [30, 25, 10, 20, 10, 5][:len(status)]
+    prioridades = [p.name for p in PrioridadeEnum]
+    pesos_prioridade = [30, 40, 20, 10][:len(prioridades)]
+    inicio = datetime(2025, 1, 1)
+    passo = 365 * 86400 / max(1, quantidade)
+    for i in range(quantidade):
+        criado = inicio + timedelta(seconds=i * passo)
+        momentos = sorted(criado + timedelta(minutes=rnd.randint(1, 20000))
+                          for _ in range(rnd.randint(0, 2 * historico_medio) + rnd.randint(0, 2 * comentarios_medio)))
+        quantos_historico = min(len(momentos), rnd.randint(0, 2 * historico_medio))
+        historico = [{
+            "data": momento.isoformat(),
+            "usuario": rnd.choice(usuarios),
+            "campo": rnd.choice(["status", "prioridade", "atribuido_a", "comentario"]),
+            "valor_anterior": None,
+            "valor_novo": rnd.choice(status),
+            "descricao": f"Alteração {j} do ticket {i}"
+        } for j, momento in enumerate(momentos[:quantos_historico])]
+        comentarios = [{
+            "id": f"C{i:08X}{j:02X}",
+            "data": momento.isoformat(),
+            "usuario": rnd.choice(usuarios),
+            "conteudo": f"Comentário {j} sobre o ticket {i}: " + " ".join(rnd.choice(
+                ["erro", "servidor", "acesso", "senha", "lento", "impressora", "rede", "relatório"]) for _ in range(8)),
+            "atualizado_em": None
+        } for j, momento in enumerate(momentos[quantos_historico:])]
+        atualizado = momentos[-1] if momentos else criado
+        yield Ticket(
+            id=f"{i:08X}",
+            titulo=f"Ticket sintético {i}",
+            descricao=f"Descrição do ticket {i} com detalhes do problema relatado",
+            prioridade=rnd.choices(prioridades, pesos_prioridade)[0],
+            status=rnd.choices(status, pesos_status)[0],
+            criado_em=criado.isoformat(),
+            atualizado_em=atualizado.isoformat(),
+            criado_por=rnd.choice(usuarios),
+            atribuido_a=rnd.choice(usuarios + [None]),
+            categoria=rnd.choice(categorias),
+            historico=historico,
+            comentarios=comentarios,
+        )
+
+
+def percentil(valores, fracao):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(fracao * len(ordenados)))]
+
+
+def _resumir(latencias):
+    total = sum(latencias)
+    return {
+        "n": len(latencias),
+        "por_segundo": len(latencias) / total if total else 0.0,
+        "p50_ms": percentil(latencias, 0.50) * 1000,
+        "p95_ms": percentil(latencias, 0.95) * 1000,
+        "p99_ms": percentil(latencias, 0.99) * 1000,
+        "max_ms": max(latencias) * 1000,
+    }
+
+
+def _memoria_pico_mb():
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss vem em KB no Linux e em bytes no macOS
+    return pico / 2**20 if sys.platform == "darwin" else pico / 1024
+
+
+def _preparar(endereco, quantidade, historico, comentarios, semente):
+    from main import criar_gerenciador
+
+    criar_gerenciador(endereco).salvar_tickets(list(gerar_tickets(quantidade, historico, comentarios, semente)))
+
+
+def _medir(endereco, arquivo_agentes, quantidade, operacoes, semente):
+    from main import SistemaTickets, eventos
+
+    eventos.silenciar()
+    rnd = random.Random(semente + 1)
+    ids = [f"{i:08X}" for i in range(quantidade)]
+    inicio = time.perf_counter()
+    sistema = SistemaTickets(endereco, arquivo_agentes=arquivo_agentes)
+    sistema.gerenciador.obter_ticket(ids[0])
+    abrir = time.perf_counter() - inicio
+    sistema.definir_usuario("bench")
+
+    # Listagem e relatório percorrem a base inteira: rodam menos vezes
+    completas = max(3, operacoes // 20)
+    acoes = {
+        "criar_ticket": (operacoes, lambda i: sistema.criar_ticket(
+            titulo=f"Novo {i}", descricao="Criado no benchmark", prioridade="MEDIA", categoria="Bug")),
+        "obter_ticket": (operacoes, lambda i: sistema.gerenciador.obter_ticket(rnd.choice(ids))),
+        "listar_tickets": (completas, lambda i: sistema.listar_tickets(**FILTROS[i % len(FILTROS)])),
+        "gerar_relatorio": (completas, lambda i: sistema.gerar_relatorio_completo()),
+        "adicionar_comentario": (operacoes, lambda i: sistema.adicionar_comentario(
+            rnd.choice(ids), f"Comentário de benchmark {i}")),
+    }
+    removidos = rnd.sample(ids, min(operacoes, len(ids)))
+    acoes["deletar_ticket"] = (len(removidos), lambda i: sistema.deletar_ticket(removidos[i]))
+
+    resultados = {}
+    for nome in OPERACOES:
+        vezes, acao = acoes[nome]
+        latencias = []
+        for i in range(vezes):
+            t0 = time.perf_counter()
+            acao(i)
+            latencias.append(time.perf_counter() - t0)
+        resultados[nome] = _resumir(latencias)
+    return {"abrir_ms": abrir * 1000, "memoria_pico_mb": _memoria_pico_mb(), "operacoes": resultados}
+
+
+def _executar_processo(funcao, fila, args):
+    try:
+        fila.put(("ok", funcao(*args)))
+    except BaseException:
+        fila.put(("erro", traceback.format_exc()))
+
+
+def _em_processo(funcao, *args):
+    """Executa funcao(*args) num processo novo (spawn) e devolve o resultado.
+
+    Levanta RuntimeError se o processo terminar sem enviar o resultado
+    (por exemplo, encerrado pelo sistema por falta de memória).
+    """
+    contexto = multiprocessing.get_context("spawn")
+    fila = contexto.Queue()
+    processo = contexto.Process(target=_executar_processo, args=(funcao, fila, args))
+    processo.start()
+    while True:
+        try:
+            situacao, valor = fila.get(timeout=1.0)
+            break
+        except queue.Empty:
+            if processo.is_alive():
+                continue
+        # O processo terminou: o resultado ainda pode estar a caminho na fila
+        try:
+            situacao, valor = fila.get(timeout=1.0)
+            break
+        except queue.Empty:
+            processo.join()
+            raise RuntimeError(
+                f"{funcao.__name__} terminou sem resultado (código de saída {processo.exitcode}; "
+                f"-9 costuma indicar falta de memória)") from None
+    processo.join()
+    if situacao == "erro":
+        raise RuntimeError(valor)
+    return valor
+
+
+def executar_benchmark(tamanhos=(1000, 10000), backends=tuple(BACKENDS), operacoes=100,
+                       historico=5, comentarios=2, semente=42, progresso=None):
+    """Gera as bases, mede cada backend/tamanho e retorna o documento de resultados."""
+    documento = {
+        "formato": FORMATO,
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "parametros": {"operacoes": operacoes, "historico": historico,
+                       "comentarios": comentarios, "semente": semente},
+        "resultados": {},
+    }
+    for tamanho in tamanhos:
+        for backend in backends:
+            pasta = tempfile.mkdtemp(prefix="bench_desempenho")
+            try:
+                endereco = BACKENDS[backend].format(pasta=pasta)
+                inicio = time.perf_counter()
+                _em_processo(_preparar, endereco, tamanho, historico, comentarios, semente)
+                gerar = time.perf_counter() - inicio
+                medicao = _em_processo(_medir, endereco, os.path.join(pasta, "agentes.json"),
+                                       tamanho, operacoes, semente)
+            finally:
+                shutil.rmtree(pasta, ignore_errors=True)
+            medicao["gerar_s"] = gerar
+            chave = f"{backend}:{tamanho}"
+            documento["resultados"][chave] = medicao
+            if progresso:
+                progresso(chave, medicao)
+    return documento
+
+
+def comparar(atual, baseline, tolerancia=0.25):
+    """Lista as regressões de ``atual`` em relação a ``baseline``.
+
+    Conta como regressão p50 ou p99 mais lentos, vazão menor ou pico de
+    memória maior que a tolerância (fração) nos cenários presentes nos dois.
+    """
+    regressoes = []
+
+    def piorou(nome, antes, depois, maior_e_pior=True, minimo=0.0):
+        if antes is None or depois is None or abs(depois - antes) < minimo:
+            return
+        variacao = (depois - antes) / antes if antes else 0.0
+        if (variacao if maior_e_pior else -variacao) > tolerancia:
+            regressoes.append(f"{nome}: {antes:.3f} → {depois:.3f} ({variacao:+.0%})")
+
+    for chave, medicao in atual["resultados"].items():
+        referencia = baseline.get("resultados", {}).get(chave)
+        if not referencia:
+            continue
+        piorou(f"{chave} memoria_pico_mb", referencia.get("memoria_pico_mb"), medicao.get("memoria_pico_mb"))
+        for operacao, metricas in medicao["operacoes"].items():
+            anterior = referencia.get("operacoes", {}).get(operacao)
+            if not anterior:
+                continue
+            for campo in ("p50_ms", "p99_ms"):
+                piorou(f"{chave} {operacao} {campo}", anterior[campo], metricas[campo],
+                       minimo=DIFERENCA_MINIMA_MS)
+            piorou(f"{chave} {operacao} por_segundo", anterior["por_segundo"], metricas["por_segundo"],
+                   maior_e_pior=False)
+    return regressoes
+
+
+def _imprimir(chave, medicao):
+    memoria = medicao["memoria_pico_mb"]
+    memoria = f"{memoria:.0f}MB" if memoria is not None else "n/d"
+    print(f"\n{chave}: gerado em {medicao['gerar_s']:.1f}s, aberto em {medicao['abrir_ms']:.1f}ms, "
+          f"pico de memória {memoria}")
+    print(f"  {'Operação':<22} {'N':>6} {'ops/s':>10} {'p50':>10} {'p95':>10} {'p99':>10}")
+    for operacao, m in medicao["operacoes"].items():
+        print(f"  {operacao:<22} {m['n']:>6} {m['por_segundo']:>10.0f} {m['p50_ms']:>8.2f}ms "
+              f"{m['p95_ms']:>8.2f}ms {m['p99_ms']:>8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de armazenamento e serviço do TicketFlow")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 10000], help="tickets por base")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument("--operacoes", type=int, default=100, help="repetições por operação")
+    parser.add_argument("--historico", type=int, default=5, help="entradas de histórico por ticket (média)")
+    parser.add_argument("--comentarios", type=int, default=2, help="comentários por ticket (média)")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--saida", default="bench_resultados.json", help="arquivo JSON com os resultados")
+    parser.add_argument("--baseline", help="resultados anteriores para detectar regressões")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="piora aceitável (fração)")
+    args = parser.parse_args()
+
+    print(f"📊 Bases de {', '.join(map(str, args.tamanhos))} tickets em {', '.join(args.backends)}")
+    documento = executar_benchmark(args.tamanhos, args.backends, args.operacoes,
+                                   args.historico, args.comentarios, args.semente, progresso=_imprimir)
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump(documento, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ Resultados gravados em {args.saida}")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressoes = comparar(documento, baseline, args.tolerancia)
+    if regressoes:
+        print(f"❌ {len(regressoes)} regressão(ões) acima de {args.tolerancia:.0%} em relação a {args.baseline}:")
+        for regressao in regressoes:
+            print(f"  {regressao}")
+        return 1
+    print(f"✅ Sem regressões acima de {args.tolerancia:.0%} em relação a {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🌐 Teste de carga da API HTTP do TicketFlow (python main.py --serve)
+Abre várias conexões keep-alive simultâneas, mistura leituras e alterações
+e mede latência (p50/p99) e requisições por segundo.
+
+Uso:
+    python bench_http.py [--url http://127.0.0.1:8080] [--conexoes N]
+                         [--requisicoes M] [--escritas FRACAO]
+
+Sem --url, sobe um servidor local temporário em outro processo.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+
+async def _requisitar(leitor, escritor, metodo, caminho, dados=None):
+    corpo = json.dumps(dados).encode("utf-8") if dados is not None else b""
+    escritor.write(
+        f"{metodo} {caminho} HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(corpo)}\r\n\r\n".encode("latin-1") + corpo
+    )
+    await escritor.drain()
+    status = int((await leitor.readline()).split()[1])
+    tamanho = 0
+    while True:
+        linha = await leitor.readline()
+        if linha in (b"\r\n", b""):
+            break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        if nome.strip().lower() == "content-length":
+            tamanho = int(valor)
+    resposta = await leitor.readexactly(tamanho)
+    return status, json.loads(resposta) if resposta else None
+
+
+async def _conexao(host, porta, quantidade, escritas, ids, latencias, erros, semente):
+    rnd = random.Random(semente)
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        for i in range(quantidade):
+            sorteio = rnd.random()
+            if sorteio < escritas or not ids:
+                if sorteio < escritas / 2 or not ids:
+                    pedido = ("POST", "/tickets", {"titulo": f"Carga {semente}-{i}", "descricao": "Teste de carga"})
+                else:
+                    pedido = ("POST", f"/tickets/{rnd.choice(ids)}/status", {"status": "em_andamento"})
+            elif sorteio < escritas + (1 - escritas) / 2:
+                pedido = ("GET", f"/tickets/{rnd.choice(ids)}", None)
+            else:
+                pedido = ("GET", "/tickets?status=aberto", None)
+            inicio = time.perf_counter()
+            status, resposta = await _requisitar(leitor, escritor, *pedido)
+            latencias.append(time.perf_counter() - inicio)
+            if status >= 400:
+                erros.append(status)
+            elif pedido[1] == "/tickets" and pedido[0] == "POST":
+                ids.append(resposta["id"])
+    finally:
+        escritor.close()
+
+
+async def _executar_carga(host, porta, conexoes, requisicoes, escritas):
+    latencias, erros, ids = [], [], []
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    for i in range(10):
+        _, ticket = await _requisitar(leitor, escritor, "POST", "/tickets",
+                                      {"titulo": f"Semente {i}", "descricao": "Pré-carga"})
+        ids.append(ticket["id"])
+    escritor.close()
+    por_conexao = max(1, requisicoes // conexoes)
+    inicio = time.perf_counter()
+    await asyncio.gather(*[
+        _conexao(host, porta, por_conexao, escritas, ids, latencias, erros, semente)
+        for semente in range(conexoes)
+    ])
+    return latencias, erros, time.perf_counter() - inicio
+
+
+def percentil(valores, fracao):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(fracao * len(ordenados)))]
+
+
+def executar_carga(url, conexoes=16, requisicoes=2000, escritas=0.2):
+    """Executa a carga e retorna um dicionário com as métricas."""
+    partes = urlsplit(url)
+    latencias, erros, segundos = asyncio.run(
+        _executar_carga(partes.hostname, partes.port or 80, conexoes, requisicoes, escritas))
+    return {
+        "requisicoes": len(latencias),
+        "erros": len(erros),
+        "segundos": segundos,
+        "por_segundo": len(latencias) / segundos,
+        "p50_ms": percentil(latencias, 0.50) * 1000,
+        "p99_ms": percentil(latencias, 0.99) * 1000,
+    }
+
+
+def _servir(porta, arquivo_dados):
+    from main import executar_servidor
+    sys.stdout = open(os.devnull, "w")
+    executar_servidor("127.0.0.1", porta, arquivo_dados)
+
+
+def _porta_livre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _aguardar_porta(porta, limite=10.0):
+    fim = time.monotonic() + limite
+    while time.monotonic() < fim:
+        try:
+            socket.create_connection(("127.0.0.1", porta), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"servidor não respondeu na porta {porta}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga da API HTTP do TicketFlow")
+    parser.add_argument("--url", help="servidor já em execução (padrão: sobe um temporário)")
+    parser.add_argument("--conexoes", type=int, default=16)
+    parser.add_argument("--requisicoes", type=int, default=2000)
+    parser.add_argument("--escritas", type=float, default=0.2, help="fração de requisições que alteram dados")
+    parser.add_argument("--dados", default="journal://" + os.path.join(tempfile.gettempdir(), "bench_http.json"),
+                        help="endereço dos dados do servidor temporário")
+    args = parser.parse_args()
+
+    servidor = None
+    url = args.url
+    if not url:
+        porta = _porta_livre()
+        servidor = multiprocessing.Process(target=_servir, args=(porta, args.dados), daemon=True)
+        servidor.start()
+        _aguardar_porta(porta)
+        url = f"http://127.0.0.1:{porta}"
+    try:
+        print(f"🌐 {args.conexoes} conexões x {args.requisicoes} requisições em {url} ({args.escritas:.0%} escritas)")
+        r = executar_carga(url, args.conexoes, args.requisicoes, args.escritas)
+    finally:
+        if servidor:
+            servidor.terminate()
+            servidor.join()
+            caminho = args.dados.split("://", 1)[-1]
+            for sufixo in ("", ".lock", ".journal", ".ids.lock"):
+                if os.path.exists(caminho + sufixo):
+                    os.remove(caminho + sufixo)
+    print(f"Requisições: {r['requisicoes']} ({r['erros']} erros) em {r['segundos']:.2f}s")
+    print(f"Vazão:       {r['por_segundo']:.0f} req/s")
+    print(f"Latência:    p50 {r['p50_ms']:.1f} ms | p99 {r['p99_ms']:.1f} ms")
+    return 1 if r["erros"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🚀 Benchmark de inicialização do TicketFlow (estilo python -X importtime)
+Mede, em processos novos, o tempo de `import main` (a biblioteca usada por
+scripts e tarefas agendadas) e a partida a frio de `main.py --cli` até o
+primeiro menu, com e sem cache de bytecode. Também lista os módulos mais
+caros da importação e confere que nenhum módulo de interface gráfica é
+carregado fora de uma janela.
+
+Uso:
+    python bench_inicializacao.py [--repeticoes N] [--modulos K]
+
+"Sem cache" é a primeira execução depois da instalação: nada compilado,
+nem a biblioteca padrão. `python main.py` sempre recompila o script;
+`python -m main` aproveita o cache de bytecode de main.py.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+# Módulos que só devem ser carregados quando uma janela (ou o servidor) abre
+PROIBIDOS_NA_IMPORTACAO = ("tkinter", "_tkinter", "asyncio")
+
+
+def _ambiente(pasta, cache):
+    ambiente = dict(os.environ)
+    ambiente["PYTHONPATH"] = RAIZ + os.pathsep + ambiente.get("PYTHONPATH", "")
+    ambiente["PYTHONPYCACHEPREFIX"] = os.path.join(pasta, "pycache")
+    ambiente["TICKETFLOW_DADOS"] = os.path.join(pasta, "tickets.json")
+    ambiente["TICKETFLOW_AGENTES"] = os.path.join(pasta, "agentes.json")
+    if cache:
+        ambiente.pop("PYTHONDONTWRITEBYTECODE", None)
+    else:
+        ambiente["PYTHONDONTWRITEBYTECODE"] = "1"
+    return ambiente
+
+
+def _cronometrar(comando, ambiente, pasta, entrada=None):
+    inicio = time.perf_counter()
+    resultado = subprocess.run(comando, input=entrada, env=ambiente, cwd=pasta,
+                               capture_output=True, text=True)
+    segundos = time.perf_counter() - inicio
+    if resultado.returncode != 0:
+        raise RuntimeError(f"{' '.join(comando)} falhou:\n{resultado.stderr}")
+    return segundos, resultado
+
+
+def _mediana_ms(comando, ambiente, pasta, repeticoes, entrada=None):
+    if ambiente.get("PYTHONDONTWRITEBYTECODE") != "1":
+        _cronometrar(comando, ambiente, pasta, entrada)  # aquece o cache de bytecode
+    return statistics.median(
+        _cronometrar(comando, ambiente, pasta, entrada)[0] for _ in range(repeticoes)) * 1000
+
+
+def importtime(pasta, cache=True):
+    """Retorna {módulo: (próprio_us, acumulado_us)} de `python -X importtime -c "import main"`."""
+    ambiente = _ambiente(pasta, cache)
+    comando = [sys.executable, "-X", "importtime", "-c", "import main"]
+    if cache:
+        _cronometrar(comando, ambiente, pasta)
+    _, resultado = _cronometrar(comando, ambiente, pasta)
+    tempos = {}
+    for linha in resultado.stderr.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|")
+        tempos[nome.strip()] = (int(proprio), int(acumulado))
+    return tempos
+
+
+def modulos_carregados(pasta):
+    """Módulos proibidos presentes em sys.modules logo após `import main`."""
+    codigo = (f"import sys, main; print(','.join(m for m in {PROIBIDOS_NA_IMPORTACAO!r} "
+              f"if m in sys.modules))")
+    _, resultado = _cronometrar([sys.executable, "-c", codigo], _ambiente(pasta, True), pasta)
+    return [m for m in resultado.stdout.strip().split(",") if m]
+
+
+def executar_medicoes(repeticoes=10):
+    """Executa as medições e retorna {cenário: {"sem cache": ms, "com cache": ms}}."""
+    script = os.path.join(RAIZ, "main.py")
+    cenarios = {
+        "python (sem importar nada)": ([sys.executable, "-c", "pass"], None),
+        "import main": ([sys.executable, "-c", "import main"], None),
+        "python main.py --cli": ([sys.executable, script, "--cli"], "0\n"),
+        "python -m main --cli": ([sys.executable, "-m", "main", "--cli"], "0\n"),
+    }
+    resultados = {}
+    for nome, (comando, entrada) in cenarios.items():
+        resultados[nome] = {}
+        for cache in (False, True):
+            pasta = tempfile.mkdtemp(prefix="bench_inicializacao")
+            try:
+                rotulo = "com cache" if cache else "sem cache"
+                resultados[nome][rotulo] = _mediana_ms(comando, _ambiente(pasta, cache), pasta, repeticoes, entrada)
+            finally:
+                shutil.rmtree(pasta, ignore_errors=True)
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização do TicketFlow")
+    parser.add_argument("--repeticoes", type=int, default=10, help="processos por cenário (mediana)")
+    parser.add_argument("--modulos", type=int, default=10, help="módulos mais caros listados")
+    args = parser.parse_args()
+
+    print(f"🚀 Inicialização do TicketFlow (mediana de {args.repeticoes} processos)")
+    print(f"{'Cenário':<30} {'Sem cache':>12} {'Com cache':>12}")
+    print("─" * 56)
+    for nome, tempos in executar_medicoes(args.repeticoes).items():
+        print(f"{nome:<30} {tempos['sem cache']:>10.1f}ms {tempos['com cache']:>10.1f}ms")
+
+    pasta = tempfile.mkdtemp(prefix="bench_inicializacao")
+    try:
+        tempos = importtime(pasta)
+        carregados = modulos_carregados(pasta)
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+    print(f"\nMódulos mais caros em `import main` (-X importtime, com cache):")
+    for nome, (proprio, acumulado) in sorted(tempos.items(), key=lambda i: -i[1][1])[:args.modulos]:
+        print(f"  {nome:<36} {acumulado / 1000:>7.1f}ms acumulado {proprio / 1000:>7.1f}ms próprio")
+
+    if carregados:
+        print(f"\n❌ `import main` carregou {', '.join(carregados)}")
+        return 1
+    print(f"\n✅ `import main` não carrega {', '.join(PROIBIDOS_NA_IMPORTACAO)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+🧠 Benchmark de memória das representações de ticket (tracemalloc)
+Compara a representação original (dataclass com __dict__ e strings
+duplicadas) com a atual (__slots__ e valores internados) e com o histórico
+colunar, para conjuntos de tickets residentes em memória.
+
+Uso:
+    python bench_memoria.py [--tamanhos 10000 100000 1000000] [--historico 5]
+
+O tamanho de 1.000.000 de tickets precisa de vários GB de RAM na
+representação original; por isso não faz parte do padrão.
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from main import Ticket, HistoricoColunar, StatusEnum, PrioridadeEnum
+
+
+@dataclass
+class TicketLegado:
+    """Representação anterior: dataclass sem __slots__, sem internar valores."""
+    id: str
+    titulo: str
+    descricao: str
+    prioridade: str
+    status: str
+    criado_em: str
+    atualizado_em: str
+    criado_por: str = "sistema"
+    atribuido_a: Optional[str] = None
+    categoria: Optional[str] = None
+    historico: List[dict] = field(default_factory=list)
+    comentarios: List[dict] = field(default_factory=list)
+
+    @staticmethod
+    def from_dict(data: dict):
+        return TicketLegado(**data)
+
+
+def _legado(dados):
+    return TicketLegado.from_dict(dados)
+
+
+def _slots(dados):
+    return Ticket.from_dict(dados)
+
+
+def _colunar(dados):
+    ticket = Ticket.from_dict(dados)
+    ticket.historico = HistoricoColunar(ticket.historico)
+    return ticket
+
+
+REPRESENTACOES = [
+    ("original (dict + listas de dicts)", _legado),
+    ("__slots__ + valores internados", _slots),
+    ("__slots__ + histórico colunar", _colunar),
+]
+
+
+def gerar_json(quantidade: int, historico_medio: int, semente: int = 42) -> str:
+    """Gera o texto JSON de um tickets.json sintético."""
+    rnd = random.Random(semente)
+    usuarios = [f"agente{i}" for i in range(50)]
+    categorias = ["Bug", "Feature", "Infraestrutura", "Dúvida", "Acesso"]
+    tickets = []
+    for i in range(quantidade):
+        historico = [{
+            "data": f"2025-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}T10:00:{j:02d}.000000",
+            "usuario": rnd.choice(usuarios),
+            "campo": rnd.choice(["status", "prioridade", "atribuido_a", "comentario"]),
+            "valor_anterior": None,
+            "valor_novo": rnd.choice([s.value for s in StatusEnum]),
+            "descricao": f"Alteração {j} do ticket {i}"
+        } for j in range(rnd.randint(0, 2 * historico_medio))]
+        tickets.append({
+            "id": f"{i:08X}",
+            "titulo": f"Ticket sintético {i}",
+            "descricao": f"Descrição do ticket {i}",
+            "prioridade": rnd.choice([p.name for p in PrioridadeEnum]),
+            "status": rnd.choice([s.value for s in StatusEnum]),
+            "criado_em": "2025-01-01T00:00:00.000000",
+            "atualizado_em": "2025-01-02T00:00:00.000000",
+            "criado_por": rnd.choice(usuarios),
+            "atribuido_a": rnd.choice(usuarios),
+            "categoria": rnd.choice(categorias),
+            "historico": historico,
+            "comentarios": []
+        })
+    return json.dumps({"tickets": tickets}, ensure_ascii=False)
+
+
+def medir(texto: str, construtor) -> int:
+    """Bytes mantidos pelos tickets depois de carregados a partir do JSON."""
+    gc.collect()
+    tracemalloc.start()
+    dados = json.loads(texto)
+    tickets = {t["id"]: construtor(t) for t in dados["tickets"]}
+    del dados
+    gc.collect()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tickets
+    return atual
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memória das representações de ticket")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--historico", type=int, default=5, help="entradas de histórico por ticket (média)")
+    args = parser.parse_args()
+
+    print(f"{'Tickets':>10} {'Representação':<36} {'Memória':>12} {'Por ticket':>12} {'vs original':>12}")
+    print("─" * 86)
+    for quantidade in args.tamanhos:
+        texto = gerar_json(quantidade, args.historico)
+        base = None
+        for nome, construtor in REPRESENTACOES:
+            memoria = medir(texto, construtor)
+            base = base or memoria
+            print(f"{quantidade:>10} {nome:<36} {memoria / 2**20:>10.1f}MB {memoria / quantidade:>10.0f} B "
+                  f"{memoria / base:>11.0%}")
+        del texto
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
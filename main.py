@@ -1,14 +1,36 @@
 import sys
-import uuid
 import os
+import atexit
 import json
 import hashlib
-from datetime import datetime
+import time
+import threading
+import tempfile
+import re
+import bisect
+import heapq
+import itertools
+import queue
+import select
+import struct
+import unicodedata
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Optional, Dict
-from dataclasses import dataclass, asdict, field
+from typing import List, Optional, Dict, Set, Tuple, Iterable, Iterator
+from dataclasses import dataclass, asdict, field, replace
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 # Models (merged from models.py)
+# Modelos com __slots__ quando disponível (Python 3.10+): sem __dict__ por instância
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class PrioridadeEnum(Enum):
     BAIXA = 1
     MEDIA = 2
@@ -31,7 +53,17 @@ class StatusEnum(Enum):
         return self.value.replace('_', ' ').title()
 
 
-@dataclass
+# Valores canônicos: todo ticket carregado aponta para a mesma string do enum
+_STATUS_CANONICOS = {s.value: s.value for s in StatusEnum}
+_PRIORIDADES_CANONICAS = {p.name: p.name for p in PrioridadeEnum}
+
+
+def _internar(valor):
+    """Compartilha strings repetidas (usuários, categorias, campos)."""
+    return sys.intern(valor) if isinstance(valor, str) else valor
+
+
+@dataclass(**_SLOTS)
 class HistoricoAlteracao:
     data: str
     usuario: str
@@ -44,7 +76,7 @@ class HistoricoAlteracao:
         return asdict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Comentario:
     id: str
     data: str
@@ -56,7 +88,7 @@ class Comentario:
         return asdict(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class User:
     username: str
     password_hash: str
@@ -67,9 +99,459 @@ class User:
         return asdict(self)
 
 
+# Instrumentação (TICKETFLOW_PERFIL=1 ou --profile)
+class _Medicao:
+    __slots__ = ("perfil", "nome", "inicio")
+
+    def __init__(self, perfil: "Instrumentacao", nome: str):
+        self.perfil = perfil
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excecao):
+        self.perfil.registrar(self.nome, time.perf_counter() - self.inicio)
+        return False
+
+
+class _SemMedicao:
+    """Contexto vazio devolvido por medir() com a instrumentação desligada."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        return False
+
+
+_SEM_MEDICAO = _SemMedicao()
+
+
+class Instrumentacao:
+    """Tempos por fase e contadores (bytes lidos/gravados) dos caminhos quentes.
+
+    Ligada por TICKETFLOW_PERFIL=1 ou --profile; com o valor ``cprofile``
+    também captura um cProfile da thread principal, gravado em
+    ARQUIVO_CPROFILE ao sair. Desligada, medir() devolve um contexto vazio
+    compartilhado e contar() retorna de imediato: as fases são medidas uma
+    vez por carga/gravação/consulta, nunca por ticket.
+    """
+
+    ARQUIVO_CPROFILE = "ticketflow.prof"
+
+    def __init__(self):
+        self.ativo = False
+        self._lock = threading.Lock()
+        # nome → [chamadas, segundos, maior]
+        self._tempos: Dict[str, List[float]] = {}
+        self._contadores: Dict[str, int] = {}
+        self._cprofile = None
+
+    def configurar(self, valor: Optional[str]):
+        """Aplica o valor de TICKETFLOW_PERFIL / --profile=VALOR."""
+        valor = (valor or "").strip().lower()
+        if valor in ("", "0", "false", "nao", "não"):
+            return
+        self.ativar(cprofile=valor == "cprofile")
+
+    def ativar(self, cprofile: bool = False):
+        if not self.ativo:
+            atexit.register(self._ao_sair)
+        self.ativo = True
+        if cprofile and self._cprofile is None:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def desativar(self):
+        self.ativo = False
+        atexit.unregister(self._ao_sair)
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile = None
+
+    def zerar(self):
+        with self._lock:
+            self._tempos.clear()
+            self._contadores.clear()
+
+    def medir(self, nome: str):
+        """``with perfil.medir("fase"):`` acumula o tempo da fase."""
+        if not self.ativo:
+            return _SEM_MEDICAO
+        return _Medicao(self, nome)
+
+    def registrar(self, nome: str, segundos: float):
+        with self._lock:
+            tempo = self._tempos.get(nome)
+            if tempo is None:
+                self._tempos[nome] = [1, segundos, segundos]
+            else:
+                tempo[0] += 1
+                tempo[1] += segundos
+                tempo[2] = max(tempo[2], segundos)
+
+    def contar(self, nome: str, quantidade: int = 1):
+        if not self.ativo:
+            return
+        with self._lock:
+            self._contadores[nome] = self._contadores.get(nome, 0) + quantidade
+
+    def estatisticas(self) -> Dict:
+        with self._lock:
+            return {
+                "tempos": {
+                    nome: {"chamadas": n, "total_ms": total * 1000, "media_ms": total / n * 1000,
+                           "max_ms": maior * 1000}
+                    for nome, (n, total, maior) in self._tempos.items()
+                },
+                "contadores": dict(self._contadores),
+            }
+
+    def relatorio(self, funcoes: int = 15) -> str:
+        """Tabela das fases (maior tempo total primeiro), contadores e, com
+        cProfile, as funções de maior tempo acumulado."""
+        estatisticas = self.estatisticas()
+        linhas = [f"{'Fase':<28} {'Chamadas':>9} {'Total':>11} {'Média':>10} {'Máximo':>10}"]
+        for nome, t in sorted(estatisticas["tempos"].items(), key=lambda i: -i[1]["total_ms"]):
+            linhas.append(f"{nome:<28} {t['chamadas']:>9} {t['total_ms']:>9.1f}ms "
+                          f"{t['media_ms']:>8.2f}ms {t['max_ms']:>8.2f}ms")
+        if len(linhas) == 1:
+            linhas.append("(nenhuma fase medida)")
+        for nome, valor in sorted(estatisticas["contadores"].items()):
+            linhas.append(f"{nome}: {valor:,}".replace(",", "."))
+        if self._cprofile is not None and funcoes:
+            import io
+            import pstats
+            saida = io.StringIO()
+            # Montar as estatísticas desliga o profiler: ele é religado em seguida
+            pstats.Stats(self._cprofile, stream=saida).sort_stats("cumulative").print_stats(funcoes)
+            self._cprofile.enable()
+            linhas.append(saida.getvalue().rstrip())
+        return "\n".join(linhas)
+
+    def _ao_sair(self):
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.ARQUIVO_CPROFILE)
+        print("\n⏱️ Instrumentação do TicketFlow\n" + self.relatorio(funcoes=0), file=sys.stderr)
+        if self._cprofile is not None:
+            print(f"✓ cProfile gravado em {self.ARQUIVO_CPROFILE} (python -m pstats {self.ARQUIVO_CPROFILE})",
+                  file=sys.stderr)
+
+
+perfil = Instrumentacao()
+perfil.configurar(os.environ.get("TICKETFLOW_PERFIL"))
+
+
+# Log de eventos (TICKETFLOW_LOG=eventos.jsonl)
+class ApresentadorTerminal:
+    """Mostra na saída (ou em ``arquivo``) a mensagem amigável dos eventos a
+    partir de ``nivel``."""
+
+    def __init__(self, nivel: str = "info", arquivo=None):
+        self.minimo = RegistroEventos.NIVEIS[nivel]
+        self.arquivo = arquivo
+
+    def __call__(self, evento: Dict):
+        if RegistroEventos.NIVEIS[evento["nivel"]] >= self.minimo:
+            print(evento["mensagem"], file=self.arquivo or sys.stdout)
+
+
+class RegistroEventos:
+    """Eventos estruturados das operações: nível, op, ticket, duração e a
+    mensagem amigável.
+
+    emitir() só monta um dicionário. A gravação em JSON lines (TICKETFLOW_LOG
+    ou registrar_em) fica numa thread própria, que esvazia a fila em lotes
+    com uma escrita por lote. As mensagens chegam às interfaces pelos
+    apresentadores (por padrão, ApresentadorTerminal); chamadas em lote usam
+    silenciar() ou ``with eventos.silencioso():`` e não escrevem nada na saída.
+    """
+
+    NIVEIS = {"debug": 10, "info": 20, "aviso": 30, "erro": 40}
+    LOTE_MAXIMO = 1000
+
+    def __init__(self):
+        self._apresentadores = []
+        self._fila: Optional["queue.SimpleQueue"] = None
+        self._thread: Optional[threading.Thread] = None
+        self.arquivo: Optional[str] = None
+
+    def apresentar(self, apresentador):
+        """Registra ``apresentador(evento)``, chamado na thread que emitiu."""
+        self._apresentadores = self._apresentadores + [apresentador]
+
+    def remover_apresentador(self, apresentador):
+        self._apresentadores = [a for a in self._apresentadores if a != apresentador]
+
+    def silenciar(self):
+        self._apresentadores = []
+
+    @contextmanager
+    def silencioso(self):
+        anteriores = self._apresentadores
+        self._apresentadores = []
+        try:
+            yield
+        finally:
+            self._apresentadores = anteriores
+
+    def emitir(self, op: str, mensagem: str, nivel: str = "info", ticket_id: Optional[str] = None,
+               inicio: Optional[float] = None, **campos):
+        """Registra um evento; ``inicio`` (time.perf_counter) vira duracao_ms."""
+        apresentadores, fila = self._apresentadores, self._fila
+        if not apresentadores and fila is None:
+            return
+        evento = {
+            "ts": time.time(),
+            "nivel": nivel,
+            "op": op,
+            "ticket_id": ticket_id,
+            "duracao_ms": None if inicio is None else (time.perf_counter() - inicio) * 1000,
+            "mensagem": mensagem,
+        }
+        if campos:
+            evento.update(campos)
+        if fila is not None:
+            fila.put(evento)
+        for apresentador in apresentadores:
+            try:
+                apresentador(evento)
+            except Exception:
+                pass
+
+    def registrar_em(self, caminho: str):
+        """Passa a acrescentar os eventos em ``caminho`` (JSON lines)."""
+        self.fechar()
+        self.arquivo = caminho
+        self._fila = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._gravar, args=(self._fila, caminho),
+                                        name="ticketflow-eventos", daemon=True)
+        self._thread.start()
+        atexit.unregister(self.fechar)
+        atexit.register(self.fechar)
+
+    def descarregar(self, tempo_maximo: float = 5.0) -> bool:
+        """Espera a gravação dos eventos já emitidos."""
+        fila = self._fila
+        if fila is None:
+            return True
+        gravado = threading.Event()
+        fila.put(gravado)
+        return gravado.wait(tempo_maximo)
+
+    def fechar(self):
+        fila, thread = self._fila, self._thread
+        if fila is None:
+            return
+        self._fila = None
+        self._thread = None
+        self.arquivo = None
+        fila.put(None)
+        thread.join(5.0)
+
+    def _gravar(self, fila: "queue.SimpleQueue", caminho: str):
+        with open(caminho, "a", encoding="utf-8") as arquivo:
+            while True:
+                itens = [fila.get()]
+                while len(itens) < self.LOTE_MAXIMO:
+                    try:
+                        itens.append(fila.get_nowait())
+                    except queue.Empty:
+                        break
+                linhas = [self._linha(item) for item in itens if isinstance(item, dict)]
+                if linhas:
+                    try:
+                        arquivo.write("".join(linhas))
+                        arquivo.flush()
+                    except OSError:
+                        pass
+                for item in itens:
+                    if isinstance(item, threading.Event):
+                        item.set()
+                if any(item is None for item in itens):
+                    return
+
+    @staticmethod
+    def _linha(evento: Dict) -> str:
+        evento = dict(evento, ts=datetime.fromtimestamp(evento["ts"]).isoformat(timespec="milliseconds"))
+        if evento["duracao_ms"] is not None:
+            evento["duracao_ms"] = round(evento["duracao_ms"], 3)
+        return json.dumps(evento, ensure_ascii=False, default=str) + "\n"
+
+
+eventos = RegistroEventos()
+eventos.apresentar(ApresentadorTerminal())
+if os.environ.get("TICKETFLOW_LOG"):
+    eventos.registrar_em(os.environ["TICKETFLOW_LOG"])
+
+
+# File helpers: escrita atômica e bloqueio entre processos
+def gravar_json_atomico(caminho: str, dados: Dict, indent: Optional[int] = 2):
+    """Grava JSON num arquivo temporário, faz fsync e o renomeia por cima do
+    destino. Uma falha no meio da escrita nunca deixa o arquivo truncado."""
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+    fd, temporario = tempfile.mkstemp(dir=diretorio, prefix=os.path.basename(caminho) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=indent)
+            f.flush()
+            if perfil.ativo:
+                perfil.contar("bytes_gravados", os.fstat(f.fileno()).st_size)
+            os.fsync(f.fileno())
+        if os.path.exists(caminho):
+            os.chmod(temporario, os.stat(caminho).st_mode & 0o777)
+        else:
+            os.chmod(temporario, 0o644)
+        os.replace(temporario, caminho)
+    except BaseException:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+    if os.name != "nt":
+        fd_dir = os.open(diretorio, os.O_RDONLY)
+        try:
+            os.fsync(fd_dir)
+        finally:
+            os.close(fd_dir)
+
+
+class BloqueioArquivo:
+    """Bloqueio exclusivo e reentrante entre processos e threads.
+
+    Usa um arquivo ``<caminho>.lock`` ao lado dos dados (o arquivo de dados é
+    substituído por rename, então não pode ser ele o travado). O arquivo de
+    bloqueio também guarda um contador de geração, incrementado a cada
+    gravação, que os leitores usam para detectar alterações de outros
+    processos mesmo quando mtime/tamanho coincidem.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho + ".lock"
+        self._lock = threading.RLock()
+        self._profundidade = 0
+        self._arquivo = None
+
+    def __enter__(self):
+        self._lock.acquire()
+        if self._profundidade == 0:
+            try:
+                self._arquivo = os.fdopen(os.open(self.caminho, os.O_RDWR | os.O_CREAT, 0o644), 'r+b')
+                self._travar()
+            except BaseException:
+                if self._arquivo:
+                    self._arquivo.close()
+                    self._arquivo = None
+                self._lock.release()
+                raise
+        self._profundidade += 1
+        return self
+
+    def __exit__(self, *exc):
+        self._profundidade -= 1
+        if self._profundidade == 0:
+            self._destravar()
+            self._arquivo.close()
+            self._arquivo = None
+        self._lock.release()
+
+    def _travar(self):
+        if fcntl:
+            fcntl.flock(self._arquivo.fileno(), fcntl.LOCK_EX)
+            return
+        self._arquivo.seek(0)
+        while True:
+            try:
+                msvcrt.locking(self._arquivo.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _destravar(self):
+        if fcntl:
+            fcntl.flock(self._arquivo.fileno(), fcntl.LOCK_UN)
+        else:
+            self._arquivo.seek(0)
+            msvcrt.locking(self._arquivo.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def geracao(self) -> int:
+        try:
+            with open(self.caminho, 'rb') as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def incrementar_geracao(self, fsync: bool = False):
+        """Deve ser chamado com o bloqueio adquirido. O valor tem largura
+        fixa e é sobrescrito no lugar (truncar força flush no ext4)."""
+        geracao = self.geracao() + 1
+        self._arquivo.seek(0)
+        self._arquivo.write(f"{geracao:020d}".encode('ascii'))
+        self._arquivo.flush()
+        if fsync:
+            os.fsync(self._arquivo.fileno())
+
+
+class AlocadorIds:
+    """Ids únicos e ordenados pelo tempo, sem consultar os tickets salvos.
+
+    Formato (base32 de Crockford, 15 caracteres de largura fixa):
+        9 caracteres: milissegundos desde a época Unix
+        4 caracteres: bloco reservado por este processo
+        2 caracteres: sequência dentro do bloco
+
+    O bloco vem de um contador persistido (a geração do BloqueioArquivo de
+    ``caminho``), incrementado uma vez a cada TAMANHO_BLOCO ids, então criar
+    muitos tickets custa uma gravação a cada 1024. Processos nunca recebem o
+    mesmo bloco e a sequência não se repete dentro dele; como o instante vem
+    primeiro, a ordem alfabética dos ids é a ordem de criação. (O número do
+    bloco volta a zero após 32⁴ reservas; daí em diante a unicidade também
+    depende do instante, que não se repete para o mesmo bloco e sequência.)
+    """
+
+    ALFABETO = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+    TAMANHO_BLOCO = 32 ** 2
+
+    def __init__(self, caminho: str):
+        self._bloqueio = BloqueioArquivo(caminho)
+        self._lock = threading.Lock()
+        self._bloco = 0
+        self._sequencia = self.TAMANHO_BLOCO
+        self._ultimo_instante = 0
+
+    @classmethod
+    def _codificar(cls, valor: int, largura: int) -> str:
+        digitos = []
+        for _ in range(largura):
+            valor, resto = divmod(valor, 32)
+            digitos.append(cls.ALFABETO[resto])
+        return "".join(reversed(digitos))
+
+    def novo(self) -> str:
+        with self._lock:
+            if self._sequencia >= self.TAMANHO_BLOCO:
+                self._bloco = self._reservar_bloco()
+                self._sequencia = 0
+            # Nunca recua, mesmo que o relógio do sistema volte
+            instante = self._ultimo_instante = max(int(time.time() * 1000), self._ultimo_instante)
+            bloco, sequencia = self._bloco, self._sequencia
+            self._sequencia += 1
+        return self._codificar(instante, 9) + self._codificar(bloco, 4) + self._codificar(sequencia, 2)
+
+    def _reservar_bloco(self) -> int:
+        with self._bloqueio:
+            self._bloqueio.incrementar_geracao(fsync=True)
+            return self._bloqueio.geracao() % 32 ** 4
+
+
 class UserManager:
     def __init__(self, arquivo_usuarios: str = "users.json"):
         self.arquivo_usuarios = arquivo_usuarios
+        self._bloqueio = BloqueioArquivo(arquivo_usuarios)
         self._inicializar_arquivo()
         self.users: Dict[str, User] = self._carregar_usuarios_dict()
         # garantir usuário admin padrão
@@ -77,9 +559,9 @@ class UserManager:
             self.create_user("admin", "adim", role="admin")
 
     def _inicializar_arquivo(self):
-        if not os.path.exists(self.arquivo_usuarios):
-            with open(self.arquivo_usuarios, 'w', encoding='utf-8') as f:
-                json.dump({"users": []}, f, ensure_ascii=False, indent=2)
+        with self._bloqueio:
+            if not os.path.exists(self.arquivo_usuarios):
+                gravar_json_atomico(self.arquivo_usuarios, {"users": []})
 
     def _carregar_usuarios_dict(self) -> Dict[str, User]:
         try:
@@ -95,20 +577,24 @@ class UserManager:
 
     def _salvar_usuarios(self):
         data = {"users": [u.to_dict() for u in self.users.values()]}
-        with open(self.arquivo_usuarios, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        gravar_json_atomico(self.arquivo_usuarios, data)
 
     def _hash_password(self, password: str) -> str:
         return hashlib.sha256(password.encode('utf-8')).hexdigest()
 
     def create_user(self, username: str, password: str, role: str = "user") -> bool:
         username = username.strip()
-        if not username or username in self.users:
+        if not username:
             return False
-        ph = self._hash_password(password)
-        user = User(username=username, password_hash=ph, role=role)
-        self.users[username] = user
-        self._salvar_usuarios()
+        with self._bloqueio:
+            # reler sob bloqueio para não perder contas criadas por outro processo
+            self.users = self._carregar_usuarios_dict()
+            if username in self.users:
+                return False
+            ph = self._hash_password(password)
+            user = User(username=username, password_hash=ph, role=role)
+            self.users[username] = user
+            self._salvar_usuarios()
         return True
 
     def authenticate(self, username: str, password: str) -> Optional[User]:
@@ -123,7 +609,52 @@ class UserManager:
         return list(self.users.values())
 
 
-@dataclass
+class HistoricoColunar:
+    """Histórico guardado em colunas (uma lista por campo) em vez de uma lista
+    de dicts. Comporta-se como uma sequência de dicts para quem lê, mas cada
+    entrada custa alguns ponteiros em vez de um dict inteiro. Valores de
+    usuário e campo são internados.
+    """
+
+    __slots__ = ("_colunas",)
+    CAMPOS = ("data", "usuario", "campo", "valor_anterior", "valor_novo", "descricao")
+    INTERNADOS = ("usuario", "campo")
+
+    def __init__(self, entradas: Iterable[dict] = ()):
+        self._colunas = tuple([] for _ in self.CAMPOS)
+        for entrada in entradas:
+            self.append(entrada)
+
+    def append(self, entrada: dict):
+        for coluna, campo in zip(self._colunas, self.CAMPOS):
+            valor = entrada.get(campo)
+            coluna.append(_internar(valor) if campo in self.INTERNADOS else valor)
+
+    def copy(self) -> "HistoricoColunar":
+        copia = HistoricoColunar()
+        copia._colunas = tuple(list(coluna) for coluna in self._colunas)
+        return copia
+
+    def __len__(self):
+        return len(self._colunas[0])
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        return {campo: coluna[indice] for campo, coluna in zip(self.CAMPOS, self._colunas)}
+
+    def __iter__(self):
+        for valores in zip(*self._colunas):
+            yield dict(zip(self.CAMPOS, valores))
+
+    def __eq__(self, outro):
+        return list(self) == list(outro)
+
+    def __repr__(self):
+        return f"HistoricoColunar({list(self)!r})"
+
+
+@dataclass(**_SLOTS)
 class Ticket:
     id: str
     titulo: str
@@ -137,117 +668,611 @@ class Ticket:
     categoria: Optional[str] = None
     historico: List[dict] = field(default_factory=list)
     comentarios: List[dict] = field(default_factory=list)
+    # Instante em que o SLA vencido em CRITICA foi registrado (igual a
+    # atualizado_em enquanto ninguém mais alterou o ticket; ver AgendaSLA.prazo)
+    sla_vencido_em: Optional[str] = None
+
+    CAMPOS_SIMPLES = ("id", "titulo", "descricao", "prioridade", "status", "criado_em",
+                      "atualizado_em", "criado_por", "atribuido_a", "categoria", "sla_vencido_em")
+    # Chaves que toda entrada de histórico/comentário precisa ter (ver validar)
+    CHAVES_OBRIGATORIAS = {
+        "historico": ("data", "usuario", "campo", "descricao"),
+        "comentarios": ("id", "data", "usuario", "conteudo"),
+    }
 
     def to_dict(self):
-        return asdict(self)
+        dados = {c: getattr(self, c) for c in self.CAMPOS_SIMPLES}
+        dados["historico"] = [dict(h) for h in self.historico]
+        dados["comentarios"] = [dict(c) for c in self.comentarios]
+        return dados
 
     def to_json(self):
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
 
+    def copia(self) -> "Ticket":
+        """Cópia independente do ticket (as entradas de histórico/comentários
+        nunca são alteradas no lugar, então basta copiar as listas)."""
+        return replace(self, historico=self.historico.copy(), comentarios=list(self.comentarios))
+
     @staticmethod
     def from_dict(data: dict):
         return Ticket(
             id=data.get('id'),
             titulo=data.get('titulo'),
             descricao=data.get('descricao'),
-            prioridade=data.get('prioridade'),
-            status=data.get('status', StatusEnum.ABERTO.value),
+            prioridade=_PRIORIDADES_CANONICAS.get(data.get('prioridade'), data.get('prioridade')),
+            status=_STATUS_CANONICOS.get(data.get('status'), data.get('status', StatusEnum.ABERTO.value)),
             criado_em=data.get('criado_em', datetime.now().isoformat()),
             atualizado_em=data.get('atualizado_em', datetime.now().isoformat()),
-            criado_por=data.get('criado_por', 'sistema'),
-            atribuido_a=data.get('atribuido_a'),
-            categoria=data.get('categoria'),
+            criado_por=_internar(data.get('criado_por', 'sistema')),
+            atribuido_a=_internar(data.get('atribuido_a')),
+            categoria=_internar(data.get('categoria')),
             historico=data.get('historico', []),
-            comentarios=data.get('comentarios', [])
+            comentarios=data.get('comentarios', []),
+            sla_vencido_em=data.get('sla_vencido_em')
         )
 
+    @staticmethod
+    def validar(data) -> "Ticket":
+        """Monta um ticket a partir de um registro externo (importação),
+        conferindo o esquema. Levanta ValueError com o primeiro problema.
+
+        O id pode faltar (quem importa aloca um); campos desconhecidos são
+        ignorados. Datas com fuso horário são convertidas para a hora local
+        sem fuso, como as gravadas pelo sistema (o SLA compara as duas).
+        """
+        if not isinstance(data, dict):
+            raise ValueError("registro não é um objeto")
+        data = dict(data)
+        for campo in ("titulo", "descricao"):
+            if not isinstance(data.get(campo), str) or not data[campo].strip():
+                raise ValueError(f"campo obrigatório ausente: {campo}")
+        for campo in ("id", "prioridade", "status", "criado_em", "atualizado_em",
+                      "criado_por", "atribuido_a", "categoria", "sla_vencido_em"):
+            if data.get(campo) is not None and not isinstance(data[campo], str):
+                raise ValueError(f"{campo} deve ser texto")
+        if data.get("prioridade") not in _PRIORIDADES_CANONICAS:
+            raise ValueError(f"prioridade inválida: {data.get('prioridade')!r}")
+        if data.get("status", StatusEnum.ABERTO.value) not in _STATUS_CANONICOS:
+            raise ValueError(f"status inválido: {data['status']!r}")
+        for campo in ("criado_em", "atualizado_em", "sla_vencido_em"):
+            if data.get(campo) is not None:
+                try:
+                    instante = datetime.fromisoformat(data[campo])
+                except ValueError:
+                    raise ValueError(f"{campo} não é uma data ISO: {data[campo]!r}") from None
+                if instante.tzinfo is not None:
+                    data[campo] = instante.astimezone().replace(tzinfo=None).isoformat()
+        for campo, chaves in Ticket.CHAVES_OBRIGATORIAS.items():
+            valor = data.get(campo, [])
+            if not isinstance(valor, list) or not all(isinstance(item, dict) for item in valor):
+                raise ValueError(f"{campo} deve ser uma lista de objetos")
+            for posicao, item in enumerate(valor):
+                faltando = [c for c in chaves if c not in item]
+                if faltando:
+                    raise ValueError(f"{campo}[{posicao}] sem {', '.join(faltando)}")
+        return Ticket.from_dict(data)
+
+
+@dataclass(**_SLOTS)
+class ResumoTicket:
+    """Projeção de um ticket sem histórico e comentários, usada nas listagens.
+
+    O custo de montar uma lista de resumos depende só do número de tickets,
+    não do volume de histórico acumulado neles.
+    """
+    id: str
+    titulo: str
+    prioridade: str
+    status: str
+    criado_em: str
+    atualizado_em: str
+    criado_por: str
+    atribuido_a: Optional[str] = None
+    categoria: Optional[str] = None
+    sla_vencido_em: Optional[str] = None
+
+    CAMPOS = ("id", "titulo", "prioridade", "status", "criado_em", "atualizado_em",
+              "criado_por", "atribuido_a", "categoria", "sla_vencido_em")
+
+    @staticmethod
+    def de_ticket(ticket: Ticket) -> "ResumoTicket":
+        return ResumoTicket(**{c: getattr(ticket, c) for c in ResumoTicket.CAMPOS})
+
+
+class Pagina(list):
+    """Uma página de uma listagem ordenada por tempo.
+
+    É uma lista comum de tickets (ou resumos) com ``cursor``: passado de
+    volta à mesma consulta, continua logo após o último item; None indica
+    que não há mais páginas. O cursor é a chave (instante, id) do último
+    item, então continua válido mesmo com tickets criados no meio tempo.
+    """
+
+    SEPARADOR = "|"
+
+    def __init__(self, itens: Iterable = (), cursor: Optional[str] = None):
+        super().__init__(itens)
+        self.cursor = cursor
+
+    @classmethod
+    def codificar(cls, chave: Tuple[str, str]) -> str:
+        return f"{chave[0]}{cls.SEPARADOR}{chave[1]}"
+
+    @classmethod
+    def decodificar(cls, cursor: str) -> Tuple[str, str]:
+        valor, separador, ticket_id = cursor.rpartition(cls.SEPARADOR)
+        if not separador:
+            raise ValueError(f"Cursor inválido: {cursor}")
+        return valor, ticket_id
+
+
+def fatiar_chaves(
+    chaves: List[Tuple[str, str]],
+    decrescente: bool,
+    desde: Optional[str],
+    ate: Optional[str],
+    limite: Optional[int],
+    cursor: Optional[str]
+) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    """Seleciona, numa lista ordenada de (instante, id), o intervalo
+    [desde, ate) a partir do cursor; retorna as chaves e o próximo cursor."""
+    inicio = bisect.bisect_left(chaves, (desde,)) if desde else 0
+    fim = bisect.bisect_left(chaves, (ate,)) if ate else len(chaves)
+    if cursor:
+        chave = Pagina.decodificar(cursor)
+        if decrescente:
+            fim = min(fim, bisect.bisect_left(chaves, chave))
+        else:
+            inicio = max(inicio, bisect.bisect_right(chaves, chave))
+    if decrescente:
+        corte = max(inicio, fim - limite) if limite else inicio
+        selecionadas, restam = chaves[corte:fim][::-1], corte > inicio
+    else:
+        corte = min(fim, inicio + limite) if limite else fim
+        selecionadas, restam = chaves[inicio:corte], corte < fim
+    proximo = Pagina.codificar(selecionadas[-1]) if restam and selecionadas else None
+    return selecionadas, proximo
+
 
 # Data manager (merged from gerenciador_dados.py)
 class GerenciadorDados:
-    def __init__(self, arquivo_dados: str = "tickets.json"):
+    """Persistência JSON com os tickets residentes em memória.
+
+    O arquivo é lido uma única vez e mantido em um dicionário id → Ticket.
+    Alterações feitas por outros processos são detectadas pela assinatura
+    do arquivo (mtime/tamanho/inode/geração) e só então o arquivo é relido.
+    Toda gravação acontece sob BloqueioArquivo, depois de sincronizar com o
+    disco, e é atômica (temporário + fsync + rename).
+
+    Índices secundários (campo → valor → ids) são mantidos a cada alteração,
+    de modo que filtros custam proporcionalmente ao tamanho do resultado.
+    Listas ordenadas por criado_em/atualizado_em atendem intervalos de tempo
+    e páginas (paginar) com bisect, sem ordenar os tickets a cada consulta.
+    """
+
+    CAMPOS_INDEXADOS = ("status", "prioridade", "atribuido_a", "categoria")
+    CAMPOS_TEMPO = ("criado_em", "atualizado_em")
+
+    def __init__(self, arquivo_dados: str = "tickets.json", historico_colunar: bool = False):
         self.arquivo_dados = arquivo_dados
+        self.historico_colunar = historico_colunar
+        self._tickets: Dict[str, Ticket] = {}
+        self._ordem: Dict[str, int] = {}
+        self._proxima_ordem = 0
+        self._indices: Dict[str, Dict[str, Set[str]]] = {c: {} for c in self.CAMPOS_INDEXADOS}
+        # Índices de tempo: listas ordenadas de (instante ISO, id)
+        self._indices_tempo: Dict[str, List[Tuple[str, str]]] = {c: [] for c in self.CAMPOS_TEMPO}
+        self._assinatura = None
+        # Antes da primeira carga não há estado anterior a comparar: nada é notificado
+        self._carregado = False
+        self._ouvintes = []
+        self._bloqueio = BloqueioArquivo(arquivo_dados)
         self._inicializar_arquivo()
 
     def _inicializar_arquivo(self):
-        if not os.path.exists(self.arquivo_dados):
-            with open(self.arquivo_dados, 'w', encoding='utf-8') as f:
-                json.dump({"tickets": []}, f, ensure_ascii=False, indent=2)
+        with self._bloqueio:
+            if not os.path.exists(self.arquivo_dados):
+                gravar_json_atomico(self.arquivo_dados, {"tickets": []})
 
     def salvar_ticket(self, ticket: Ticket) -> bool:
         try:
-            dados = self._carregar_dados()
-            indice = None
-            for i, t in enumerate(dados["tickets"]):
-                if t["id"] == ticket.id:
-                    indice = i
-                    break
-            if indice is not None:
-                dados["tickets"][indice] = ticket.to_dict()
-            else:
-                dados["tickets"].append(ticket.to_dict())
-            self._salvar_dados(dados)
+            self._salvar_varios([ticket])
             return True
         except Exception as e:
-            print(f"Erro ao salvar ticket: {e}")
+            eventos.emitir("salvar_ticket", f"Erro ao salvar ticket: {e}", "erro", ticket_id=ticket.id)
             return False
 
+    def salvar_tickets(self, tickets: List[Ticket]) -> bool:
+        """Salva vários tickets com uma única gravação."""
+        try:
+            self._salvar_varios(tickets)
+            return True
+        except Exception as e:
+            eventos.emitir("salvar_tickets", f"Erro ao salvar tickets: {e}", "erro")
+            return False
+
+    def atualizar_se(self, ticket_id: str, alterar) -> Optional[Ticket]:
+        """Lê, altera e grava um ticket sem que outro processo grave no meio.
+
+        ``alterar(ticket)`` recebe uma cópia atualizada do disco e a modifica;
+        se retornar False nada é gravado. Retorna o ticket gravado ou None.
+        """
+        alterados = self.atualizar_varios_se([ticket_id], alterar)
+        return alterados[0] if alterados else None
+
+    def atualizar_varios_se(self, ticket_ids: Iterable[str], alterar) -> List[Ticket]:
+        """atualizar_se para vários tickets, com uma única gravação.
+        Retorna os tickets alterados e gravados."""
+        try:
+            with self._bloqueio:
+                self._sincronizar()
+                alterados = []
+                for ticket_id in ticket_ids:
+                    ticket = self._tickets.get(ticket_id)
+                    if ticket is not None:
+                        ticket = ticket.copia()
+                        if alterar(ticket):
+                            alterados.append(ticket)
+                if alterados:
+                    self._salvar_varios(alterados)
+            return alterados
+        except Exception as e:
+            eventos.emitir("atualizar_varios_se", f"Erro ao salvar tickets: {e}", "erro")
+            return []
+
+    def _salvar_varios(self, tickets: List[Ticket]):
+        with self._bloqueio:
+            self._sincronizar()
+            anteriores = {t.id: self._tickets.get(t.id) for t in tickets}
+            try:
+                for ticket in tickets:
+                    self._definir(ticket.id, self._residente(ticket.copia()))
+            except Exception:
+                # Um campo inválido (ex.: lista não indexável) interrompe os
+                # índices no meio: descarta o estado residente e relê o disco
+                self._assinatura = None
+                self._sincronizar()
+                raise
+            try:
+                self._gravar([(ticket_id, self._tickets[ticket_id]) for ticket_id in anteriores])
+            except Exception:
+                for ticket_id, anterior in anteriores.items():
+                    self._definir(ticket_id, anterior)
+                raise
+        for ticket_id in anteriores:
+            self._notificar(ticket_id, self._tickets.get(ticket_id))
+
     def obter_ticket(self, ticket_id: str) -> Optional[Ticket]:
         try:
-            dados = self._carregar_dados()
-            for t in dados["tickets"]:
-                if t["id"] == ticket_id:
-                    return Ticket.from_dict(t)
-            return None
+            self._sincronizar()
+            ticket = self._tickets.get(ticket_id)
+            return ticket.copia() if ticket else None
         except Exception as e:
-            print(f"Erro ao obter ticket: {e}")
+            eventos.emitir("obter_ticket", f"Erro ao obter ticket: {e}", "erro", ticket_id=ticket_id)
             return None
 
     def obter_todos_tickets(self) -> List[Ticket]:
         try:
-            dados = self._carregar_dados()
-            return [Ticket.from_dict(t) for t in dados["tickets"]]
+            self._sincronizar()
+            return [t.copia() for t in self._tickets.values()]
         except Exception as e:
-            print(f"Erro ao obter tickets: {e}")
+            eventos.emitir("obter_todos_tickets", f"Erro ao obter tickets: {e}", "erro")
             return []
 
+    def iterar_tickets(self) -> Iterator[Ticket]:
+        """Percorre os tickets um a um (cópias), sem montar a lista inteira.
+        Tickets removidos durante a iteração são pulados."""
+        self._sincronizar()
+        for ticket_id in list(self._tickets):
+            ticket = self._tickets.get(ticket_id)
+            if ticket is not None:
+                yield ticket.copia()
+
     def obter_tickets_por_status(self, status: str) -> List[Ticket]:
-        return [t for t in self.obter_todos_tickets() if t.status == status]
+        return self.filtrar_tickets(status=status)
 
     def obter_tickets_por_prioridade(self, prioridade: str) -> List[Ticket]:
-        return [t for t in self.obter_todos_tickets() if t.prioridade == prioridade]
+        return self.filtrar_tickets(prioridade=prioridade)
 
     def obter_tickets_por_usuario(self, usuario: str) -> List[Ticket]:
-        return [t for t in self.obter_todos_tickets() if t.atribuido_a == usuario]
+        return self.filtrar_tickets(usuario=usuario)
+
+    def filtrar_tickets(
+        self,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None
+    ) -> List[Ticket]:
+        """Filtros combinados por interseção dos índices secundários."""
+        try:
+            return [t.copia() for t in self._filtrar(status, prioridade, usuario, categoria)]
+        except Exception as e:
+            eventos.emitir("filtrar_tickets", f"Erro ao obter tickets: {e}", "erro")
+            return []
+
+    def filtrar_resumos(
+        self,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None
+    ) -> List[ResumoTicket]:
+        """Como filtrar_tickets, mas sem copiar histórico e comentários."""
+        try:
+            return [ResumoTicket.de_ticket(t) for t in self._filtrar(status, prioridade, usuario, categoria)]
+        except Exception as e:
+            eventos.emitir("filtrar_resumos", f"Erro ao obter tickets: {e}", "erro")
+            return []
+
+    def _filtrar(self, status, prioridade, usuario, categoria) -> List[Ticket]:
+        """Tickets residentes (não copiados) que atendem aos filtros."""
+        self._sincronizar()
+        with perfil.medir("json.filtrar"):
+            ids = self._ids_filtrados(status, prioridade, usuario, categoria)
+            if ids is None:
+                return list(self._tickets.values())
+            return [self._tickets[i] for i in sorted(ids, key=self._ordem.__getitem__)]
+
+    def _ids_filtrados(self, status, prioridade, usuario, categoria) -> Optional[Set[str]]:
+        """Interseção dos índices secundários (None = sem filtros)."""
+        filtros = {"status": status, "prioridade": prioridade, "atribuido_a": usuario, "categoria": categoria}
+        conjuntos = [self._indices[c].get(v, set()) for c, v in filtros.items() if v]
+        if not conjuntos:
+            return None
+        conjuntos.sort(key=len)
+        return conjuntos[0].intersection(*conjuntos[1:])
+
+    def paginar(
+        self,
+        campo: str = "criado_em",
+        decrescente: bool = False,
+        desde: Optional[str] = None,
+        ate: Optional[str] = None,
+        limite: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None,
+        resumos: bool = False
+    ) -> Pagina:
+        """Tickets ordenados por ``campo`` (criado_em ou atualizado_em) no
+        intervalo [desde, ate), em páginas de ``limite`` itens.
+
+        Sem filtros, o custo é O(log n + limite) sobre o índice de tempo;
+        com filtros, os ids filtrados são ordenados pelo instante.
+        """
+        if campo not in self.CAMPOS_TEMPO:
+            raise ValueError(f"Campo de tempo inválido: {campo}")
+        self._sincronizar()
+        ids = self._ids_filtrados(status, prioridade, usuario, categoria)
+        if ids is None:
+            chaves = self._indices_tempo[campo]
+        else:
+            chaves = sorted((getattr(self._tickets[i], campo) or "", i) for i in ids)
+        selecionadas, proximo = fatiar_chaves(chaves, decrescente, desde, ate, limite, cursor)
+        if resumos:
+            itens = [ResumoTicket.de_ticket(self._tickets[i]) for _, i in selecionadas]
+        else:
+            itens = [self._tickets[i].copia() for _, i in selecionadas]
+        return Pagina(itens, proximo)
 
     def deletar_ticket(self, ticket_id: str) -> bool:
         try:
-            dados = self._carregar_dados()
-            dados["tickets"] = [t for t in dados["tickets"] if t["id"] != ticket_id]
-            self._salvar_dados(dados)
+            self._deletar_varios([ticket_id])
+            return True
+        except Exception as e:
+            eventos.emitir("deletar_ticket", f"Erro ao deletar ticket: {e}", "erro", ticket_id=ticket_id)
+            return False
+
+    def deletar_tickets(self, ticket_ids: List[str]) -> bool:
+        """Remove vários tickets com uma única gravação."""
+        try:
+            self._deletar_varios(ticket_ids)
             return True
         except Exception as e:
-            print(f"Erro ao deletar ticket: {e}")
+            eventos.emitir("deletar_tickets", f"Erro ao deletar tickets: {e}", "erro")
             return False
 
+    def _deletar_varios(self, ticket_ids: List[str]):
+        with self._bloqueio:
+            self._sincronizar()
+            anteriores = {i: self._tickets[i] for i in ticket_ids if i in self._tickets}
+            if not anteriores:
+                return
+            for ticket_id in anteriores:
+                self._definir(ticket_id, None)
+            try:
+                self._gravar([(ticket_id, None) for ticket_id in anteriores])
+            except Exception:
+                for ticket_id, anterior in anteriores.items():
+                    self._definir(ticket_id, anterior)
+                raise
+        for ticket_id in anteriores:
+            self._notificar(ticket_id, None)
+
+    def contem(self, ticket_id: str) -> bool:
+        self._sincronizar()
+        return ticket_id in self._tickets
+
+    def sincronizar(self):
+        """Aplica alterações feitas por outros processos, notificando os ouvintes."""
+        self._sincronizar()
+
+    def assinar(self, ouvinte):
+        """Registra ``ouvinte(ticket_id, ticket)`` chamado a cada ticket criado,
+        alterado ou removido (ticket None), inclusive quando a alteração vem de
+        outro processo e é percebida na sincronização. O ticket recebido é o
+        residente e não deve ser modificado."""
+        self._ouvintes.append(ouvinte)
+
+    def cancelar_assinatura(self, ouvinte):
+        if ouvinte in self._ouvintes:
+            self._ouvintes.remove(ouvinte)
+
+    def _notificar(self, ticket_id: str, ticket: Optional[Ticket]):
+        if not self._carregado:
+            return
+        for ouvinte in list(self._ouvintes):
+            try:
+                ouvinte(ticket_id, ticket)
+            except Exception as e:
+                eventos.emitir("notificar", f"Erro ao notificar alteração: {e}", "erro", ticket_id=ticket_id)
+
+    def recarregar(self):
+        """Descarta o cache e relê o arquivo na próxima operação."""
+        self._assinatura = None
+
+    def arquivos_observados(self) -> List[str]:
+        """Arquivos que mudam a cada gravação (para ObservadorAlteracoes)."""
+        return [self.arquivo_dados, self._bloqueio.caminho]
+
+    def _assinatura_arquivo(self):
+        st = os.stat(self.arquivo_dados)
+        return (st.st_mtime_ns, st.st_size, st.st_ino, self._bloqueio.geracao())
+
+    def _sincronizar(self):
+        assinatura = self._assinatura_arquivo()
+        if assinatura == self._assinatura:
+            return
+        dados = self._carregar_dados()
+        with perfil.medir("tickets.montar"):
+            self._substituir_tickets(self._montar_ticket(t) for t in dados["tickets"])
+        self._assinatura = assinatura
+        self._carregado = True
+
+    def _montar_ticket(self, dados: Dict) -> Ticket:
+        return self._residente(Ticket.from_dict(dados))
+
+    def _residente(self, ticket: Ticket) -> Ticket:
+        """Representação mantida em memória (histórico colunar, se ativado)."""
+        if self.historico_colunar and not isinstance(ticket.historico, HistoricoColunar):
+            ticket.historico = HistoricoColunar(ticket.historico)
+        return ticket
+
+    def _substituir_tickets(self, tickets):
+        """Troca todo o conteúdo residente, reconstrói os índices e notifica
+        os ouvintes apenas dos tickets que de fato mudaram."""
+        anteriores = self._tickets
+        self._tickets = {}
+        self._ordem = {}
+        self._indices = {c: {} for c in self.CAMPOS_INDEXADOS}
+        self._indices_tempo = {c: [] for c in self.CAMPOS_TEMPO}
+        for ticket in tickets:
+            self._definir(ticket.id, ticket, indexar_tempo=False)
+        # Uma ordenação no fim em vez de uma inserção ordenada por ticket
+        for campo in self.CAMPOS_TEMPO:
+            self._indices_tempo[campo] = sorted((getattr(t, campo) or "", i) for i, t in self._tickets.items())
+        if not self._ouvintes or not self._carregado:
+            return
+        for ticket_id in anteriores.keys() - self._tickets.keys():
+            self._notificar(ticket_id, None)
+        for ticket_id, ticket in self._tickets.items():
+            if anteriores.get(ticket_id) != ticket:
+                self._notificar(ticket_id, ticket)
+
+    def _definir(self, ticket_id: str, ticket: Optional[Ticket], indexar_tempo: bool = True):
+        """Único ponto que altera os tickets residentes (None = remover),
+        mantendo os índices secundários e de tempo atualizados."""
+        anterior = self._tickets.get(ticket_id)
+        if indexar_tempo:
+            for campo, chaves in self._indices_tempo.items():
+                valor_anterior = (getattr(anterior, campo) or "") if anterior else None
+                valor_novo = (getattr(ticket, campo) or "") if ticket else None
+                if valor_anterior == valor_novo:
+                    continue
+                if anterior is not None:
+                    posicao = bisect.bisect_left(chaves, (valor_anterior, ticket_id))
+                    if posicao < len(chaves) and chaves[posicao] == (valor_anterior, ticket_id):
+                        del chaves[posicao]
+                if ticket is not None:
+                    bisect.insort(chaves, (valor_novo, ticket_id))
+        for campo, indice in self._indices.items():
+            valor_anterior = getattr(anterior, campo) if anterior else None
+            valor_novo = getattr(ticket, campo) if ticket else None
+            if anterior is not None and ticket is not None and valor_anterior == valor_novo:
+                continue
+            if anterior is not None:
+                ids = indice.get(valor_anterior)
+                if ids is not None:
+                    ids.discard(ticket_id)
+                    if not ids:
+                        del indice[valor_anterior]
+            if ticket is not None:
+                indice.setdefault(valor_novo, set()).add(ticket_id)
+        if ticket is None:
+            self._tickets.pop(ticket_id, None)
+            self._ordem.pop(ticket_id, None)
+        else:
+            self._tickets[ticket_id] = ticket
+            if ticket_id not in self._ordem:
+                self._ordem[ticket_id] = self._proxima_ordem
+                self._proxima_ordem += 1
+
+    def _gravar(self, alteracoes: List[Tuple[str, Optional[Ticket]]]):
+        """Persiste alterações (ticket_id, ticket); ticket None = removido.
+
+        No modo JSON o arquivo inteiro é reescrito; subclasses podem gravar
+        apenas a alteração."""
+        with perfil.medir("json.serializar"):
+            dados = {"tickets": [t.to_dict() for t in self._tickets.values()]}
+        self._salvar_dados(dados)
+        self._bloqueio.incrementar_geracao()
+        self._assinatura = self._assinatura_arquivo()
+
     def _carregar_dados(self) -> Dict:
-        with open(self.arquivo_dados, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with perfil.medir("json.ler"):
+            with open(self.arquivo_dados, 'rb') as f:
+                conteudo = f.read()
+        perfil.contar("bytes_lidos", len(conteudo))
+        with perfil.medir("json.decodificar"):
+            return json.loads(conteudo)
 
     def _salvar_dados(self, dados: Dict):
-        with open(self.arquivo_dados, 'w', encoding='utf-8') as f:
-            json.dump(dados, f, ensure_ascii=False, indent=2)
+        with perfil.medir("json.gravar"):
+            gravar_json_atomico(self.arquivo_dados, dados)
 
     def gerar_relatorio(self) -> Dict:
-        tickets = self.obter_todos_tickets()
+        """Relatório a partir dos índices mantidos: o custo depende apenas da
+        quantidade de valores distintos, não do número de tickets."""
+        self._sincronizar()
         return {
-            "total_tickets": len(tickets),
-            "por_status": self._contar_por_campo(tickets, "status"),
-            "por_prioridade": self._contar_por_campo(tickets, "prioridade"),
-            "por_usuario": self._contar_por_campo(tickets, "atribuido_a"),
-            "tickets_abertos": len(self.obter_tickets_por_status(StatusEnum.ABERTO.value)),
-            "tickets_criticos": len(self.obter_tickets_por_prioridade(PrioridadeEnum.CRITICA.name))
+            "total_tickets": len(self._tickets),
+            "por_status": self._contar_por_indice("status"),
+            "por_prioridade": self._contar_por_indice("prioridade"),
+            "por_usuario": self._contar_por_indice("atribuido_a"),
+            "tickets_abertos": len(self._indices["status"].get(StatusEnum.ABERTO.value, ())),
+            "tickets_criticos": len(self._indices["prioridade"].get(PrioridadeEnum.CRITICA.name, ()))
         }
 
+    def _contar_por_indice(self, campo: str) -> Dict:
+        return {valor: len(ids) for valor, ids in self._indices[campo].items() if valor}
+
+    def verificar_estatisticas(self, corrigir: bool = False) -> Dict:
+        """Recalcula as contagens do zero e compara com os índices mantidos.
+
+        Retorna as divergências por campo ({valor: (mantido, recalculado)});
+        com ``corrigir=True`` os índices são reconstruídos quando há diferença.
+        """
+        self._sincronizar()
+        tickets = list(self._tickets.values())
+        divergencias = {}
+        for campo in self.CAMPOS_INDEXADOS:
+            recalculado = self._contar_por_campo(tickets, campo)
+            mantido = self._contar_por_indice(campo)
+            diferencas = {
+                valor: (mantido.get(valor, 0), recalculado.get(valor, 0))
+                for valor in set(recalculado) | set(mantido)
+                if mantido.get(valor, 0) != recalculado.get(valor, 0)
+            }
+            if diferencas:
+                divergencias[campo] = diferencas
+        if divergencias and corrigir:
+            self._substituir_tickets(tickets)
+        return divergencias
+
     def _contar_por_campo(self, tickets: List[Ticket], campo: str) -> Dict:
         contagem = {}
         for ticket in tickets:
@@ -257,15 +1282,1953 @@ class GerenciadorDados:
         return contagem
 
 
+class GerenciadorDadosJournal(GerenciadorDados):
+    """Armazenamento em snapshot + journal append-only (JSON lines).
+
+    Cada salvar/deletar acrescenta um registro ao journal em vez de reescrever
+    o arquivo inteiro. Quando o journal atinge ``limite_registros`` ou passa
+    ``intervalo_compactacao`` segundos desde a última compactação, ele é
+    incorporado ao snapshot. O snapshot tem o mesmo formato do tickets.json,
+    então um arquivo existente serve diretamente como snapshot inicial.
+    """
+
+    def __init__(
+        self,
+        arquivo_dados: str = "tickets.json",
+        limite_registros: int = 1000,
+        intervalo_compactacao: float = 300.0,
+        fsync: bool = False,
+        historico_colunar: bool = False
+    ):
+        self.arquivo_journal = arquivo_dados + ".journal"
+        self.limite_registros = limite_registros
+        self.intervalo_compactacao = intervalo_compactacao
+        self.fsync = fsync
+        self._registros_journal = 0
+        self._posicao_journal = 0
+        self._ultima_compactacao = time.monotonic()
+        super().__init__(arquivo_dados, historico_colunar=historico_colunar)
+
+    def _inicializar_arquivo(self):
+        super()._inicializar_arquivo()
+        with self._bloqueio:
+            if not os.path.exists(self.arquivo_journal):
+                open(self.arquivo_journal, 'a', encoding='utf-8').close()
+
+    def _sincronizar(self):
+        assinatura = self._assinatura_arquivo()
+        tamanho_journal = os.path.getsize(self.arquivo_journal)
+        if assinatura != self._assinatura or tamanho_journal < self._posicao_journal:
+            dados = self._carregar_dados()
+            with perfil.medir("tickets.montar"):
+                self._substituir_tickets(self._montar_ticket(t) for t in dados["tickets"])
+            self._registros_journal = 0
+            self._posicao_journal = 0
+            self._assinatura = assinatura
+        if tamanho_journal != self._posicao_journal:
+            posicao = self._posicao_journal
+            with perfil.medir("journal.reproduzir"):
+                self._reproduzir_journal()
+            perfil.contar("bytes_lidos", self._posicao_journal - posicao)
+        self._carregado = True
+
+    def arquivos_observados(self) -> List[str]:
+        return super().arquivos_observados() + [self.arquivo_journal]
+
+    def _reproduzir_journal(self):
+        """Aplica os registros do journal a partir da última posição lida.
+
+        Uma linha final incompleta (escrita interrompida ou em andamento) é
+        ignorada e relida na próxima sincronização.
+        """
+        with open(self.arquivo_journal, 'rb') as f:
+            f.seek(self._posicao_journal)
+            for linha in f:
+                if not linha.endswith(b"\n"):
+                    break
+                self._posicao_journal += len(linha)
+                if not linha.strip():
+                    continue
+                self._aplicar_registro(json.loads(linha))
+                self._registros_journal += 1
+
+    def _aplicar_registro(self, registro: Dict):
+        if registro["op"] == "salvar":
+            ticket = self._montar_ticket(registro["ticket"])
+            self._definir(ticket.id, ticket)
+            self._notificar(ticket.id, ticket)
+        elif registro["op"] == "deletar" and registro["id"] in self._tickets:
+            self._definir(registro["id"], None)
+            self._notificar(registro["id"], None)
+
+    def _gravar(self, alteracoes: List[Tuple[str, Optional[Ticket]]]):
+        with perfil.medir("journal.gravar"):
+            self._acrescentar(alteracoes)
+        if self._compactacao_pendente():
+            try:
+                with perfil.medir("journal.compactar"):
+                    self.compactar()
+            except Exception as e:
+                eventos.emitir("compactar", f"Erro ao compactar journal: {e}", "erro")
+
+    def _acrescentar(self, alteracoes: List[Tuple[str, Optional[Ticket]]]):
+        linhas = []
+        for ticket_id, ticket in alteracoes:
+            if ticket is None:
+                registro = {"op": "deletar", "id": ticket_id}
+            else:
+                registro = {"op": "salvar", "ticket": ticket.to_dict()}
+            linhas.append(json.dumps(registro, ensure_ascii=False) + "\n")
+        conteudo = "".join(linhas).encode('utf-8')
+        with open(self.arquivo_journal, 'ab') as f:
+            f.write(conteudo)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        perfil.contar("bytes_gravados", len(conteudo))
+        self._posicao_journal += len(conteudo)
+        self._registros_journal += len(linhas)
+
+    def _compactacao_pendente(self) -> bool:
+        if self._registros_journal >= self.limite_registros:
+            return True
+        decorrido = time.monotonic() - self._ultima_compactacao
+        return self._registros_journal > 0 and decorrido >= self.intervalo_compactacao
+
+    def compactar(self):
+        """Incorpora o journal ao snapshot e esvazia o journal.
+
+        O snapshot é substituído antes de o journal ser esvaziado; se o
+        processo cair no meio, o replay do journal sobre o novo snapshot é
+        idempotente.
+        """
+        with self._bloqueio:
+            self._sincronizar()
+            self._salvar_dados({"tickets": [t.to_dict() for t in self._tickets.values()]})
+            open(self.arquivo_journal, 'w', encoding='utf-8').close()
+            self._bloqueio.incrementar_geracao()
+            self._assinatura = self._assinatura_arquivo()
+            self._registros_journal = 0
+            self._posicao_journal = 0
+            self._ultima_compactacao = time.monotonic()
+
+
+class GerenciadorDadosSQLite:
+    """Armazenamento SQLite com a mesma interface pública de GerenciadorDados.
+
+    Tickets, histórico e comentários ficam em tabelas normalizadas; filtros e
+    relatório são consultas indexadas em vez de varreduras em Python.
+    """
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS tickets (
+            id TEXT PRIMARY KEY,
+            titulo TEXT,
+            descricao TEXT,
+            prioridade TEXT,
+            status TEXT,
+            criado_em TEXT,
+            atualizado_em TEXT,
+            criado_por TEXT,
+            atribuido_a TEXT,
+            categoria TEXT,
+            sla_vencido_em TEXT
+        );
+        CREATE TABLE IF NOT EXISTS historico (
+            ticket_id TEXT NOT NULL REFERENCES tickets(id) ON DELETE CASCADE,
+            seq INTEGER NOT NULL,
+            data TEXT,
+            usuario TEXT,
+            campo TEXT,
+            valor_anterior TEXT,
+            valor_novo TEXT,
+            descricao TEXT,
+            PRIMARY KEY (ticket_id, seq)
+        );
+        CREATE TABLE IF NOT EXISTS comentarios (
+            ticket_id TEXT NOT NULL REFERENCES tickets(id) ON DELETE CASCADE,
+            seq INTEGER NOT NULL,
+            id TEXT,
+            data TEXT,
+            usuario TEXT,
+            conteudo TEXT,
+            atualizado_em TEXT,
+            PRIMARY KEY (ticket_id, seq)
+        );
+        CREATE INDEX IF NOT EXISTS idx_tickets_status ON tickets(status);
+        CREATE INDEX IF NOT EXISTS idx_tickets_prioridade ON tickets(prioridade);
+        CREATE INDEX IF NOT EXISTS idx_tickets_atribuido_a ON tickets(atribuido_a);
+        DROP INDEX IF EXISTS idx_tickets_criado_em;
+        CREATE INDEX IF NOT EXISTS idx_tickets_criado_em_id ON tickets(criado_em, id);
+        CREATE INDEX IF NOT EXISTS idx_tickets_atualizado_em ON tickets(atualizado_em, id);
+        CREATE INDEX IF NOT EXISTS idx_tickets_categoria ON tickets(categoria);
+        CREATE TABLE IF NOT EXISTS alteracoes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticket_id TEXT NOT NULL,
+            origem TEXT
+        );
+    """
+    CAMPOS_TICKET = ("id", "titulo", "descricao", "prioridade", "status", "criado_em",
+                     "atualizado_em", "criado_por", "atribuido_a", "categoria", "sla_vencido_em")
+    CAMPOS_HISTORICO = ("data", "usuario", "campo", "valor_anterior", "valor_novo", "descricao")
+    CAMPOS_COMENTARIO = ("id", "data", "usuario", "conteudo", "atualizado_em")
+    # Limite seguro de parâmetros por consulta "IN (...)"
+    LOTE_CONSULTA = 900
+    # Registros mantidos na tabela de alterações (o restante é podado)
+    LIMITE_ALTERACOES = 10000
+
+    def __init__(self, arquivo_dados: str = "tickets.db"):
+        self.arquivo_dados = arquivo_dados
+        self._lock = threading.RLock()
+        self._ouvintes = []
+        import sqlite3
+        self._conexao = sqlite3.connect(arquivo_dados, check_same_thread=False)
+        self._conexao.row_factory = sqlite3.Row
+        self._conexao.execute("PRAGMA foreign_keys = ON")
+        self._conexao.execute("PRAGMA journal_mode = WAL")
+        self._conexao.executescript(self.ESQUEMA)
+        # Bancos criados antes da coluna sla_vencido_em
+        colunas = {linha["name"] for linha in self._conexao.execute("PRAGMA table_info(tickets)")}
+        if "sla_vencido_em" not in colunas:
+            self._conexao.execute("ALTER TABLE tickets ADD COLUMN sla_vencido_em TEXT")
+        # Cursor na tabela de alterações: o que outras conexões gravaram
+        # depois dele é notificado em sincronizar()
+        self._origem = os.urandom(16).hex()
+        (self._cursor_alteracoes,) = self._conexao.execute(
+            "SELECT COALESCE(MAX(seq), 0) FROM alteracoes").fetchone()
+        self._versao_dados = self._conexao.execute("PRAGMA data_version").fetchone()[0]
+
+    def fechar(self):
+        with self._lock:
+            self._conexao.close()
+
+    def salvar_ticket(self, ticket: Ticket) -> bool:
+        try:
+            with self._lock, self._conexao:
+                self._gravar_ticket(ticket)
+                self._registrar_alteracoes([ticket.id])
+            self._notificar(ticket.id, ticket)
+            return True
+        except Exception as e:
+            eventos.emitir("salvar_ticket", f"Erro ao salvar ticket: {e}", "erro", ticket_id=ticket.id)
+            return False
+
+    def salvar_tickets(self, tickets: List[Ticket]) -> bool:
+        try:
+            with self._lock, self._conexao:
+                for ticket in tickets:
+                    self._gravar_ticket(ticket)
+                self._registrar_alteracoes(t.id for t in tickets)
+            for ticket in tickets:
+                self._notificar(ticket.id, ticket)
+            return True
+        except Exception as e:
+            eventos.emitir("salvar_tickets", f"Erro ao salvar tickets: {e}", "erro")
+            return False
+
+    def atualizar_se(self, ticket_id: str, alterar) -> Optional[Ticket]:
+        """Como GerenciadorDados.atualizar_se: a leitura e a gravação ficam
+        numa transação BEGIN IMMEDIATE, que bloqueia outros escritores."""
+        alterados = self.atualizar_varios_se([ticket_id], alterar)
+        return alterados[0] if alterados else None
+
+    def atualizar_varios_se(self, ticket_ids: Iterable[str], alterar) -> List[Ticket]:
+        try:
+            with self._lock, self._conexao:
+                self._conexao.execute("BEGIN IMMEDIATE")
+                alterados = []
+                for ticket_id in ticket_ids:
+                    tickets = self._consultar("WHERE id = ?", (ticket_id,))
+                    if tickets and alterar(tickets[0]):
+                        alterados.append(tickets[0])
+                for ticket in alterados:
+                    self._gravar_ticket(ticket)
+                self._registrar_alteracoes(t.id for t in alterados)
+            for ticket in alterados:
+                self._notificar(ticket.id, ticket)
+            return alterados
+        except Exception as e:
+            eventos.emitir("atualizar_varios_se", f"Erro ao salvar tickets: {e}", "erro")
+            return []
+
+    def sincronizar(self):
+        """Notifica os tickets alterados por outras conexões desde a última
+        sincronização, lendo a tabela de alterações a partir do cursor."""
+        with self._lock:
+            versao = self._conexao.execute("PRAGMA data_version").fetchone()[0]
+            if versao == self._versao_dados:
+                return
+            self._versao_dados = versao
+            (primeiro,) = self._conexao.execute("SELECT COALESCE(MIN(seq), 0) FROM alteracoes").fetchone()
+            registros = self._conexao.execute(
+                "SELECT seq, ticket_id, origem FROM alteracoes WHERE seq > ? ORDER BY seq",
+                (self._cursor_alteracoes,)).fetchall()
+            podado = primeiro > self._cursor_alteracoes + 1
+            alterados = {}
+            for seq, ticket_id, origem in registros:
+                if origem != self._origem:
+                    alterados[ticket_id] = None
+                self._cursor_alteracoes = seq
+        if podado:
+            # O cursor ficou para trás da poda: não há como saber o que mudou
+            for ticket in self.obter_todos_tickets():
+                self._notificar(ticket.id, ticket)
+            return
+        for ticket_id in alterados:
+            self._notificar(ticket_id, self.obter_ticket(ticket_id))
+
+    def arquivos_observados(self) -> List[str]:
+        return [self.arquivo_dados, self.arquivo_dados + "-wal"]
+
+    def _registrar_alteracoes(self, ticket_ids: Iterable[str]):
+        """Acrescenta à tabela de alterações (dentro da transação da gravação)."""
+        cursor = self._conexao.executemany(
+            "INSERT INTO alteracoes (ticket_id, origem) VALUES (?, ?)",
+            [(ticket_id, self._origem) for ticket_id in ticket_ids])
+        if cursor.rowcount > 0:
+            self._conexao.execute(
+                "DELETE FROM alteracoes WHERE seq <= (SELECT MAX(seq) FROM alteracoes) - ?",
+                (self.LIMITE_ALTERACOES,))
+
+    def assinar(self, ouvinte):
+        """Ouvintes recebem as alterações desta instância e, em
+        sincronizar(), as de outras conexões ao mesmo banco."""
+        self._ouvintes.append(ouvinte)
+
+    def cancelar_assinatura(self, ouvinte):
+        if ouvinte in self._ouvintes:
+            self._ouvintes.remove(ouvinte)
+
+    def _notificar(self, ticket_id: str, ticket: Optional[Ticket]):
+        for ouvinte in list(self._ouvintes):
+            try:
+                ouvinte(ticket_id, ticket)
+            except Exception as e:
+                eventos.emitir("notificar", f"Erro ao notificar alteração: {e}", "erro", ticket_id=ticket_id)
+
+    def _gravar_ticket(self, ticket: Ticket):
+        with perfil.medir("sqlite.gravar"):
+            self._gravar_linhas(ticket)
+
+    def _gravar_linhas(self, ticket: Ticket):
+        colunas = ", ".join(self.CAMPOS_TICKET)
+        marcadores = ", ".join("?" for _ in self.CAMPOS_TICKET)
+        atualizacao = ", ".join(f"{c} = excluded.{c}" for c in self.CAMPOS_TICKET[1:])
+        self._conexao.execute(
+            f"INSERT INTO tickets ({colunas}) VALUES ({marcadores}) "
+            f"ON CONFLICT(id) DO UPDATE SET {atualizacao}",
+            [getattr(ticket, c) for c in self.CAMPOS_TICKET]
+        )
+        # O histórico só cresce: grava apenas as entradas novas
+        (existentes,) = self._conexao.execute(
+            "SELECT COUNT(*) FROM historico WHERE ticket_id = ?", (ticket.id,)
+        ).fetchone()
+        if existentes > len(ticket.historico):
+            self._conexao.execute("DELETE FROM historico WHERE ticket_id = ?", (ticket.id,))
+            existentes = 0
+        self._conexao.executemany(
+            "INSERT INTO historico (ticket_id, seq, data, usuario, campo, valor_anterior, valor_novo, descricao) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(ticket.id, seq) + tuple(h.get(c) for c in self.CAMPOS_HISTORICO)
+             for seq, h in enumerate(ticket.historico) if seq >= existentes]
+        )
+        # Comentários podem ser editados: são regravados por completo
+        self._conexao.execute("DELETE FROM comentarios WHERE ticket_id = ?", (ticket.id,))
+        self._conexao.executemany(
+            "INSERT INTO comentarios (ticket_id, seq, id, data, usuario, conteudo, atualizado_em) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(ticket.id, seq) + tuple(c.get(k) for k in self.CAMPOS_COMENTARIO)
+             for seq, c in enumerate(ticket.comentarios)]
+        )
+
+    def obter_ticket(self, ticket_id: str) -> Optional[Ticket]:
+        try:
+            tickets = self._consultar("WHERE id = ?", (ticket_id,))
+            return tickets[0] if tickets else None
+        except Exception as e:
+            eventos.emitir("obter_ticket", f"Erro ao obter ticket: {e}", "erro", ticket_id=ticket_id)
+            return None
+
+    def obter_todos_tickets(self) -> List[Ticket]:
+        try:
+            return self._consultar()
+        except Exception as e:
+            eventos.emitir("obter_todos_tickets", f"Erro ao obter tickets: {e}", "erro")
+            return []
+
+    def contem(self, ticket_id: str) -> bool:
+        with self._lock:
+            return self._conexao.execute("SELECT 1 FROM tickets WHERE id = ?", (ticket_id,)).fetchone() is not None
+
+    def iterar_tickets(self, tamanho_pagina: int = 500) -> Iterator[Ticket]:
+        """Percorre os tickets em páginas ordenadas por id (keyset): a memória
+        usada é a de uma página, qualquer que seja o tamanho do banco."""
+        ultimo = ""
+        while True:
+            pagina = self._consultar("WHERE id > ?", (ultimo,), f"ORDER BY id LIMIT {int(tamanho_pagina)}")
+            yield from pagina
+            if len(pagina) < tamanho_pagina:
+                return
+            ultimo = pagina[-1].id
+
+    def obter_tickets_por_status(self, status: str) -> List[Ticket]:
+        return self.filtrar_tickets(status=status)
+
+    def obter_tickets_por_prioridade(self, prioridade: str) -> List[Ticket]:
+        return self.filtrar_tickets(prioridade=prioridade)
+
+    def obter_tickets_por_usuario(self, usuario: str) -> List[Ticket]:
+        return self.filtrar_tickets(usuario=usuario)
+
+    def filtrar_tickets(
+        self,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None
+    ) -> List[Ticket]:
+        filtro, parametros = self._montar_filtro(status, prioridade, usuario, categoria)
+        return self._consultar_seguro(filtro, parametros)
+
+    def filtrar_resumos(
+        self,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None
+    ) -> List[ResumoTicket]:
+        """Consulta só a tabela tickets; histórico e comentários não são lidos."""
+        filtro, parametros = self._montar_filtro(status, prioridade, usuario, categoria)
+        try:
+            with self._lock:
+                linhas = self._conexao.execute(
+                    f"SELECT {', '.join(ResumoTicket.CAMPOS)} FROM tickets {filtro} ORDER BY rowid",
+                    parametros
+                ).fetchall()
+            return [ResumoTicket(**{c: l[c] for c in ResumoTicket.CAMPOS}) for l in linhas]
+        except Exception as e:
+            eventos.emitir("filtrar_resumos", f"Erro ao obter tickets: {e}", "erro")
+            return []
+
+    def paginar(
+        self,
+        campo: str = "criado_em",
+        decrescente: bool = False,
+        desde: Optional[str] = None,
+        ate: Optional[str] = None,
+        limite: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None,
+        resumos: bool = False
+    ) -> Pagina:
+        """Mesma semântica de GerenciadorDados.paginar, atendida pelos
+        índices (campo, id) do banco."""
+        if campo not in GerenciadorDados.CAMPOS_TEMPO:
+            raise ValueError(f"Campo de tempo inválido: {campo}")
+        filtro, parametros = self._montar_filtro(status, prioridade, usuario, categoria)
+        condicoes = [filtro[len("WHERE "):]] if filtro else []
+        parametros = list(parametros)
+        if desde:
+            condicoes.append(f"{campo} >= ?")
+            parametros.append(desde)
+        if ate:
+            condicoes.append(f"{campo} < ?")
+            parametros.append(ate)
+        if cursor:
+            condicoes.append(f"({campo}, id) {'<' if decrescente else '>'} (?, ?)")
+            parametros.extend(Pagina.decodificar(cursor))
+        filtro = ("WHERE " + " AND ".join(condicoes)) if condicoes else ""
+        direcao = "DESC" if decrescente else "ASC"
+        ordem = f"ORDER BY {campo} {direcao}, id {direcao}"
+        if limite:
+            ordem += " LIMIT ?"
+            parametros.append(limite + 1)
+        try:
+            if resumos:
+                with self._lock:
+                    linhas = self._conexao.execute(
+                        f"SELECT {', '.join(ResumoTicket.CAMPOS)} FROM tickets {filtro} {ordem}", parametros
+                    ).fetchall()
+                itens = [ResumoTicket(**{c: l[c] for c in ResumoTicket.CAMPOS}) for l in linhas]
+            else:
+                itens = self._consultar(filtro, tuple(parametros), ordem)
+        except Exception as e:
+            eventos.emitir("paginar", f"Erro ao obter tickets: {e}", "erro")
+            return Pagina()
+        proximo = None
+        if limite and len(itens) > limite:
+            itens = itens[:limite]
+            proximo = Pagina.codificar((getattr(itens[-1], campo) or "", itens[-1].id))
+        return Pagina(itens, proximo)
+
+    def _montar_filtro(self, status, prioridade, usuario, categoria) -> Tuple[str, tuple]:
+        filtros = {"status": status, "prioridade": prioridade, "atribuido_a": usuario, "categoria": categoria}
+        condicoes = [(f"{c} = ?", v) for c, v in filtros.items() if v]
+        if not condicoes:
+            return "", ()
+        return "WHERE " + " AND ".join(c for c, _ in condicoes), tuple(v for _, v in condicoes)
+
+    def deletar_ticket(self, ticket_id: str) -> bool:
+        try:
+            with self._lock, self._conexao:
+                self._conexao.execute("DELETE FROM tickets WHERE id = ?", (ticket_id,))
+                self._registrar_alteracoes([ticket_id])
+            self._notificar(ticket_id, None)
+            return True
+        except Exception as e:
+            eventos.emitir("deletar_ticket", f"Erro ao deletar ticket: {e}", "erro", ticket_id=ticket_id)
+            return False
+
+    def deletar_tickets(self, ticket_ids: List[str]) -> bool:
+        try:
+            with self._lock, self._conexao:
+                self._conexao.executemany("DELETE FROM tickets WHERE id = ?", [(i,) for i in ticket_ids])
+                self._registrar_alteracoes(ticket_ids)
+            for ticket_id in ticket_ids:
+                self._notificar(ticket_id, None)
+            return True
+        except Exception as e:
+            eventos.emitir("deletar_tickets", f"Erro ao deletar tickets: {e}", "erro")
+            return False
+
+    def gerar_relatorio(self) -> Dict:
+        with self._lock:
+            (total,) = self._conexao.execute("SELECT COUNT(*) FROM tickets").fetchone()
+            (abertos,) = self._conexao.execute(
+                "SELECT COUNT(*) FROM tickets WHERE status = ?", (StatusEnum.ABERTO.value,)
+            ).fetchone()
+            (criticos,) = self._conexao.execute(
+                "SELECT COUNT(*) FROM tickets WHERE prioridade = ?", (PrioridadeEnum.CRITICA.name,)
+            ).fetchone()
+            return {
+                "total_tickets": total,
+                "por_status": self._contar_por_campo("status"),
+                "por_prioridade": self._contar_por_campo("prioridade"),
+                "por_usuario": self._contar_por_campo("atribuido_a"),
+                "tickets_abertos": abertos,
+                "tickets_criticos": criticos
+            }
+
+    def verificar_estatisticas(self, corrigir: bool = False) -> Dict:
+        """As contagens vêm direto do banco, então nunca divergem."""
+        return {}
+
+    def _contar_por_campo(self, campo: str) -> Dict:
+        linhas = self._conexao.execute(
+            f"SELECT {campo}, COUNT(*) FROM tickets "
+            f"WHERE {campo} IS NOT NULL AND {campo} != '' GROUP BY {campo}"
+        )
+        return {valor: contagem for valor, contagem in linhas}
+
+    def _consultar_seguro(self, filtro: str, parametros: tuple) -> List[Ticket]:
+        try:
+            return self._consultar(filtro, parametros)
+        except Exception as e:
+            eventos.emitir("consultar_seguro", f"Erro ao obter tickets: {e}", "erro")
+            return []
+
+    def _consultar(self, filtro: str = "", parametros: tuple = (), ordem: str = "ORDER BY rowid") -> List[Ticket]:
+        with self._lock, perfil.medir("sqlite.consultar"):
+            linhas = self._conexao.execute(
+                f"SELECT {', '.join(self.CAMPOS_TICKET)} FROM tickets {filtro} {ordem}",
+                parametros
+            ).fetchall()
+            tickets = {l["id"]: Ticket(**{c: l[c] for c in self.CAMPOS_TICKET}) for l in linhas}
+            ids = list(tickets)
+            for inicio in range(0, len(ids), self.LOTE_CONSULTA):
+                lote = ids[inicio:inicio + self.LOTE_CONSULTA]
+                marcadores = ", ".join("?" for _ in lote)
+                for h in self._conexao.execute(
+                    f"SELECT ticket_id, {', '.join(self.CAMPOS_HISTORICO)} FROM historico "
+                    f"WHERE ticket_id IN ({marcadores}) ORDER BY ticket_id, seq", lote
+                ):
+                    tickets[h["ticket_id"]].historico.append({c: h[c] for c in self.CAMPOS_HISTORICO})
+                for c in self._conexao.execute(
+                    f"SELECT ticket_id, {', '.join(self.CAMPOS_COMENTARIO)} FROM comentarios "
+                    f"WHERE ticket_id IN ({marcadores}) ORDER BY ticket_id, seq", lote
+                ):
+                    tickets[c["ticket_id"]].comentarios.append({k: c[k] for k in self.CAMPOS_COMENTARIO})
+            return list(tickets.values())
+
+
+def migrar_json_para_sqlite(arquivo_json: str, arquivo_sqlite: str) -> int:
+    """Importa um tickets.json para um banco SQLite numa única transação.
+
+    Retorna a quantidade de tickets migrados.
+    """
+    with open(arquivo_json, 'r', encoding='utf-8') as f:
+        dados = json.load(f)
+    destino = GerenciadorDadosSQLite(arquivo_sqlite)
+    try:
+        with destino._lock, destino._conexao:
+            for t in dados.get("tickets", []):
+                destino._gravar_ticket(Ticket.from_dict(t))
+    finally:
+        destino.fechar()
+    return len(dados.get("tickets", []))
+
+
+class GerenciadorDadosFragmentado:
+    """Armazenamento em fragmentos para arquivos grandes de tickets.
+
+    Tickets ativos ficam em ``<diretorio>/ativos.json``; tickets fechados são
+    arquivados em um fragmento por mês de criação (``fechados-AAAA-MM.json``).
+    Cada fragmento é um GerenciadorDados independente, carregado só quando
+    necessário. O ``manifesto.json`` mapeia os ids arquivados para o seu
+    fragmento e guarda o relatório de cada fragmento arquivado, de modo que
+    consultas sobre tickets ativos e o relatório geral nunca abrem o arquivo
+    morto.
+    """
+
+    FRAGMENTO_ATIVOS = "ativos"
+    STATUS_ARQUIVADO = StatusEnum.FECHADO.value
+
+    def __init__(self, diretorio: str = "tickets"):
+        self.diretorio = diretorio
+        os.makedirs(diretorio, exist_ok=True)
+        self.arquivo_manifesto = os.path.join(diretorio, "manifesto.json")
+        self._bloqueio = BloqueioArquivo(self.arquivo_manifesto)
+        self._manifesto = {"arquivados": {}, "fragmentos": {}}
+        self._assinatura = None
+        self._ouvintes = []
+        # > 0 durante gravações desta instância: o fragmento ativo não repassa
+        # as próprias notificações (já feitas por _salvar_varios/deletar_tickets)
+        self._gravando = 0
+        self._fragmentos: Dict[str, GerenciadorDados] = {}
+        with self._bloqueio:
+            if not os.path.exists(self.arquivo_manifesto):
+                gravar_json_atomico(self.arquivo_manifesto, self._manifesto, indent=None)
+
+    def _fragmento(self, nome: str) -> GerenciadorDados:
+        if nome not in self._fragmentos:
+            self._fragmentos[nome] = GerenciadorDados(os.path.join(self.diretorio, nome + ".json"))
+            if nome == self.FRAGMENTO_ATIVOS:
+                self._fragmentos[nome].assinar(self._repassar_ativos)
+        return self._fragmentos[nome]
+
+    def _repassar_ativos(self, ticket_id: str, ticket: Optional[Ticket]):
+        """Repassa alterações do fragmento ativo feitas por outros processos.
+        Um ticket que saiu do fragmento por ter sido arquivado não é removido:
+        a mudança no manifesto é notificada em _sincronizar."""
+        if self._gravando:
+            return
+        if ticket is None and ticket_id in self._manifesto["arquivados"]:
+            return
+        self._notificar(ticket_id, ticket)
+
+    def _nome_fragmento(self, ticket: Ticket) -> str:
+        if ticket.status == self.STATUS_ARQUIVADO:
+            return f"fechados-{(ticket.criado_em or '')[:7] or 'sem-data'}"
+        return self.FRAGMENTO_ATIVOS
+
+    def _sincronizar(self):
+        st = os.stat(self.arquivo_manifesto)
+        assinatura = (st.st_mtime_ns, st.st_size, st.st_ino, self._bloqueio.geracao())
+        if assinatura == self._assinatura:
+            return
+        anteriores = self._manifesto["arquivados"]
+        primeira_carga = self._assinatura is None
+        with open(self.arquivo_manifesto, 'r', encoding='utf-8') as f:
+            self._manifesto = json.load(f)
+        self._assinatura = assinatura
+        if primeira_carga or not self._ouvintes:
+            return
+        # Tickets arquivados, movidos ou desarquivados por outros processos
+        arquivados = self._manifesto["arquivados"]
+        for ticket_id, nome in arquivados.items():
+            if anteriores.get(ticket_id) != nome:
+                self._notificar(ticket_id, self._fragmento(nome).obter_ticket(ticket_id))
+        for ticket_id in anteriores.keys() - arquivados.keys():
+            if not self._fragmento(self.FRAGMENTO_ATIVOS).contem(ticket_id):
+                self._notificar(ticket_id, None)
+
+    def _salvar_manifesto(self):
+        gravar_json_atomico(self.arquivo_manifesto, self._manifesto, indent=None)
+        self._bloqueio.incrementar_geracao()
+        st = os.stat(self.arquivo_manifesto)
+        self._assinatura = (st.st_mtime_ns, st.st_size, st.st_ino, self._bloqueio.geracao())
+
+    def contem(self, ticket_id: str) -> bool:
+        self._sincronizar()
+        return self._localizar(ticket_id) is not None
+
+    def _localizar(self, ticket_id: str) -> Optional[str]:
+        if self._fragmento(self.FRAGMENTO_ATIVOS).contem(ticket_id):
+            return self.FRAGMENTO_ATIVOS
+        return self._manifesto["arquivados"].get(ticket_id)
+
+    def salvar_ticket(self, ticket: Ticket) -> bool:
+        try:
+            self._salvar_varios([ticket])
+            return True
+        except Exception as e:
+            eventos.emitir("salvar_ticket", f"Erro ao salvar ticket: {e}", "erro", ticket_id=ticket.id)
+            return False
+
+    def salvar_tickets(self, tickets: List[Ticket]) -> bool:
+        try:
+            self._salvar_varios(tickets)
+            return True
+        except Exception as e:
+            eventos.emitir("salvar_tickets", f"Erro ao salvar tickets: {e}", "erro")
+            return False
+
+    def atualizar_se(self, ticket_id: str, alterar) -> Optional[Ticket]:
+        """Como GerenciadorDados.atualizar_se, sob o bloqueio do manifesto
+        (que toda gravação nos fragmentos adquire)."""
+        alterados = self.atualizar_varios_se([ticket_id], alterar)
+        return alterados[0] if alterados else None
+
+    def atualizar_varios_se(self, ticket_ids: Iterable[str], alterar) -> List[Ticket]:
+        try:
+            with self._bloqueio:
+                alterados = []
+                for ticket_id in ticket_ids:
+                    ticket = self.obter_ticket(ticket_id)
+                    if ticket is not None and alterar(ticket):
+                        alterados.append(ticket)
+                if alterados:
+                    self._salvar_varios(alterados)
+            return alterados
+        except Exception as e:
+            eventos.emitir("atualizar_varios_se", f"Erro ao salvar tickets: {e}", "erro")
+            return []
+
+    def _salvar_varios(self, tickets: List[Ticket]):
+        with self._bloqueio, self._gravacao():
+            destinos: Dict[str, List[Ticket]] = {}
+            remocoes: Dict[str, List[str]] = {}
+            for ticket in tickets:
+                destino = self._nome_fragmento(ticket)
+                origem = self._localizar(ticket.id)
+                destinos.setdefault(destino, []).append(ticket)
+                if origem and origem != destino:
+                    remocoes.setdefault(origem, []).append(ticket.id)
+            for nome, lote in destinos.items():
+                if not self._fragmento(nome).salvar_tickets(lote):
+                    raise IOError(f"falha ao gravar o fragmento {nome}")
+            for nome, ids in remocoes.items():
+                if not self._fragmento(nome).deletar_tickets(ids):
+                    raise IOError(f"falha ao gravar o fragmento {nome}")
+            self._atualizar_manifesto(
+                [(t.id, self._nome_fragmento(t)) for t in tickets],
+                set(destinos) | set(remocoes)
+            )
+        for ticket in tickets:
+            self._notificar(ticket.id, ticket)
+
+    def sincronizar(self):
+        self._sincronizar()
+        self._fragmento(self.FRAGMENTO_ATIVOS).sincronizar()
+
+    @contextmanager
+    def _gravacao(self):
+        """Sincroniza (notificando o que outros processos gravaram) e marca
+        o trecho de gravação própria. Deve ser usado sob o bloqueio."""
+        self.sincronizar()
+        self._gravando += 1
+        try:
+            yield
+        finally:
+            self._gravando -= 1
+
+    def arquivos_observados(self) -> List[str]:
+        return [self.arquivo_manifesto, self._bloqueio.caminho] + \
+            self._fragmento(self.FRAGMENTO_ATIVOS).arquivos_observados()
+
+    def assinar(self, ouvinte):
+        """Ouvintes recebem as alterações feitas por esta instância (a troca
+        de fragmento de um ticket é notificada como uma única alteração)."""
+        self._ouvintes.append(ouvinte)
+
+    def cancelar_assinatura(self, ouvinte):
+        if ouvinte in self._ouvintes:
+            self._ouvintes.remove(ouvinte)
+
+    def _notificar(self, ticket_id: str, ticket: Optional[Ticket]):
+        for ouvinte in list(self._ouvintes):
+            try:
+                ouvinte(ticket_id, ticket)
+            except Exception as e:
+                eventos.emitir("notificar", f"Erro ao notificar alteração: {e}", "erro", ticket_id=ticket_id)
+
+    def _atualizar_manifesto(self, localizacoes: List[Tuple[str, Optional[str]]], alterados: Set[str]):
+        """Registra onde cada ticket ficou (None = removido) e atualiza o
+        relatório dos fragmentos arquivados que mudaram. O manifesto só é
+        regravado quando algo arquivado muda."""
+        arquivados = self._manifesto["arquivados"]
+        mudou = False
+        for ticket_id, nome in localizacoes:
+            if nome and nome != self.FRAGMENTO_ATIVOS:
+                mudou = mudou or arquivados.get(ticket_id) != nome
+                arquivados[ticket_id] = nome
+            elif ticket_id in arquivados:
+                del arquivados[ticket_id]
+                mudou = True
+        for nome in alterados - {self.FRAGMENTO_ATIVOS}:
+            self._manifesto["fragmentos"][nome] = self._fragmento(nome).gerar_relatorio()
+            mudou = True
+        if mudou:
+            self._salvar_manifesto()
+
+    def obter_ticket(self, ticket_id: str) -> Optional[Ticket]:
+        try:
+            self._sincronizar()
+            nome = self._localizar(ticket_id)
+            return self._fragmento(nome).obter_ticket(ticket_id) if nome else None
+        except Exception as e:
+            eventos.emitir("obter_ticket", f"Erro ao obter ticket: {e}", "erro", ticket_id=ticket_id)
+            return None
+
+    def _nomes_fragmentos(self, status: Optional[str] = None) -> List[str]:
+        """Fragmentos que podem conter tickets com o status pedido."""
+        arquivados = sorted(self._manifesto["fragmentos"])
+        if not status:
+            return [self.FRAGMENTO_ATIVOS] + arquivados
+        if status == self.STATUS_ARQUIVADO:
+            return arquivados
+        return [self.FRAGMENTO_ATIVOS]
+
+    def obter_todos_tickets(self) -> List[Ticket]:
+        return self.filtrar_tickets()
+
+    def iterar_tickets(self) -> Iterator[Ticket]:
+        """Percorre um fragmento por vez; fragmentos arquivados abertos só para
+        a iteração são descartados ao terminar, mantendo o arquivo morto fora
+        da memória."""
+        self._sincronizar()
+        for nome in self._nomes_fragmentos():
+            ja_carregado = nome in self._fragmentos
+            yield from self._fragmento(nome).iterar_tickets()
+            if not ja_carregado and nome != self.FRAGMENTO_ATIVOS:
+                self._fragmentos.pop(nome, None)
+
+    def obter_tickets_por_status(self, status: str) -> List[Ticket]:
+        return self.filtrar_tickets(status=status)
+
+    def obter_tickets_por_prioridade(self, prioridade: str) -> List[Ticket]:
+        return self.filtrar_tickets(prioridade=prioridade)
+
+    def obter_tickets_por_usuario(self, usuario: str) -> List[Ticket]:
+        return self.filtrar_tickets(usuario=usuario)
+
+    def filtrar_tickets(
+        self,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None
+    ) -> List[Ticket]:
+        try:
+            self._sincronizar()
+            tickets = []
+            for nome in self._nomes_fragmentos(status):
+                tickets.extend(self._fragmento(nome).filtrar_tickets(
+                    status=status, prioridade=prioridade, usuario=usuario, categoria=categoria
+                ))
+            return tickets
+        except Exception as e:
+            eventos.emitir("filtrar_tickets", f"Erro ao obter tickets: {e}", "erro")
+            return []
+
+    def filtrar_resumos(
+        self,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None
+    ) -> List[ResumoTicket]:
+        try:
+            self._sincronizar()
+            resumos = []
+            for nome in self._nomes_fragmentos(status):
+                resumos.extend(self._fragmento(nome).filtrar_resumos(
+                    status=status, prioridade=prioridade, usuario=usuario, categoria=categoria
+                ))
+            return resumos
+        except Exception as e:
+            eventos.emitir("filtrar_resumos", f"Erro ao obter tickets: {e}", "erro")
+            return []
+
+    def paginar(
+        self,
+        campo: str = "criado_em",
+        decrescente: bool = False,
+        desde: Optional[str] = None,
+        ate: Optional[str] = None,
+        limite: Optional[int] = None,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None,
+        resumos: bool = False
+    ) -> Pagina:
+        """Pagina cada fragmento e intercala os resultados. Por criado_em,
+        fragmentos mensais fora do intervalo nem são abertos."""
+        self._sincronizar()
+        paginas = []
+        for nome in self._nomes_fragmentos(status):
+            mes = nome[len("fechados-"):] if nome.startswith("fechados-") else None
+            if campo == "criado_em" and mes and mes != "sem-data":
+                if (desde and mes < desde[:7]) or (ate and mes > ate[:7]):
+                    continue
+            paginas.append(self._fragmento(nome).paginar(
+                campo, decrescente, desde, ate, limite, cursor,
+                status, prioridade, usuario, categoria, resumos
+            ))
+
+        def chave(item):
+            return (getattr(item, campo) or "", item.id)
+        itens = list(heapq.merge(*paginas, key=chave, reverse=decrescente))
+        restam = any(p.cursor for p in paginas)
+        if limite and len(itens) > limite:
+            itens, restam = itens[:limite], True
+        return Pagina(itens, Pagina.codificar(chave(itens[-1])) if restam and itens else None)
+
+    def deletar_ticket(self, ticket_id: str) -> bool:
+        return self.deletar_tickets([ticket_id])
+
+    def deletar_tickets(self, ticket_ids: List[str]) -> bool:
+        try:
+            with self._bloqueio, self._gravacao():
+                por_fragmento: Dict[str, List[str]] = {}
+                for ticket_id in ticket_ids:
+                    nome = self._localizar(ticket_id)
+                    if nome:
+                        por_fragmento.setdefault(nome, []).append(ticket_id)
+                for nome, ids in por_fragmento.items():
+                    if not self._fragmento(nome).deletar_tickets(ids):
+                        raise IOError(f"falha ao gravar o fragmento {nome}")
+                self._atualizar_manifesto([(i, None) for i in ticket_ids], set(por_fragmento))
+            for ids in por_fragmento.values():
+                for ticket_id in ids:
+                    self._notificar(ticket_id, None)
+            return True
+        except Exception as e:
+            eventos.emitir("deletar_tickets", f"Erro ao deletar ticket: {e}", "erro")
+            return False
+
+    def recarregar(self):
+        self._assinatura = None
+        for fragmento in self._fragmentos.values():
+            fragmento.recarregar()
+
+    def gerar_relatorio(self) -> Dict:
+        """Soma o relatório do fragmento ativo com os relatórios guardados no
+        manifesto para os fragmentos arquivados (sem abri-los)."""
+        self._sincronizar()
+        relatorios = [self._fragmento(self.FRAGMENTO_ATIVOS).gerar_relatorio()]
+        relatorios.extend(self._manifesto["fragmentos"].values())
+        total = {"total_tickets": 0, "por_status": {}, "por_prioridade": {}, "por_usuario": {},
+                 "tickets_abertos": 0, "tickets_criticos": 0}
+        for relatorio in relatorios:
+            for chave, valor in relatorio.items():
+                if isinstance(valor, dict):
+                    for k, v in valor.items():
+                        total[chave][k] = total[chave].get(k, 0) + v
+                else:
+                    total[chave] += valor
+        return total
+
+    def verificar_estatisticas(self, corrigir: bool = False) -> Dict:
+        """Verifica cada fragmento e o relatório guardado no manifesto."""
+        with self._bloqueio:
+            self._sincronizar()
+            divergencias = {}
+            for nome in self._nomes_fragmentos():
+                fragmento = self._fragmento(nome)
+                for campo, diferencas in fragmento.verificar_estatisticas(corrigir=corrigir).items():
+                    divergencias.setdefault(campo, {}).update(diferencas)
+                if nome != self.FRAGMENTO_ATIVOS and self._manifesto["fragmentos"][nome] != fragmento.gerar_relatorio():
+                    divergencias.setdefault("manifesto", {})[nome] = (self._manifesto["fragmentos"][nome], fragmento.gerar_relatorio())
+            if corrigir and "manifesto" in divergencias:
+                self._atualizar_manifesto([], set(divergencias["manifesto"]))
+            return divergencias
+
+
+def migrar_json_para_fragmentos(arquivo_json: str, diretorio: str) -> int:
+    """Divide um tickets.json plano em fragmentos (ativos + arquivo mensal).
+
+    Retorna a quantidade de tickets migrados.
+    """
+    with open(arquivo_json, 'r', encoding='utf-8') as f:
+        dados = json.load(f)
+    tickets = [Ticket.from_dict(t) for t in dados.get("tickets", [])]
+    destino = GerenciadorDadosFragmentado(diretorio)
+    if not destino.salvar_tickets(tickets):
+        raise IOError(f"falha ao migrar para {diretorio}")
+    return len(tickets)
+
+
+# Importação/exportação em fluxo (python main.py --import/--export)
+FORMATOS_TROCA = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+# Colunas do CSV: histórico e comentários vão como JSON dentro da célula
+COLUNAS_CSV = Ticket.CAMPOS_SIMPLES + ("historico", "comentarios")
+
+
+def formato_troca(caminho: str, formato: Optional[str] = None) -> str:
+    """Formato informado ou deduzido da extensão ("-" sem formato = JSONL)."""
+    if not formato:
+        formato = "jsonl" if caminho == "-" else FORMATOS_TROCA.get(os.path.splitext(caminho)[1].lower())
+    if formato not in ("jsonl", "csv"):
+        raise ValueError(f"Formato não reconhecido para {caminho} (use .jsonl, .ndjson ou .csv)")
+    return formato
+
+
+@contextmanager
+def abrir_troca(caminho: str, modo: str = "r"):
+    """Abre o arquivo de importação/exportação; "-" é a entrada/saída padrão."""
+    if caminho == "-":
+        yield sys.stdin if modo == "r" else sys.stdout
+        return
+    with open(caminho, modo, encoding="utf-8", newline="") as arquivo:
+        yield arquivo
+
+
+def ler_registros(arquivo, formato: str) -> Iterator[Tuple[int, object]]:
+    """Gera (número da linha, registro bruto) um por vez: a linha JSONL como
+    texto ou a linha CSV como dicionário de textos (ver decodificar_registro)."""
+    if formato == "csv":
+        import csv
+        leitor = csv.DictReader(arquivo)
+        for registro in leitor:
+            yield leitor.line_num, registro
+        return
+    for numero, linha in enumerate(arquivo, 1):
+        if linha.strip():
+            yield numero, linha
+
+
+def decodificar_registro(registro, formato: str) -> Dict:
+    """Registro bruto → dicionário no formato de Ticket.to_dict.
+    Levanta ValueError se a linha não puder ser decodificada."""
+    if formato == "jsonl":
+        return json.loads(registro)
+    # Células vazias são campos ausentes; colunas excedentes (chave None) são ignoradas
+    dados = {c: v for c, v in registro.items() if c is not None and v not in ("", None)}
+    for campo in ("historico", "comentarios"):
+        if campo in dados:
+            dados[campo] = json.loads(dados[campo])
+    return dados
+
+
+def escritor_registros(arquivo, formato: str):
+    """Função que grava um ticket por vez no arquivo de exportação."""
+    if formato == "jsonl":
+        return lambda ticket: arquivo.write(json.dumps(ticket.to_dict(), ensure_ascii=False) + "\n")
+    import csv
+    escritor = csv.DictWriter(arquivo, COLUNAS_CSV)
+    escritor.writeheader()
+
+    def escrever(ticket: Ticket):
+        dados = ticket.to_dict()
+        for campo in ("historico", "comentarios"):
+            dados[campo] = json.dumps(dados[campo], ensure_ascii=False)
+        escritor.writerow(dados)
+    return escrever
+
+
+def criar_gerenciador(arquivo_dados: str = "tickets.json") -> GerenciadorDados:
+    """Escolhe o backend de armazenamento a partir do endereço dos dados.
+
+    ``journal://tickets.json`` usa snapshot + journal; ``sqlite://tickets.db``
+    ou caminhos terminados em .db/.sqlite/.sqlite3 usam SQLite;
+    ``fragmentos://diretorio`` usa fragmentos ativos/arquivados; qualquer outro
+    caminho usa o arquivo JSON simples.
+    """
+    if arquivo_dados.startswith("fragmentos://"):
+        return GerenciadorDadosFragmentado(arquivo_dados[len("fragmentos://"):])
+    if arquivo_dados.startswith("sqlite://"):
+        return GerenciadorDadosSQLite(arquivo_dados[len("sqlite://"):])
+    if arquivo_dados.lower().endswith((".db", ".sqlite", ".sqlite3")):
+        return GerenciadorDadosSQLite(arquivo_dados)
+    if arquivo_dados.startswith("journal://"):
+        return GerenciadorDadosJournal(arquivo_dados[len("journal://"):])
+    return GerenciadorDados(arquivo_dados)
+
+
+# Full-text search
+class ResultadoBusca(list):
+    """Ids (ou resumos) encontrados por uma busca textual.
+
+    ``truncado`` indica que a consulta só tinha prefixos amplos e a varredura
+    parou em IndiceBusca.VARREDURA_MAXIMA tickets antes de completar o
+    limite: pode haver mais resultados, e a consulta deve ser refinada.
+    """
+
+    def __init__(self, itens: Iterable = (), truncado: bool = False):
+        super().__init__(itens)
+        self.truncado = truncado
+
+
+class IndiceBusca:
+    """Índice invertido sobre título, descrição, categoria e comentários.
+
+    Termos são normalizados (minúsculas, sem acentos) e cada termo da consulta
+    é tratado como prefixo, para busca enquanto o usuário digita. Um
+    vocabulário ordenado permite expandir prefixos com bisect; o termo mais
+    seletivo da consulta (menos postagens) seleciona os candidatos e os
+    demais são conferidos nos termos de cada candidato, então o custo
+    acompanha o tamanho do resultado.
+    """
+
+    _PALAVRA = re.compile(r"\w+")
+    # Acima desta quantidade de termos com o mesmo prefixo, o prefixo não é
+    # usado para selecionar candidatos (só para conferi-los)
+    FAIXA_MAXIMA = 64
+    # Se todos os prefixos da consulta são amplos, buscas com limite percorrem
+    # no máximo esta quantidade de tickets (ResultadoBusca.truncado)
+    VARREDURA_MAXIMA = 2000
+
+    def __init__(self):
+        self._postagens: Dict[str, Set[str]] = {}
+        self._vocabulario: List[str] = []
+        self._termos_ticket: Dict[str, Set[str]] = {}
+        self._ordem: Dict[str, int] = {}
+        self._proxima_ordem = 0
+        self.resumos: Dict[str, ResumoTicket] = {}
+
+    @staticmethod
+    def normalizar(texto: str) -> str:
+        decomposto = unicodedata.normalize("NFKD", texto.casefold())
+        return "".join(c for c in decomposto if not unicodedata.combining(c))
+
+    @classmethod
+    def termos(cls, texto: Optional[str]) -> List[str]:
+        return cls._PALAVRA.findall(cls.normalizar(texto)) if texto else []
+
+    def _termos_do_ticket(self, ticket: Ticket) -> Set[str]:
+        termos = set()
+        for texto in (ticket.titulo, ticket.descricao, ticket.categoria):
+            termos.update(self.termos(texto))
+        for comentario in ticket.comentarios:
+            termos.update(self.termos(comentario.get("conteudo")))
+        return termos
+
+    def atualizar(self, ticket_id: str, ticket: Optional[Ticket]):
+        """Reindexa um ticket (None = remover). Pode ser usado como ouvinte
+        do gerenciador de dados."""
+        novos = self._termos_do_ticket(ticket) if ticket else set()
+        antigos = self._termos_ticket.get(ticket_id, set())
+        for termo in antigos - novos:
+            ids = self._postagens[termo]
+            ids.discard(ticket_id)
+            if not ids:
+                del self._postagens[termo]
+                del self._vocabulario[bisect.bisect_left(self._vocabulario, termo)]
+        for termo in novos - antigos:
+            ids = self._postagens.get(termo)
+            if ids is None:
+                ids = self._postagens[termo] = set()
+                bisect.insort(self._vocabulario, termo)
+            ids.add(ticket_id)
+        if ticket is None:
+            self._termos_ticket.pop(ticket_id, None)
+            self._ordem.pop(ticket_id, None)
+            self.resumos.pop(ticket_id, None)
+        else:
+            self._termos_ticket[ticket_id] = novos
+            self.resumos[ticket_id] = ResumoTicket.de_ticket(ticket)
+            if ticket_id not in self._ordem:
+                self._ordem[ticket_id] = self._proxima_ordem
+                self._proxima_ordem += 1
+
+    def buscar(self, consulta: str, limite: Optional[int] = None) -> ResultadoBusca:
+        """Ids dos tickets que contêm todos os termos (como prefixo)."""
+        termos = sorted(set(self.termos(consulta)), key=len, reverse=True)
+        if not termos:
+            return ResultadoBusca()
+        seletivo = self._mais_seletivo(termos)
+        if seletivo is None:
+            if limite:
+                # Só prefixos muito amplos (ex.: "x y"): percorrer os tickets em
+                # ordem até completar o limite, com teto de VARREDURA_MAXIMA
+                return self._varrer(termos, limite)
+            seletivo = termos[0]
+        inicio, fim = self._faixa(seletivo)
+        candidatos = set()
+        for termo in self._vocabulario[inicio:fim]:
+            candidatos |= self._postagens[termo]
+        restantes = [t for t in termos if t != seletivo]
+        if restantes:
+            candidatos = [i for i in candidatos if self._contem_todos(self._termos_ticket[i], restantes)]
+        if limite:
+            return ResultadoBusca(heapq.nsmallest(limite, candidatos, key=self._ordem.__getitem__))
+        return ResultadoBusca(sorted(candidatos, key=self._ordem.__getitem__))
+
+    def _mais_seletivo(self, termos: List[str]) -> Optional[str]:
+        """Prefixo com menos postagens entre os de faixa até FAIXA_MAXIMA
+        (None se todos são mais amplos). Custa no máximo FAIXA_MAXIMA
+        consultas de tamanho por termo."""
+        melhor, menor = None, None
+        for termo in termos:
+            inicio, fim = self._faixa(termo)
+            if fim - inicio > self.FAIXA_MAXIMA:
+                continue
+            total = sum(len(self._postagens[t]) for t in self._vocabulario[inicio:fim])
+            if menor is None or total < menor:
+                melhor, menor = termo, total
+        return melhor
+
+    def _faixa(self, prefixo: str) -> Tuple[int, int]:
+        inicio = bisect.bisect_left(self._vocabulario, prefixo)
+        return inicio, bisect.bisect_left(self._vocabulario, prefixo + "\U0010ffff", inicio)
+
+    @staticmethod
+    def _contem_todos(termos_ticket: Set[str], prefixos: List[str]) -> bool:
+        return all(any(t.startswith(p) for t in termos_ticket) for p in prefixos)
+
+    def _varrer(self, termos: List[str], limite: int) -> ResultadoBusca:
+        """Primeiros ``limite`` tickets com todos os prefixos, examinando no
+        máximo VARREDURA_MAXIMA tickets (resultado marcado como truncado se
+        o teto for atingido: a consulta ainda é curta demais para ser seletiva)."""
+        encontrados = ResultadoBusca()
+        for ticket_id, termos_ticket in itertools.islice(self._termos_ticket.items(), self.VARREDURA_MAXIMA):
+            if self._contem_todos(termos_ticket, termos):
+                encontrados.append(ticket_id)
+                if len(encontrados) >= limite:
+                    return encontrados
+        encontrados.truncado = len(self._termos_ticket) > self.VARREDURA_MAXIMA
+        return encontrados
+
+    def __len__(self):
+        return len(self._termos_ticket)
+
+
+class ModeloListaTickets:
+    """Linhas da lista de tickets da GUI, ordenadas por uma coluna.
+
+    Mantém uma lista ordenada de chaves (valor da coluna, ordem de chegada,
+    id) com bisect: aplicar a alteração de um ticket custa O(log n) mais o
+    deslocamento da lista, e a tela consulta só a fatia visível. Ordenação
+    decrescente é lida de trás para frente, sem reordenar.
+    """
+
+    COLUNAS = ("ordem", "prioridade", "status", "idade")
+    _POSICAO_STATUS = {s.value: i for i, s in enumerate(StatusEnum)}
+
+    def __init__(self):
+        self._resumos: Dict[str, ResumoTicket] = {}
+        self._ordem: Dict[str, int] = {}
+        self._proxima_ordem = 0
+        self._chaves: List[tuple] = []
+        self.coluna = "ordem"
+        self.decrescente = False
+
+    def _chave(self, resumo: ResumoTicket) -> tuple:
+        ordem = self._ordem[resumo.id]
+        if self.coluna == "prioridade":
+            membro = PrioridadeEnum.__members__.get(resumo.prioridade)
+            valor = membro.value if membro else 0
+        elif self.coluna == "status":
+            valor = self._POSICAO_STATUS.get(resumo.status, len(self._POSICAO_STATUS))
+        elif self.coluna == "idade":
+            valor = resumo.criado_em or ""
+        else:
+            valor = ordem
+        return (valor, ordem, resumo.id)
+
+    def carregar(self, resumos: Iterable[ResumoTicket]):
+        """Substitui todas as linhas (carga inicial ou nova busca)."""
+        self._resumos = {}
+        self._ordem = {}
+        self._proxima_ordem = 0
+        for resumo in resumos:
+            self._resumos[resumo.id] = resumo
+            self._ordem[resumo.id] = self._proxima_ordem
+            self._proxima_ordem += 1
+        self._chaves = sorted(self._chave(r) for r in self._resumos.values())
+
+    def aplicar(self, ticket_id: str, resumo: Optional[ResumoTicket]):
+        """Atualiza uma linha (None = remover) sem tocar nas demais."""
+        anterior = self._resumos.get(ticket_id)
+        if anterior is not None:
+            del self._chaves[bisect.bisect_left(self._chaves, self._chave(anterior))]
+        if resumo is None:
+            self._resumos.pop(ticket_id, None)
+            self._ordem.pop(ticket_id, None)
+            return
+        if ticket_id not in self._ordem:
+            self._ordem[ticket_id] = self._proxima_ordem
+            self._proxima_ordem += 1
+        self._resumos[ticket_id] = resumo
+        bisect.insort(self._chaves, self._chave(resumo))
+
+    def ordenar(self, coluna: str, decrescente: bool = False):
+        if coluna not in self.COLUNAS:
+            raise ValueError(f"Coluna inválida: {coluna}")
+        if coluna != self.coluna:
+            self.coluna = coluna
+            self._chaves = sorted(self._chave(r) for r in self._resumos.values())
+        self.decrescente = decrescente
+
+    def fatia(self, inicio: int, quantidade: int) -> List[ResumoTicket]:
+        """Linhas [inicio, inicio + quantidade) na ordem exibida."""
+        total = len(self._chaves)
+        inicio = max(0, inicio)
+        fim = min(total, inicio + quantidade)
+        if self.decrescente:
+            chaves = self._chaves[total - fim:total - inicio][::-1]
+        else:
+            chaves = self._chaves[inicio:fim]
+        return [self._resumos[chave[2]] for chave in chaves]
+
+    def posicao(self, ticket_id: str) -> Optional[int]:
+        """Índice da linha na ordem exibida, ou None."""
+        resumo = self._resumos.get(ticket_id)
+        if resumo is None:
+            return None
+        indice = bisect.bisect_left(self._chaves, self._chave(resumo))
+        return len(self._chaves) - 1 - indice if self.decrescente else indice
+
+    def __contains__(self, ticket_id: str) -> bool:
+        return ticket_id in self._resumos
+
+    def __len__(self):
+        return len(self._chaves)
+
+
+class FilaTriagem:
+    """Tickets à espera de um agente, do mais urgente ao menos urgente.
+
+    Heap de chaves (-prioridade, criado_em, não reaberto, id): primeiro a
+    prioridade mais alta, depois o mais antigo e, no empate, o reaberto.
+    Entram na fila os tickets abertos ou reabertos sem responsável.
+    Alterações (atualizar, ouvinte do gerenciador) empilham a chave nova e
+    deixam a antiga no heap; entradas que não batem com ``_chaves`` são
+    descartadas ao chegar ao topo. Alterar e retirar custam O(log n).
+    """
+
+    STATUS_ELEGIVEIS = (StatusEnum.ABERTO.value, StatusEnum.REABERTO.value)
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._chaves: Dict[str, tuple] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def disponivel(cls, ticket) -> bool:
+        """Ticket (ou resumo) que pode ser entregue a um agente."""
+        return ticket.status in cls.STATUS_ELEGIVEIS and not ticket.atribuido_a
+
+    @staticmethod
+    def chave(ticket) -> tuple:
+        membro = PrioridadeEnum.__members__.get(ticket.prioridade)
+        return (-(membro.value if membro else 0), ticket.criado_em or "",
+                ticket.status != StatusEnum.REABERTO.value, ticket.id)
+
+    def carregar(self, tickets: Iterable):
+        with self._lock:
+            self._chaves = {t.id: self.chave(t) for t in tickets if self.disponivel(t)}
+            self._heap = list(self._chaves.values())
+            heapq.heapify(self._heap)
+
+    def atualizar(self, ticket_id: str, ticket):
+        """Aplica a alteração de um ticket (None = removido)."""
+        with self._lock:
+            chave = self.chave(ticket) if ticket is not None and self.disponivel(ticket) else None
+            if chave == self._chaves.get(ticket_id):
+                return
+            if chave is None:
+                del self._chaves[ticket_id]
+            else:
+                self._chaves[ticket_id] = chave
+                heapq.heappush(self._heap, chave)
+            # Reconstrói quando as entradas obsoletas passam das válidas
+            if len(self._heap) > 2 * len(self._chaves) + 64:
+                self._heap = list(self._chaves.values())
+                heapq.heapify(self._heap)
+
+    def retirar(self) -> Optional[str]:
+        """Remove e retorna o id do ticket mais urgente (None = fila vazia)."""
+        with self._lock:
+            while self._heap:
+                chave = heapq.heappop(self._heap)
+                if self._chaves.get(chave[-1]) == chave:
+                    del self._chaves[chave[-1]]
+                    return chave[-1]
+            return None
+
+    def __contains__(self, ticket_id: str) -> bool:
+        return ticket_id in self._chaves
+
+    def __len__(self):
+        return len(self._chaves)
+
+
+class BalanceadorAtribuicao:
+    """Carga de cada agente (tickets em aberto atribuídos a ele), para
+    atribuir automaticamente ao menos carregado.
+
+    ``agentes`` mapeia cada agente às categorias que atende (vazio = todas).
+    As cargas são mantidas por atualizar(), ouvinte do gerenciador, sem
+    recontar. Cada categoria tem um heap de (carga, agente) com remoção
+    preguiçosa, como FilaTriagem: escolher o agente custa O(log n).
+    Tickets sem categoria podem ir para qualquer agente.
+    """
+
+    TODAS = "*"
+    STATUS_ABERTOS = tuple(s.value for s in StatusEnum if s not in (StatusEnum.RESOLVIDO, StatusEnum.FECHADO))
+    # No rebalanceamento só mudam de agente tickets ainda não iniciados
+    STATUS_MOVIVEIS = FilaTriagem.STATUS_ELEGIVEIS
+
+    def __init__(self, agentes: Dict[str, Iterable[str]]):
+        self.agentes = {agente: tuple(categorias or ()) for agente, categorias in agentes.items()}
+        self._cargas: Dict[str, int] = {}
+        # id → (agente, categoria, status) dos tickets em aberto com responsável
+        self._tickets: Dict[str, Tuple[str, Optional[str], str]] = {}
+        self._por_agente: Dict[str, Set[str]] = {}
+        self._membros: Dict[Optional[str], List[str]] = {}
+        for agente in self.agentes:
+            for grupo in self._grupos(agente):
+                self._membros.setdefault(grupo, []).append(agente)
+        self._heaps: Dict[Optional[str], List[Tuple[int, str]]] = {}
+        self._lock = threading.RLock()
+        self._reconstruir()
+
+    def _grupos(self, agente: str) -> tuple:
+        return (self.agentes[agente] or (self.TODAS,)) + (None,)
+
+    def _reconstruir(self):
+        for grupo, membros in self._membros.items():
+            self._heaps[grupo] = [(self._cargas.get(a, 0), a) for a in membros]
+            heapq.heapify(self._heaps[grupo])
+
+    def carregar(self, tickets: Iterable):
+        with self._lock:
+            self._cargas, self._tickets, self._por_agente = {}, {}, {}
+            for ticket in tickets:
+                self.atualizar(ticket.id, ticket, empilhar=False)
+            self._reconstruir()
+
+    def atualizar(self, ticket_id: str, ticket, empilhar: bool = True):
+        """Aplica a alteração de um ticket (None = removido)."""
+        with self._lock:
+            novo = None
+            if ticket is not None and ticket.atribuido_a and ticket.status in self.STATUS_ABERTOS:
+                novo = (ticket.atribuido_a, ticket.categoria, ticket.status)
+            anterior = self._tickets.get(ticket_id)
+            if novo == anterior:
+                return
+            if anterior is not None:
+                del self._tickets[ticket_id]
+                self._por_agente[anterior[0]].discard(ticket_id)
+            if novo is not None:
+                self._tickets[ticket_id] = novo
+                self._por_agente.setdefault(novo[0], set()).add(ticket_id)
+            agente_anterior = anterior[0] if anterior else None
+            agente_novo = novo[0] if novo else None
+            if agente_anterior != agente_novo:
+                if agente_anterior:
+                    self._ajustar(agente_anterior, -1, empilhar)
+                if agente_novo:
+                    self._ajustar(agente_novo, 1, empilhar)
+
+    def _ajustar(self, agente: str, delta: int, empilhar: bool = True):
+        self._cargas[agente] = self._cargas.get(agente, 0) + delta
+        if not self._cargas[agente]:
+            del self._cargas[agente]
+            self._por_agente.pop(agente, None)
+        if not empilhar or agente not in self.agentes:
+            return
+        entrada = (self._cargas.get(agente, 0), agente)
+        for grupo in self._grupos(agente):
+            heap = self._heaps[grupo]
+            heapq.heappush(heap, entrada)
+            # Reconstrói quando as entradas obsoletas passam das válidas
+            if len(heap) > 2 * len(self._membros[grupo]) + 64:
+                self._heaps[grupo] = [(self._cargas.get(a, 0), a) for a in self._membros[grupo]]
+                heapq.heapify(self._heaps[grupo])
+
+    def _topo(self, grupo: Optional[str], excluir: Optional[str] = None) -> Optional[Tuple[int, str]]:
+        heap = self._heaps.get(grupo)
+        if not heap:
+            return None
+        retirados = []
+        try:
+            while heap:
+                carga, agente = heap[0]
+                if carga != self._cargas.get(agente, 0):
+                    heapq.heappop(heap)
+                elif agente == excluir:
+                    retirados.append(heapq.heappop(heap))
+                else:
+                    return heap[0]
+            return None
+        finally:
+            for entrada in retirados:
+                heapq.heappush(heap, entrada)
+
+    def escolher(self, categoria: Optional[str] = None, excluir: Optional[str] = None) -> Optional[str]:
+        """Agente menos carregado que atende a categoria (None = nenhum)."""
+        with self._lock:
+            if categoria is None:
+                candidatos = [self._topo(None, excluir)]
+            else:
+                candidatos = [self._topo(categoria, excluir), self._topo(self.TODAS, excluir)]
+            candidatos = [c for c in candidatos if c]
+            return min(candidatos)[1] if candidatos else None
+
+    def cargas(self) -> Dict[str, int]:
+        """Tickets em aberto por agente configurado."""
+        with self._lock:
+            return {agente: self._cargas.get(agente, 0) for agente in self.agentes}
+
+    def rebalancear(self) -> List[Tuple[str, str, str]]:
+        """Planeja e aplica às cargas a transferência de tickets não
+        iniciados dos agentes mais carregados para os menos carregados que
+        atendem a categoria, até nenhuma transferência reduzir a diferença.
+        Retorna [(ticket_id, origem, destino)] para serem gravados."""
+        with self._lock:
+            movimentos = []
+            maiores = [(-self._cargas.get(a, 0), a) for a in self.agentes]
+            heapq.heapify(maiores)
+            while maiores:
+                carga, origem = heapq.heappop(maiores)
+                if -carga != self._cargas.get(origem, 0):
+                    continue
+                for ticket_id in list(self._por_agente.get(origem, ())):
+                    _, categoria, status = self._tickets[ticket_id]
+                    if status not in self.STATUS_MOVIVEIS:
+                        continue
+                    destino = self.escolher(categoria, excluir=origem)
+                    if destino is None or self._cargas[origem] - self._cargas.get(destino, 0) < 2:
+                        continue
+                    self._tickets[ticket_id] = (destino, categoria, status)
+                    self._por_agente[origem].discard(ticket_id)
+                    self._por_agente.setdefault(destino, set()).add(ticket_id)
+                    self._ajustar(origem, -1)
+                    self._ajustar(destino, 1)
+                    movimentos.append((ticket_id, origem, destino))
+                    heapq.heappush(maiores, (-self._cargas.get(origem, 0), origem))
+                    heapq.heappush(maiores, (-self._cargas[destino], destino))
+                    break
+            return movimentos
+
+
+class AgendaSLA:
+    """Prazos de SLA dos tickets em aberto, num heap ordenado pelo prazo.
+
+    Metas por prioridade (primeira resposta, resolução):
+      - Resposta: ticket ainda "aberto" vence meta_resposta após a última
+        alteração (sem nenhuma ação, a própria criação).
+      - Resolução: ticket não resolvido/fechado vence meta_resolucao após a
+        criação, mas nunca antes de meta_resposta após a última alteração:
+        depois de uma escalada o ticket tem ao menos esse prazo na nova
+        prioridade, em vez de escalar de novo na mesma hora.
+    Em CRITICA o vencimento é registrado uma única vez: enquanto a última
+    alteração do ticket for esse registro (sla_vencido_em == atualizado_em),
+    ele não tem prazo e volta à agenda quando alguém o altera. Assim a
+    escalada não renova o próprio prazo indefinidamente.
+    O prazo depende só de campos do resumo, então a agenda é montada a
+    partir dos índices de status. Alterações chegam por atualizar()
+    (ouvinte do gerenciador), com remoção preguiçosa como FilaTriagem;
+    vencidos() retira só o topo do heap, nunca percorre todos os tickets.
+    """
+
+    METAS = {
+        PrioridadeEnum.CRITICA.name: (timedelta(hours=1), timedelta(hours=4)),
+        PrioridadeEnum.ALTA.name: (timedelta(hours=4), timedelta(hours=24)),
+        PrioridadeEnum.MEDIA.name: (timedelta(hours=8), timedelta(hours=72)),
+        PrioridadeEnum.BAIXA.name: (timedelta(hours=24), timedelta(hours=168)),
+    }
+    STATUS_ABERTOS = BalanceadorAtribuicao.STATUS_ABERTOS
+
+    def __init__(self, metas: Optional[Dict[str, Tuple[timedelta, timedelta]]] = None):
+        self.metas = metas or self.METAS
+        self._heap: List[Tuple[float, str, str]] = []
+        self._prazos: Dict[str, Tuple[float, str, str]] = {}
+        self._lock = threading.RLock()
+
+    def prazo(self, ticket) -> Optional[Tuple[float, str]]:
+        """(instante Unix do vencimento, "resposta" ou "resolução"), ou None."""
+        if ticket.status not in self.STATUS_ABERTOS:
+            return None
+        if ticket.sla_vencido_em and ticket.sla_vencido_em == ticket.atualizado_em:
+            return None
+        resposta, resolucao = self.metas.get(ticket.prioridade, self.metas[PrioridadeEnum.MEDIA.name])
+        # Datas inválidas ou misturando fuso e hora local ficam fora da agenda
+        try:
+            criado = datetime.fromisoformat(ticket.criado_em)
+            alterado = datetime.fromisoformat(ticket.atualizado_em or ticket.criado_em)
+            if ticket.status == StatusEnum.ABERTO.value:
+                return (alterado + resposta).timestamp(), "resposta"
+            return max(criado + resolucao, alterado + resposta).timestamp(), "resolução"
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    def carregar(self, tickets: Iterable):
+        with self._lock:
+            self._prazos = {}
+            for ticket in tickets:
+                prazo = self.prazo(ticket)
+                if prazo is not None:
+                    self._prazos[ticket.id] = (prazo[0], ticket.id, prazo[1])
+            self._heap = list(self._prazos.values())
+            heapq.heapify(self._heap)
+
+    def atualizar(self, ticket_id: str, ticket):
+        """Aplica a alteração de um ticket (None = removido)."""
+        with self._lock:
+            prazo = self.prazo(ticket) if ticket is not None else None
+            chave = (prazo[0], ticket_id, prazo[1]) if prazo else None
+            if chave == self._prazos.get(ticket_id):
+                return
+            if chave is None:
+                del self._prazos[ticket_id]
+            else:
+                self._prazos[ticket_id] = chave
+                heapq.heappush(self._heap, chave)
+            # Reconstrói quando as entradas obsoletas passam das válidas
+            if len(self._heap) > 2 * len(self._prazos) + 64:
+                self._heap = list(self._prazos.values())
+                heapq.heapify(self._heap)
+
+    def _limpar_topo(self):
+        while self._heap and self._prazos.get(self._heap[0][1]) != self._heap[0]:
+            heapq.heappop(self._heap)
+
+    def proximo(self) -> Optional[float]:
+        """Instante Unix do próximo vencimento (None = nenhum prazo)."""
+        with self._lock:
+            self._limpar_topo()
+            return self._heap[0][0] if self._heap else None
+
+    def vencidos(self, agora: float) -> List[str]:
+        """Retira e retorna os ids com prazo até ``agora``. Eles voltam à
+        agenda quando a escalada é gravada e notificada."""
+        with self._lock:
+            ids = []
+            self._limpar_topo()
+            while self._heap and self._heap[0][0] <= agora:
+                ids.append(heapq.heappop(self._heap)[1])
+                del self._prazos[ids[-1]]
+                self._limpar_topo()
+            return ids
+
+    def __contains__(self, ticket_id: str) -> bool:
+        return ticket_id in self._prazos
+
+    def __len__(self):
+        return len(self._prazos)
+
+
+class FilaTrabalho:
+    """Executa operações de armazenamento fora da thread da interface.
+
+    Um único trabalhador executa as tarefas na ordem de envio, então as
+    alterações continuam serializadas. Resultados (e chamadas agendadas com
+    no_principal) voltam por uma fila e são entregues por entregar(), que
+    deve ser chamada na thread principal — na GUI, via root.after.
+
+    Tarefas enviadas com a mesma chave se substituem: a anterior é
+    cancelada se ainda não começou, ou tem o resultado descartado.
+    """
+
+    def __init__(self):
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ticketflow")
+        self._resultados: "queue.Queue[tuple]" = queue.Queue()
+        self._geracoes: Dict[str, int] = {}
+        self._futuros: Dict[str, object] = {}
+        self.pendentes = 0
+
+    def enviar(self, funcao, *args, ao_concluir=None, ao_falhar=None, chave: Optional[str] = None):
+        geracao = None
+        if chave is not None:
+            geracao = self._geracoes.get(chave, 0) + 1
+            self._geracoes[chave] = geracao
+            anterior = self._futuros.pop(chave, None)
+            if anterior is not None and anterior.cancel():
+                self.pendentes -= 1
+        futuro = self._executor.submit(self._executar, funcao, args, ao_concluir, ao_falhar, chave, geracao)
+        self.pendentes += 1
+        if chave is not None:
+            self._futuros[chave] = futuro
+        return futuro
+
+    def _executar(self, funcao, args, ao_concluir, ao_falhar, chave, geracao):
+        try:
+            resultado = funcao(*args)
+        except Exception as e:
+            self._resultados.put(("resultado", ao_falhar or self._erro, e, chave, geracao))
+        else:
+            self._resultados.put(("resultado", ao_concluir, resultado, chave, geracao))
+
+    @staticmethod
+    def _erro(erro: Exception):
+        eventos.emitir("fila_trabalho", f"✗ Erro: {erro}", "erro")
+
+    def no_principal(self, funcao, *args):
+        """Agenda uma chamada para a próxima entrega na thread principal."""
+        self._resultados.put(("chamada", funcao, args))
+
+    def entregar(self, espera: Optional[float] = None) -> int:
+        """Executa os retornos prontos; retorna quantos foram processados.
+
+        Com espera, bloqueia até esse tempo pelo primeiro item.
+        """
+        processados = 0
+        while True:
+            try:
+                if espera is not None and not processados:
+                    item = self._resultados.get(timeout=espera)
+                else:
+                    item = self._resultados.get_nowait()
+            except queue.Empty:
+                return processados
+            processados += 1
+            if item[0] == "chamada":
+                item[1](*item[2])
+                continue
+            _, retorno, valor, chave, geracao = item
+            self.pendentes -= 1
+            if chave is not None:
+                if self._geracoes.get(chave) != geracao:
+                    continue  # substituída por uma tarefa mais nova
+                self._futuros.pop(chave, None)
+            if retorno is not None:
+                retorno(valor)
+
+    def aguardar(self, tempo_maximo: float = 10.0) -> bool:
+        """Entrega resultados até não haver tarefas pendentes."""
+        limite = time.monotonic() + tempo_maximo
+        while self.pendentes:
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                return False
+            self.entregar(espera=restante)
+        self.entregar()
+        return True
+
+    def encerrar(self):
+        self._executor.shutdown(wait=False)
+
+
+class ObservadorAlteracoes:
+    """Avisa quando os arquivos de dados mudam, sem ler o conteúdo.
+
+    No Linux usa inotify nos diretórios dos arquivos (renomear por cima,
+    acrescentar ao journal e incrementar a geração do bloqueio geram
+    eventos); nos demais sistemas compara mtime/tamanho a cada intervalo.
+    ``ao_alterar()`` é chamado na thread do observador, uma vez por rajada de
+    eventos: deve apenas agendar a sincronização do gerenciador de dados, que
+    então notifica os ouvintes só dos tickets criados, alterados e removidos.
+    """
+
+    _IN_MODIFY = 0x002
+    _IN_CLOSE_WRITE = 0x008
+    _IN_MOVED_TO = 0x080
+    _IN_CREATE = 0x100
+    _IN_DELETE = 0x200
+    _EVENTO = struct.Struct("iIII")
+    # Espera após o primeiro evento para agrupar os da mesma gravação
+    AGRUPAMENTO = 0.05
+
+    def __init__(self, caminhos: Iterable[str], ao_alterar, intervalo: float = 1.0):
+        self.caminhos = [os.path.abspath(c) for c in caminhos]
+        self.ao_alterar = ao_alterar
+        self.intervalo = intervalo
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify = None
+
+    def iniciar(self):
+        self._inotify = self._abrir_inotify()
+        self._thread = threading.Thread(target=self._executar, name="ticketflow-observador", daemon=True)
+        self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.intervalo + 1)
+        if self._inotify is not None:
+            os.close(self._inotify)
+            self._inotify = None
+
+    def _abrir_inotify(self) -> Optional[int]:
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            mascara = self._IN_MODIFY | self._IN_CLOSE_WRITE | self._IN_MOVED_TO | self._IN_CREATE | self._IN_DELETE
+            for diretorio in {os.path.dirname(c) for c in self.caminhos}:
+                if libc.inotify_add_watch(fd, os.fsencode(diretorio), mascara) < 0:
+                    os.close(fd)
+                    return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def _executar(self):
+        nomes = {os.path.basename(c) for c in self.caminhos}
+        anterior = self._assinaturas()
+        while not self._parar.is_set():
+            if self._inotify is not None:
+                prontos, _, _ = select.select([self._inotify], [], [], self.intervalo)
+                if not prontos or not self._ler_eventos(nomes):
+                    continue
+                self._parar.wait(self.AGRUPAMENTO)
+                self._ler_eventos(nomes)
+            else:
+                self._parar.wait(self.intervalo)
+                atual = self._assinaturas()
+                if atual == anterior:
+                    continue
+                anterior = atual
+            if not self._parar.is_set():
+                try:
+                    self.ao_alterar()
+                except Exception as e:
+                    eventos.emitir("observar_alteracoes", f"Erro ao notificar alteração: {e}", "erro")
+
+    def _ler_eventos(self, nomes: Set[str]) -> bool:
+        """Consome os eventos pendentes; True se algum é de um arquivo observado."""
+        relevante = False
+        while True:
+            try:
+                dados = os.read(self._inotify, 65536)
+            except BlockingIOError:
+                return relevante
+            posicao = 0
+            while posicao < len(dados):
+                _, _, _, tamanho = self._EVENTO.unpack_from(dados, posicao)
+                inicio = posicao + self._EVENTO.size
+                nome = os.fsdecode(dados[inicio:inicio + tamanho].rstrip(b"\0"))
+                relevante = relevante or nome in nomes
+                posicao = inicio + tamanho
+
+    def _assinaturas(self):
+        assinaturas = []
+        for caminho in self.caminhos:
+            try:
+                st = os.stat(caminho)
+                assinaturas.append((st.st_mtime_ns, st.st_size, st.st_ino))
+            except OSError:
+                assinaturas.append(None)
+        return assinaturas
+
+
 # Business logic (merged from sistema_tickets.py)
+class LoteAlteracoes:
+    """Tickets alterados dentro de SistemaTickets.lote(), gravados de uma vez."""
+
+    def __init__(self):
+        self.tickets: Dict[str, Ticket] = {}
+        self.gravado = False
+
+
 class SistemaTickets:
-    def __init__(self, arquivo_dados: str = "tickets.json"):
-        self.gerenciador = GerenciadorDados(arquivo_dados)
+    def __init__(self, arquivo_dados: Optional[str] = None, arquivo_agentes: Optional[str] = None):
+        arquivo_dados = arquivo_dados or os.environ.get("TICKETFLOW_DADOS", "tickets.json")
+        self.gerenciador = criar_gerenciador(arquivo_dados)
+        base = getattr(self.gerenciador, "arquivo_dados", None) or os.path.join(self.gerenciador.diretorio, "tickets")
+        self._ids = AlocadorIds(base + ".ids")
         self.usuario_atual = "admin"
+        self._lote: Optional[LoteAlteracoes] = None
+        self._indice_busca: Optional[IndiceBusca] = None
+        self._fila_triagem: Optional[FilaTriagem] = None
+        # Protege a montagem preguiçosa da fila de triagem e do balanceador
+        self._lock_estruturas = threading.Lock()
+        # Agentes e atribuição automática: {"automatico": bool, "agentes": {nome: [categorias]}}
+        self.arquivo_agentes = arquivo_agentes or os.environ.get("TICKETFLOW_AGENTES", "agentes.json")
+        self.agentes: Dict[str, List[str]] = {}
+        self.atribuicao_automatica = False
+        self._balanceamento: Optional[BalanceadorAtribuicao] = None
+        self._agenda_sla: Optional[AgendaSLA] = None
+        # Escalada automática nas interfaces e no servidor só com TICKETFLOW_SLA=1
+        # (abrir a CLI/GUI não altera dados); --sla roda o agendador dedicado
+        self.sla_ativo = os.environ.get("TICKETFLOW_SLA", "0") == "1"
+        if os.path.exists(self.arquivo_agentes):
+            with open(self.arquivo_agentes, 'r', encoding='utf-8') as f:
+                configuracao = json.load(f)
+            self.agentes = configuracao.get("agentes", {})
+            self.atribuicao_automatica = bool(configuracao.get("automatico", False))
 
     def definir_usuario(self, usuario: str):
         self.usuario_atual = usuario
 
+    @contextmanager
+    def lote(self):
+        """Agrupa várias alterações numa única gravação.
+
+        Dentro do bloco, criar/atualizar/atribuir/comentar apenas acumulam os
+        tickets alterados; ao sair eles são persistidos juntos. Se o bloco
+        levantar uma exceção, nada é gravado. Blocos aninhados reutilizam o
+        lote externo.
+        """
+        if self._lote is not None:
+            yield self._lote
+            return
+        lote = LoteAlteracoes()
+        self._lote = lote
+        try:
+            yield lote
+        finally:
+            self._lote = None
+        if lote.tickets:
+            lote.gravado = self.gerenciador.salvar_tickets(list(lote.tickets.values()))
+            if not lote.gravado:
+                # Cargas antecipadas por criar_ticket não chegaram ao disco
+                self._descartar_balanceador()
+                eventos.emitir(
+                    "lote", f"✗ Erro ao salvar o lote; {len(lote.tickets)} ticket(s) não gravado(s): "
+                    f"{', '.join(lote.tickets)}", "erro", usuario=self.usuario_atual)
+        else:
+            lote.gravado = True
+
+    def atualizar_em_lote(
+        self,
+        ticket_ids: Iterable[str],
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        atribuido_a: Optional[str] = None,
+        comentario: Optional[str] = None
+    ) -> Dict[str, bool]:
+        """Aplica as mesmas alterações a vários tickets com uma só gravação.
+
+        Retorna o resultado por ticket (False se não encontrado ou se a
+        gravação do lote falhar). Dentro de um lote externo a gravação só
+        acontece ao fim dele, e o resultado reflete apenas as alterações.
+        """
+        resultados = {}
+        aninhado = self._lote is not None
+        with self.lote() as lote:
+            for ticket_id in ticket_ids:
+                ok = self._obter_ticket(ticket_id) is not None
+                if ok and status:
+                    ok = self.atualizar_status(ticket_id, status)
+                if ok and prioridade:
+                    ok = self.atualizar_prioridade(ticket_id, prioridade)
+                if ok and atribuido_a:
+                    ok = self.atribuir_ticket(ticket_id, atribuido_a)
+                if ok and comentario:
+                    ok = self.adicionar_comentario(ticket_id, comentario)
+                resultados[ticket_id] = ok
+        if not aninhado and not lote.gravado:
+            return {ticket_id: False for ticket_id in resultados}
+        return resultados
+
+    def _obter_ticket(self, ticket_id: str) -> Optional[Ticket]:
+        if self._lote is not None and ticket_id in self._lote.tickets:
+            return self._lote.tickets[ticket_id]
+        return self.gerenciador.obter_ticket(ticket_id)
+
+    def _salvar_ticket(self, ticket: Ticket) -> bool:
+        if self._lote is not None:
+            self._lote.tickets[ticket.id] = ticket
+            return True
+        return self.gerenciador.salvar_ticket(ticket)
+
     def criar_ticket(
         self,
         titulo: str,
@@ -274,7 +3237,11 @@ class SistemaTickets:
         categoria: Optional[str] = None,
         atribuido_a: Optional[str] = None
     ) -> Ticket:
-        ticket_id = str(uuid.uuid4())[:8].upper()
+        inicio = time.perf_counter()
+        ticket_id = self._ids.novo()
+        automatico = atribuido_a is None and self.atribuicao_automatica
+        if automatico:
+            atribuido_a = self._balanceador().escolher(categoria)
         ticket = Ticket(
             id=ticket_id,
             titulo=titulo,
@@ -291,102 +3258,383 @@ class SistemaTickets:
             StatusEnum.ABERTO.value,
             f"Ticket criado com título: {titulo}"
         )
-        self.gerenciador.salvar_ticket(ticket)
-        print(f"✓ Ticket criado com sucesso: {ticket_id}")
+        if automatico and atribuido_a:
+            self._adicionar_historico(
+                ticket,
+                "atribuido_a",
+                None,
+                atribuido_a,
+                f"Ticket atribuído automaticamente para {atribuido_a}"
+            )
+            # A carga conta já (e não só na gravação), para que vários tickets
+            # criados no mesmo lote sejam distribuídos
+            self._balanceamento.atualizar(ticket_id, ticket)
+        if not self._salvar_ticket(ticket):
+            if automatico and atribuido_a:
+                self._descartar_balanceador()
+            eventos.emitir("criar_ticket", f"✗ Erro ao salvar o ticket {ticket_id}", "erro", ticket_id=ticket_id,
+                           inicio=inicio, usuario=self.usuario_atual)
+            return ticket
+        eventos.emitir("criar_ticket", f"✓ Ticket criado com sucesso: {ticket_id}", ticket_id=ticket_id,
+                       inicio=inicio, usuario=self.usuario_atual)
         return ticket
 
-    def atualizar_status(self, ticket_id: str, novo_status: str) -> bool:
-        ticket = self.gerenciador.obter_ticket(ticket_id)
-        if not ticket:
-            print(f"✗ Ticket {ticket_id} não encontrado")
+    def _alterar_ticket(self, op: str, ticket_id: str, alterar, inicio: float, mensagem: str) -> bool:
+        """Aplica ``alterar(ticket)`` e grava, emitindo o evento de ``op``.
+
+        Fora de lote() a leitura, a alteração e a gravação acontecem sob um
+        único bloqueio (atualizar_se): processos alterando o mesmo ticket não
+        perdem as alterações uns dos outros. Dentro de lote() a alteração só
+        é acumulada. Retorna False se o ticket não existe ou a gravação falha.
+        """
+        if self._lote is not None:
+            ticket = self._obter_ticket(ticket_id)
+            encontrado = ticket is not None
+            if encontrado:
+                alterar(ticket)
+            gravado = encontrado and self._salvar_ticket(ticket)
+        else:
+            encontrado = False
+
+            def aplicar(ticket: Ticket) -> bool:
+                nonlocal encontrado
+                encontrado = True
+                alterar(ticket)
+                return True
+            gravado = self.gerenciador.atualizar_se(ticket_id, aplicar) is not None
+        if not encontrado:
+            eventos.emitir(op, f"✗ Ticket {ticket_id} não encontrado", "aviso", ticket_id=ticket_id)
             return False
-        status_anterior = ticket.status
-        ticket.status = novo_status
-        ticket.atualizado_em = datetime.now().isoformat()
-        self._adicionar_historico(
-            ticket,
-            "status",
-            status_anterior,
-            novo_status,
-            f"Status alterado de {status_anterior} para {novo_status}"
-        )
-        self.gerenciador.salvar_ticket(ticket)
-        print(f"✓ Status do ticket {ticket_id} atualizado para: {novo_status}")
+        if not gravado:
+            eventos.emitir(op, f"✗ Erro ao salvar o ticket {ticket_id}", "erro",
+                           ticket_id=ticket_id, inicio=inicio, usuario=self.usuario_atual)
+            return False
+        eventos.emitir(op, mensagem, ticket_id=ticket_id, inicio=inicio, usuario=self.usuario_atual)
         return True
 
+    def atualizar_status(self, ticket_id: str, novo_status: str) -> bool:
+        inicio = time.perf_counter()
+
+        def alterar(ticket: Ticket):
+            status_anterior = ticket.status
+            ticket.status = novo_status
+            ticket.atualizado_em = datetime.now().isoformat()
+            self._adicionar_historico(
+                ticket,
+                "status",
+                status_anterior,
+                novo_status,
+                f"Status alterado de {status_anterior} para {novo_status}"
+            )
+        return self._alterar_ticket("atualizar_status", ticket_id, alterar, inicio,
+                                    f"✓ Status do ticket {ticket_id} atualizado para: {novo_status}")
+
     def atualizar_prioridade(self, ticket_id: str, nova_prioridade: str) -> bool:
-        ticket = self.gerenciador.obter_ticket(ticket_id)
-        if not ticket:
-            print(f"✗ Ticket {ticket_id} não encontrado")
+        inicio = time.perf_counter()
+
+        def alterar(ticket: Ticket):
+            prioridade_anterior = ticket.prioridade
+            ticket.prioridade = nova_prioridade
+            ticket.atualizado_em = datetime.now().isoformat()
+            self._adicionar_historico(
+                ticket,
+                "prioridade",
+                prioridade_anterior,
+                nova_prioridade,
+                f"Prioridade alterada de {prioridade_anterior} para {nova_prioridade}"
+            )
+        return self._alterar_ticket("atualizar_prioridade", ticket_id, alterar, inicio,
+                                    f"✓ Prioridade do ticket {ticket_id} atualizada para: {nova_prioridade}")
+
+    def atribuir_ticket(self, ticket_id: str, usuario: str) -> bool:
+        inicio = time.perf_counter()
+
+        def alterar(ticket: Ticket):
+            usuario_anterior = ticket.atribuido_a or "não atribuído"
+            ticket.atribuido_a = usuario
+            ticket.atualizado_em = datetime.now().isoformat()
+            self._adicionar_historico(
+                ticket,
+                "atribuido_a",
+                usuario_anterior,
+                usuario,
+                f"Ticket atribuído para {usuario}"
+            )
+        return self._alterar_ticket("atribuir_ticket", ticket_id, alterar, inicio,
+                                    f"✓ Ticket {ticket_id} atribuído para: {usuario}")
+
+    def adicionar_comentario(self, ticket_id: str, conteudo: str) -> bool:
+        inicio = time.perf_counter()
+
+        def alterar(ticket: Ticket):
+            comentario_id = self._ids.novo()
+            comentario = {
+                "id": comentario_id,
+                "data": datetime.now().isoformat(),
+                "usuario": self.usuario_atual,
+                "conteudo": conteudo,
+                "atualizado_em": None
+            }
+            ticket.comentarios.append(comentario)
+            ticket.atualizado_em = datetime.now().isoformat()
+            self._adicionar_historico(
+                ticket,
+                "comentario",
+                None,
+                comentario_id,
+                f"Comentário adicionado por {self.usuario_atual}"
+            )
+        return self._alterar_ticket("adicionar_comentario", ticket_id, alterar, inicio,
+                                    f"✓ Comentário adicionado ao ticket {ticket_id}")
+
+    def deletar_ticket(self, ticket_id: str) -> bool:
+        inicio = time.perf_counter()
+        if not self._obter_ticket(ticket_id):
+            eventos.emitir("deletar_ticket", f"✗ Ticket {ticket_id} não encontrado", "aviso", ticket_id=ticket_id)
             return False
-        prioridade_anterior = ticket.prioridade
-        ticket.prioridade = nova_prioridade
-        ticket.atualizado_em = datetime.now().isoformat()
-        self._adicionar_historico(
-            ticket,
-            "prioridade",
-            prioridade_anterior,
-            nova_prioridade,
-            f"Prioridade alterada de {prioridade_anterior} para {nova_prioridade}"
-        )
-        self.gerenciador.salvar_ticket(ticket)
-        print(f"✓ Prioridade do ticket {ticket_id} atualizada para: {nova_prioridade}")
+        if self._lote is not None:
+            self._lote.tickets.pop(ticket_id, None)
+        if not self.gerenciador.deletar_ticket(ticket_id):
+            return False
+        eventos.emitir("deletar_ticket", f"✓ Ticket {ticket_id} deletado", ticket_id=ticket_id,
+                       inicio=inicio, usuario=self.usuario_atual)
         return True
 
-    def atribuir_ticket(self, ticket_id: str, usuario: str) -> bool:
-        ticket = self.gerenciador.obter_ticket(ticket_id)
-        if not ticket:
-            print(f"✗ Ticket {ticket_id} não encontrado")
+    def _triagem(self) -> FilaTriagem:
+        """Fila de triagem, montada no primeiro uso e depois mantida pelas
+        notificações do gerenciador de dados."""
+        with self._lock_estruturas:
+            if self._fila_triagem is None:
+                fila = FilaTriagem()
+                fila.carregar(resumo for status in FilaTriagem.STATUS_ELEGIVEIS
+                              for resumo in self.gerenciador.filtrar_resumos(status=status))
+                self.gerenciador.assinar(fila.atualizar)
+                self._fila_triagem = fila
+        return self._fila_triagem
+
+    def proximo_ticket(self, usuario: Optional[str] = None) -> Optional[Ticket]:
+        """Reserva para ``usuario`` (padrão: o atual) o ticket mais urgente
+        sem responsável e o retorna (None = nenhum disponível).
+
+        A reserva atribui o ticket ao agente com atualizar_se: se outro
+        processo o pegou antes, ele é pulado e o seguinte é tentado, então
+        dois agentes nunca recebem o mesmo ticket. Grava na hora; não pode
+        ser usado dentro de lote().
+        """
+        if self._lote is not None:
+            raise RuntimeError("proximo_ticket não pode ser usado dentro de lote()")
+        inicio = time.perf_counter()
+        usuario = usuario or self.usuario_atual
+        fila = self._triagem()
+        self.gerenciador.sincronizar()
+
+        def reservar(ticket: Ticket) -> bool:
+            if not FilaTriagem.disponivel(ticket):
+                return False
+            ticket.atribuido_a = usuario
+            ticket.atualizado_em = datetime.now().isoformat()
+            self._adicionar_historico(ticket, "atribuido_a", None, usuario, f"Ticket reservado por {usuario}")
+            return True
+
+        while True:
+            ticket_id = fila.retirar()
+            if ticket_id is None:
+                eventos.emitir("proximo_ticket", "✗ Nenhum ticket aguardando atendimento", "aviso",
+                               inicio=inicio, usuario=usuario)
+                return None
+            ticket = self.gerenciador.atualizar_se(ticket_id, reservar)
+            if ticket is not None:
+                eventos.emitir("proximo_ticket", f"✓ Ticket {ticket_id} reservado para: {usuario}",
+                               ticket_id=ticket_id, inicio=inicio, usuario=usuario)
+                return ticket
+            atual = self.gerenciador.obter_ticket(ticket_id)
+            if atual is not None and FilaTriagem.disponivel(atual):
+                # Continua livre: a gravação falhou, o ticket volta para a fila
+                fila.atualizar(ticket_id, atual)
+                return None
+
+    def liberar_ticket(self, ticket_id: str, usuario: Optional[str] = None) -> bool:
+        """Devolve à fila um ticket reservado por ``usuario`` (padrão: o atual)."""
+        if self._lote is not None:
+            raise RuntimeError("liberar_ticket não pode ser usado dentro de lote()")
+        inicio = time.perf_counter()
+        usuario = usuario or self.usuario_atual
+
+        def liberar(ticket: Ticket) -> bool:
+            if ticket.atribuido_a != usuario:
+                return False
+            ticket.atribuido_a = None
+            ticket.atualizado_em = datetime.now().isoformat()
+            self._adicionar_historico(ticket, "atribuido_a", usuario, None, f"Ticket liberado por {usuario}")
+            return True
+
+        if self.gerenciador.atualizar_se(ticket_id, liberar) is None:
+            eventos.emitir("liberar_ticket", f"✗ Ticket {ticket_id} não encontrado ou não reservado por {usuario}",
+                           "aviso", ticket_id=ticket_id, usuario=usuario)
             return False
-        usuario_anterior = ticket.atribuido_a or "não atribuído"
-        ticket.atribuido_a = usuario
-        ticket.atualizado_em = datetime.now().isoformat()
-        self._adicionar_historico(
-            ticket,
-            "atribuido_a",
-            usuario_anterior,
-            usuario,
-            f"Ticket atribuído para {usuario}"
-        )
-        self.gerenciador.salvar_ticket(ticket)
-        print(f"✓ Ticket {ticket_id} atribuído para: {usuario}")
+        eventos.emitir("liberar_ticket", f"✓ Ticket {ticket_id} devolvido à fila", ticket_id=ticket_id,
+                       inicio=inicio, usuario=usuario)
         return True
 
-    def adicionar_comentario(self, ticket_id: str, conteudo: str) -> bool:
-        ticket = self.gerenciador.obter_ticket(ticket_id)
-        if not ticket:
-            print(f"✗ Ticket {ticket_id} não encontrado")
+    def definir_agentes(self, agentes: Dict[str, Iterable[str]], automatico: bool = True) -> bool:
+        """Define os agentes e as categorias que cada um atende (vazio =
+        todas) e liga/desliga a atribuição automática dos tickets novos.
+        A configuração é gravada em ``arquivo_agentes``."""
+        agentes = {nome: list(categorias or ()) for nome, categorias in agentes.items()}
+        try:
+            gravar_json_atomico(self.arquivo_agentes, {"automatico": automatico, "agentes": agentes})
+        except Exception as e:
+            eventos.emitir("definir_agentes", f"✗ Erro ao salvar agentes: {e}", "erro")
             return False
-        comentario_id = str(uuid.uuid4())[:8]
-        comentario = {
-            "id": comentario_id,
-            "data": datetime.now().isoformat(),
-            "usuario": self.usuario_atual,
-            "conteudo": conteudo,
-            "atualizado_em": None
-        }
-        ticket.comentarios.append(comentario)
-        ticket.atualizado_em = datetime.now().isoformat()
-        self._adicionar_historico(
-            ticket,
-            "comentario",
-            None,
-            comentario_id,
-            f"Comentário adicionado por {self.usuario_atual}"
-        )
-        self.gerenciador.salvar_ticket(ticket)
-        print(f"✓ Comentário adicionado ao ticket {ticket_id}")
+        self.agentes = agentes
+        self.atribuicao_automatica = automatico
+        self._descartar_balanceador()
+        eventos.emitir("definir_agentes", f"✓ {len(agentes)} agente(s) configurado(s); atribuição automática "
+                                          f"{'ligada' if automatico else 'desligada'}")
         return True
 
+    def _balanceador(self) -> BalanceadorAtribuicao:
+        """Cargas dos agentes, montadas no primeiro uso a partir dos tickets
+        em aberto e depois mantidas pelas notificações do gerenciador."""
+        with self._lock_estruturas:
+            if self._balanceamento is None:
+                balanceador = BalanceadorAtribuicao(self.agentes)
+                balanceador.carregar(resumo for status in BalanceadorAtribuicao.STATUS_ABERTOS
+                                     for resumo in self.gerenciador.filtrar_resumos(status=status))
+                self.gerenciador.assinar(balanceador.atualizar)
+                self._balanceamento = balanceador
+        return self._balanceamento
+
+    def _descartar_balanceador(self):
+        with self._lock_estruturas:
+            if self._balanceamento is not None:
+                self.gerenciador.cancelar_assinatura(self._balanceamento.atualizar)
+                self._balanceamento = None
+
+    def cargas_agentes(self) -> Dict[str, int]:
+        """Tickets em aberto por agente configurado."""
+        self.gerenciador.sincronizar()
+        return self._balanceador().cargas()
+
+    def rebalancear_atribuicoes(self) -> List[Tuple[str, str, str]]:
+        """Transfere tickets não iniciados dos agentes sobrecarregados para os
+        menos carregados da mesma categoria, numa única gravação.
+        Retorna [(ticket_id, origem, destino)]."""
+        if self._lote is not None:
+            raise RuntimeError("rebalancear_atribuicoes não pode ser usado dentro de lote()")
+        inicio = time.perf_counter()
+        self.gerenciador.sincronizar()
+        movimentos = self._balanceador().rebalancear()
+        if not movimentos:
+            eventos.emitir("rebalancear_atribuicoes", "✓ Carga dos agentes já está equilibrada", inicio=inicio)
+            return []
+        with self.lote() as lote:
+            for ticket_id, origem, destino in movimentos:
+                self.atribuir_ticket(ticket_id, destino)
+        if not lote.gravado:
+            eventos.emitir("rebalancear_atribuicoes", "✗ Erro ao gravar o rebalanceamento", "erro", inicio=inicio)
+            return []
+        eventos.emitir("rebalancear_atribuicoes", f"✓ {len(movimentos)} ticket(s) redistribuído(s)",
+                       inicio=inicio, movimentos=len(movimentos))
+        return movimentos
+
+    def _agenda(self) -> AgendaSLA:
+        """Agenda de SLA, montada no primeiro uso a partir dos tickets em
+        aberto e depois mantida pelas notificações do gerenciador."""
+        with self._lock_estruturas:
+            if self._agenda_sla is None:
+                agenda = AgendaSLA()
+                agenda.carregar(resumo for status in AgendaSLA.STATUS_ABERTOS
+                                for resumo in self.gerenciador.filtrar_resumos(status=status))
+                self.gerenciador.assinar(agenda.atualizar)
+                self._agenda_sla = agenda
+        return self._agenda_sla
+
+    def proximo_prazo_sla(self) -> Optional[datetime]:
+        """Próximo vencimento de SLA entre os tickets em aberto."""
+        self.gerenciador.sincronizar()
+        proximo = self._agenda().proximo()
+        return datetime.fromtimestamp(proximo) if proximo is not None else None
+
+    def verificar_sla(self, agora: Optional[datetime] = None) -> List[Ticket]:
+        """Escala os tickets com SLA vencido e retorna os alterados.
+
+        Abaixo de CRITICA a prioridade sobe um nível; em CRITICA o ticket é
+        reatribuído ao agente menos carregado da categoria (se houver
+        agentes) ou só registra a violação. Cada escalada entra no histórico
+        como usuário "sla"; a nova prioridade ganha o seu prazo, mas em
+        CRITICA a violação é registrada uma vez só, até a próxima alteração
+        feita por outra pessoa (ver AgendaSLA). Só os tickets vencidos são
+        lidos, e todos são gravados juntos com atualizar_varios_se, que
+        confere o vencimento nos dados atuais: dois processos verificando
+        ao mesmo tempo não escalam o mesmo ticket duas vezes.
+        """
+        if self._lote is not None:
+            raise RuntimeError("verificar_sla não pode ser usado dentro de lote()")
+        agora = agora or datetime.now()
+        agenda = self._agenda()
+        self.gerenciador.sincronizar()
+        vencidos = agenda.vencidos(agora.timestamp())
+        if not vencidos:
+            return []
+        prioridades = [p.name for p in PrioridadeEnum]
+        balanceador = self._balanceador() if self.agentes else None
+        reatribuidos = []
+
+        def escalar(ticket: Ticket) -> bool:
+            prazo = agenda.prazo(ticket)
+            if prazo is None or prazo[0] > agora.timestamp():
+                return False
+            tipo = prazo[1]
+            posicao = prioridades.index(ticket.prioridade) if ticket.prioridade in prioridades else 0
+            destino = None
+            if posicao + 1 < len(prioridades):
+                anterior, ticket.prioridade = ticket.prioridade, prioridades[posicao + 1]
+                self._adicionar_historico(
+                    ticket, "prioridade", anterior, ticket.prioridade,
+                    f"SLA de {tipo} vencido: prioridade elevada de {anterior} para {ticket.prioridade}", "sla")
+            else:
+                destino = balanceador.escolher(ticket.categoria, excluir=ticket.atribuido_a) if balanceador else None
+                if destino:
+                    anterior, ticket.atribuido_a = ticket.atribuido_a, destino
+                    self._adicionar_historico(
+                        ticket, "atribuido_a", anterior, destino,
+                        f"SLA de {tipo} vencido: ticket reatribuído para {destino}", "sla")
+                else:
+                    self._adicionar_historico(ticket, "sla", None, tipo, f"SLA de {tipo} vencido", "sla")
+            ticket.atualizado_em = agora.isoformat()
+            if posicao + 1 >= len(prioridades):
+                ticket.sla_vencido_em = ticket.atualizado_em
+            if destino:
+                # Conta já, para não mandar todos os reatribuídos ao mesmo agente
+                balanceador.atualizar(ticket.id, ticket)
+                reatribuidos.append(ticket.id)
+            return True
+
+        escalados = self.gerenciador.atualizar_varios_se(vencidos, escalar)
+        alterados = {t.id for t in escalados}
+        for ticket_id in vencidos:
+            if ticket_id not in alterados and ticket_id not in agenda:
+                # Não escalado (já tratado por outro processo ou falha ao
+                # gravar): volta à agenda com o prazo dos dados atuais
+                agenda.atualizar(ticket_id, self.gerenciador.obter_ticket(ticket_id))
+        if reatribuidos and not escalados:
+            # A gravação falhou depois das cargas antecipadas
+            self._descartar_balanceador()
+        for ticket in escalados:
+            eventos.emitir("verificar_sla", f"⏰ SLA vencido: {ticket.id} → {ticket.historico[-1]['descricao']}",
+                           "aviso", ticket_id=ticket.id, prioridade=ticket.prioridade)
+        return escalados
+
     def obter_historico(self, ticket_id: str) -> List[dict]:
-        ticket = self.gerenciador.obter_ticket(ticket_id)
+        ticket = self._obter_ticket(ticket_id)
         if not ticket:
-            print(f"✗ Ticket {ticket_id} não encontrado")
+            eventos.emitir("obter_historico", f"✗ Ticket {ticket_id} não encontrado", "aviso", ticket_id=ticket_id)
             return []
         return ticket.historico
 
     def visualizar_ticket(self, ticket_id: str) -> Optional[str]:
-        ticket = self.gerenciador.obter_ticket(ticket_id)
+        ticket = self._obter_ticket(ticket_id)
         if not ticket:
             return f"✗ Ticket {ticket_id} não encontrado"
         info = f"""
@@ -427,16 +3675,101 @@ class SistemaTickets:
         self,
         status: Optional[str] = None,
         prioridade: Optional[str] = None,
-        usuario: Optional[str] = None
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None,
+        ordenar_por: Optional[str] = None,
+        decrescente: bool = False,
+        desde=None,
+        ate=None,
+        limite: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> List[Ticket]:
-        tickets = self.gerenciador.obter_todos_tickets()
-        if status:
-            tickets = [t for t in tickets if t.status == status]
-        if prioridade:
-            tickets = [t for t in tickets if t.prioridade == prioridade]
-        if usuario:
-            tickets = [t for t in tickets if t.atribuido_a == usuario]
-        return tickets
+        """Lista tickets filtrados.
+
+        Com ordenar_por ("criado_em" ou "atualizado_em"), desde/ate (ISO ou
+        datetime, intervalo [desde, ate)), limite ou cursor, a listagem vem
+        do índice de tempo e retorna uma Pagina: ``pagina.cursor`` busca a
+        próxima página (None = fim).
+        """
+        with perfil.medir("sistema.listar"):
+            if ordenar_por or desde or ate or limite or cursor:
+                return self._paginar(False, status, prioridade, usuario, categoria,
+                                     ordenar_por, decrescente, desde, ate, limite, cursor)
+            return self.gerenciador.filtrar_tickets(
+                status=status,
+                prioridade=prioridade,
+                usuario=usuario,
+                categoria=categoria
+            )
+
+    def _paginar(self, resumos, status, prioridade, usuario, categoria,
+                 ordenar_por, decrescente, desde, ate, limite, cursor) -> Pagina:
+        return self.gerenciador.paginar(
+            campo=ordenar_por or "criado_em",
+            decrescente=decrescente,
+            desde=desde.isoformat() if isinstance(desde, datetime) else desde,
+            ate=ate.isoformat() if isinstance(ate, datetime) else ate,
+            limite=limite,
+            cursor=cursor,
+            status=status,
+            prioridade=prioridade,
+            usuario=usuario,
+            categoria=categoria,
+            resumos=resumos
+        )
+
+    def buscar_tickets(self, consulta: str, limite: Optional[int] = None) -> ResultadoBusca:
+        """Busca textual (título, descrição, categoria e comentários).
+
+        O índice é montado na primeira busca e depois mantido pelas
+        notificações do gerenciador de dados. Com ``limite``, uma consulta só
+        de prefixos amplos pode voltar parcial (``truncado``; ver ResultadoBusca).
+        """
+        if self._indice_busca is None:
+            with perfil.medir("busca.indexar"):
+                indice = IndiceBusca()
+                for ticket in self.gerenciador.obter_todos_tickets():
+                    indice.atualizar(ticket.id, ticket)
+            self.gerenciador.assinar(indice.atualizar)
+            self._indice_busca = indice
+        self.gerenciador.sincronizar()
+        with perfil.medir("busca.consultar"):
+            ids = self._indice_busca.buscar(consulta, limite)
+            return ResultadoBusca((self._indice_busca.resumos[i] for i in ids), ids.truncado)
+
+    def observar_alteracoes(self, ao_alterar, intervalo: float = 1.0) -> ObservadorAlteracoes:
+        """Inicia um observador dos arquivos de dados. ``ao_alterar()`` roda na
+        thread do observador e deve agendar ``gerenciador.sincronizar()``,
+        que notifica os ouvintes só dos tickets que mudaram."""
+        observador = ObservadorAlteracoes(self.gerenciador.arquivos_observados(), ao_alterar, intervalo)
+        observador.iniciar()
+        return observador
+
+    def listar_resumos(
+        self,
+        status: Optional[str] = None,
+        prioridade: Optional[str] = None,
+        usuario: Optional[str] = None,
+        categoria: Optional[str] = None,
+        ordenar_por: Optional[str] = None,
+        decrescente: bool = False,
+        desde=None,
+        ate=None,
+        limite: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> List[ResumoTicket]:
+        """Listagem leve (sem histórico/comentários) para as telas de lista.
+        Aceita a mesma ordenação e paginação de listar_tickets."""
+        with perfil.medir("sistema.listar_resumos"):
+            if ordenar_por or desde or ate or limite or cursor:
+                return self._paginar(True, status, prioridade, usuario, categoria,
+                                     ordenar_por, decrescente, desde, ate, limite, cursor)
+            return self.gerenciador.filtrar_resumos(
+                status=status,
+                prioridade=prioridade,
+                usuario=usuario,
+                categoria=categoria
+            )
 
     def _adicionar_historico(
         self,
@@ -444,11 +3777,12 @@ class SistemaTickets:
         campo: str,
         valor_anterior: Optional[str],
         valor_novo: str,
-        descricao: str
+        descricao: str,
+        usuario: Optional[str] = None
     ):
         historico_entrada = {
             "data": datetime.now().isoformat(),
-            "usuario": self.usuario_atual,
+            "usuario": usuario or self.usuario_atual,
             "campo": campo,
             "valor_anterior": valor_anterior,
             "valor_novo": valor_novo,
@@ -459,8 +3793,12 @@ class SistemaTickets:
     def obter_estatisticas(self) -> Dict:
         return self.gerenciador.gerar_relatorio()
 
+    def verificar_estatisticas(self, corrigir: bool = True) -> Dict:
+        return self.gerenciador.verificar_estatisticas(corrigir=corrigir)
+
     def gerar_relatorio_completo(self) -> str:
-        stats = self.obter_estatisticas()
+        with perfil.medir("sistema.relatorio"):
+            stats = self.obter_estatisticas()
         relatorio = """
 ╔════════════════════════════════════════════════════════════════════╗
 ║                   RELATÓRIO DO SISTEMA DE TICKETS                  ║
@@ -488,13 +3826,649 @@ class SistemaTickets:
         relatorio += "\n╚════════════════════════════════════════════════════════════════════╝"
         return relatorio
 
+    def importar_tickets(self, caminho: str, formato: Optional[str] = None,
+                         tamanho_lote: int = 1000, progresso=None) -> Dict[str, int]:
+        """Importa tickets de um arquivo JSONL ou CSV ("-" = entrada padrão).
+
+        Os registros são lidos e validados um por vez e gravados em lotes de
+        ``tamanho_lote`` (uma gravação por lote), então a memória do processo
+        de importação não cresce com o arquivo. Registros inválidos são
+        ignorados e relatados com o número da linha; registros sem id recebem
+        um novo. Um registro cujo id já existe (gravado antes ou repetido no
+        próprio arquivo) substitui o ticket e é contado em "substituidos", não
+        em "importados". ``progresso(total, segundos)`` é chamado após cada
+        lote. Se um lote não puder ser gravado, levanta IOError; os lotes
+        anteriores permanecem gravados.
+
+        Retorna {"importados", "substituidos", "invalidos", "lotes"}.
+        """
+        if self._lote is not None:
+            raise RuntimeError("importar_tickets não pode ser usado dentro de lote()")
+        formato = formato_troca(caminho, formato)
+        inicio = time.perf_counter()
+        resultado = {"importados": 0, "substituidos": 0, "invalidos": 0, "lotes": 0}
+        # id → (ticket, linha); um id repetido no mesmo lote fica com a última linha
+        lote: Dict[str, Tuple[Ticket, int]] = {}
+        substituidos = 0
+
+        def gravar():
+            nonlocal substituidos
+            existentes = sum(1 for ticket_id in lote if self.gerenciador.contem(ticket_id))
+            if not self.gerenciador.salvar_tickets([ticket for ticket, _ in lote.values()]):
+                raise IOError(f"falha ao gravar o lote {resultado['lotes'] + 1} de {caminho} "
+                              f"({resultado['importados'] + resultado['substituidos']} tickets já gravados)")
+            resultado["importados"] += len(lote) - existentes
+            resultado["substituidos"] += existentes + substituidos
+            resultado["lotes"] += 1
+            lote.clear()
+            substituidos = 0
+            if progresso:
+                progresso(resultado["importados"] + resultado["substituidos"], time.perf_counter() - inicio)
+
+        with abrir_troca(caminho, "r") as arquivo:
+            for numero, registro in ler_registros(arquivo, formato):
+                try:
+                    ticket = Ticket.validar(decodificar_registro(registro, formato))
+                except ValueError as e:
+                    resultado["invalidos"] += 1
+                    eventos.emitir("importar_tickets", f"✗ Linha {numero} ignorada: {e}", "aviso", linha=numero)
+                    continue
+                ticket.id = ticket.id or self._ids.novo()
+                if ticket.id in lote:
+                    substituidos += 1
+                    eventos.emitir("importar_tickets", f"✗ Linha {numero}: id {ticket.id} repetido na linha "
+                                   f"{lote[ticket.id][1]}; a linha {numero} prevalece", "aviso",
+                                   ticket_id=ticket.id, linha=numero)
+                lote[ticket.id] = (ticket, numero)
+                if len(lote) >= tamanho_lote:
+                    gravar()
+            if lote:
+                gravar()
+        eventos.emitir("importar_tickets", f"✓ {resultado['importados']} ticket(s) importado(s) de {caminho}"
+                       f" ({resultado['substituidos']} substituído(s), {resultado['invalidos']} inválido(s))",
+                       inicio=inicio, **resultado)
+        return resultado
+
+    def exportar_tickets(self, caminho: str, formato: Optional[str] = None,
+                         progresso=None, intervalo_progresso: int = 1000) -> int:
+        """Exporta todos os tickets para JSONL ou CSV ("-" = saída padrão).
+
+        Os tickets vêm de gerenciador.iterar_tickets() e são gravados um por
+        vez, sem montar a lista completa. ``progresso(total, segundos)`` é
+        chamado a cada ``intervalo_progresso`` tickets e ao final.
+        Retorna a quantidade exportada.
+        """
+        formato = formato_troca(caminho, formato)
+        inicio = time.perf_counter()
+        total = 0
+        with abrir_troca(caminho, "w") as arquivo:
+            escrever = escritor_registros(arquivo, formato)
+            for ticket in self.gerenciador.iterar_tickets():
+                escrever(ticket)
+                total += 1
+                if progresso and total % intervalo_progresso == 0:
+                    progresso(total, time.perf_counter() - inicio)
+        if progresso:
+            progresso(total, time.perf_counter() - inicio)
+        eventos.emitir("exportar_tickets", f"✓ {total} ticket(s) exportado(s) para {caminho}",
+                       inicio=inicio, exportados=total)
+        return total
+
+# HTTP/JSON API (python main.py --serve)
+class ErroRequisicao(Exception):
+    """Erro devolvido ao cliente HTTP com o status indicado."""
+
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+
+
+class ServidorHTTP:
+    """API HTTP/JSON sobre SistemaTickets, em asyncio e sem dependências.
+
+    Rotas:
+        POST /tickets                      {titulo, descricao, prioridade?, categoria?, atribuido_a?}
+        GET  /tickets?status=&prioridade=&usuario=&categoria=&busca=
+             [&ordenar_por=&decrescente=1&desde=&ate=&limite=&cursor=]  → {itens, cursor}
+        GET  /tickets/{id}
+        POST /tickets/{id}/status          {status}
+        POST /tickets/{id}/prioridade      {prioridade}
+        POST /tickets/{id}/atribuir        {usuario}
+        POST /tickets/{id}/comentarios     {conteudo}
+        GET  /tickets/{id}/historico
+        POST /tickets/{id}/liberar         (devolve à fila um ticket reservado pelo autor)
+        POST /fila/proximo                 (reserva para o autor o ticket mais urgente)
+        GET  /relatorio
+
+    Alterações aceitam ``autor`` no corpo (padrão "api"). Todo acesso ao
+    armazenamento roda numa única thread de executor, fora do loop de
+    eventos. As alterações passam por uma fila consumida por uma só tarefa
+    de escrita, que agrupa as que chegaram juntas em SistemaTickets.lote():
+    sob carga, várias requisições custam uma única gravação.
+    """
+
+    ROTAS = [
+        ("POST", re.compile(r"/tickets"), "_criar"),
+        ("GET", re.compile(r"/tickets"), "_listar"),
+        ("GET", re.compile(r"/tickets/(?P<ticket_id>[^/]+)"), "_obter"),
+        ("POST", re.compile(r"/tickets/(?P<ticket_id>[^/]+)/status"), "_status"),
+        ("POST", re.compile(r"/tickets/(?P<ticket_id>[^/]+)/prioridade"), "_prioridade"),
+        ("POST", re.compile(r"/tickets/(?P<ticket_id>[^/]+)/atribuir"), "_atribuir"),
+        ("POST", re.compile(r"/tickets/(?P<ticket_id>[^/]+)/comentarios"), "_comentar"),
+        ("GET", re.compile(r"/tickets/(?P<ticket_id>[^/]+)/historico"), "_historico"),
+        ("POST", re.compile(r"/tickets/(?P<ticket_id>[^/]+)/liberar"), "_liberar"),
+        ("POST", re.compile(r"/fila/proximo"), "_proximo"),
+        ("GET", re.compile(r"/relatorio"), "_relatorio"),
+    ]
+    MOTIVOS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+    TAMANHO_MAXIMO = 1024 * 1024
+    # Máximo de alterações gravadas juntas pela tarefa de escrita
+    LOTE_MAXIMO = 256
+    AUTOR_PADRAO = "api"
+    # Segundos entre verificações dos prazos de SLA
+    INTERVALO_SLA = 60.0
+
+    def __init__(self, sistema: "SistemaTickets", host: str = "127.0.0.1", porta: int = 8080):
+        self.sistema = sistema
+        self.host = host
+        self.porta = porta
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ticketflow-api")
+        self._fila: Optional["asyncio.Queue"] = None
+        self._servidor = None
+        self._escritor = None
+        self._vigia_sla = None
+
+    async def iniciar(self):
+        import asyncio
+        self._fila = asyncio.Queue()
+        self._escritor = asyncio.ensure_future(self._escrever())
+        if self.sistema.sla_ativo:
+            self._vigia_sla = asyncio.ensure_future(self._vigiar_sla())
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        self.porta = self._servidor.sockets[0].getsockname()[1]
+
+    async def encerrar(self):
+        self._servidor.close()
+        await self._servidor.wait_closed()
+        self._escritor.cancel()
+        if self._vigia_sla:
+            self._vigia_sla.cancel()
+        self._executor.shutdown(wait=True)
+
+    async def servir(self):
+        await self.iniciar()
+        print(f"🌐 TicketFlow API em http://{self.host}:{self.porta}")
+        try:
+            await self._servidor.serve_forever()
+        finally:
+            await self.encerrar()
+
+    # Protocolo
+    async def _atender(self, leitor: "asyncio.StreamReader", escritor: "asyncio.StreamWriter"):
+        import asyncio
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha.strip():
+                    break
+                manter = False
+                inicio = time.perf_counter()
+                metodo = alvo = None
+                try:
+                    metodo, alvo, versao = linha.decode("latin-1").split()
+                    cabecalhos = {}
+                    while True:
+                        cabecalho = await leitor.readline()
+                        if cabecalho in (b"\r\n", b"\n", b""):
+                            break
+                        nome, _, valor = cabecalho.decode("latin-1").partition(":")
+                        cabecalhos[nome.strip().lower()] = valor.strip()
+                    manter = versao == "HTTP/1.1" and cabecalhos.get("connection", "").lower() != "close"
+                    tamanho = int(cabecalhos.get("content-length") or 0)
+                    if tamanho > self.TAMANHO_MAXIMO:
+                        manter = False
+                        raise ErroRequisicao(413, "corpo grande demais")
+                    corpo = await leitor.readexactly(tamanho) if tamanho else b""
+                    status, resposta = await self._despachar(metodo, alvo, corpo)
+                except ErroRequisicao as e:
+                    status, resposta = e.status, {"erro": str(e)}
+                except ValueError:
+                    manter = False
+                    status, resposta = 400, {"erro": "requisição malformada"}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception as e:
+                    eventos.emitir("http", f"Erro na requisição: {e}", "erro", metodo=metodo, caminho=alvo)
+                    status, resposta = 500, {"erro": "erro interno"}
+                self._responder(escritor, status, resposta, manter)
+                eventos.emitir("http", f"{metodo} {alvo} → {status}", "debug", inicio=inicio,
+                               metodo=metodo, caminho=alvo, status=status)
+                await escritor.drain()
+                if not manter:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+    def _responder(self, escritor: "asyncio.StreamWriter", status: int, resposta, manter: bool):
+        corpo = json.dumps(resposta, ensure_ascii=False).encode("utf-8")
+        escritor.write(
+            f"HTTP/1.1 {status} {self.MOTIVOS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(corpo)}\r\n"
+            f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode("latin-1") + corpo
+        )
+
+    async def _despachar(self, metodo: str, alvo: str, corpo: bytes):
+        from urllib.parse import urlsplit, parse_qs, unquote
+        partes = urlsplit(alvo)
+        caminho = unquote(partes.path).rstrip("/") or "/"
+        consulta = {k: v[-1] for k, v in parse_qs(partes.query).items()}
+        metodo_encontrado = False
+        for metodo_rota, padrao, nome in self.ROTAS:
+            encontrado = padrao.fullmatch(caminho)
+            if not encontrado:
+                continue
+            metodo_encontrado = True
+            if metodo_rota == metodo:
+                dados = json.loads(corpo) if corpo else {}
+                if not isinstance(dados, dict):
+                    raise ErroRequisicao(400, "o corpo deve ser um objeto JSON")
+                return await getattr(self, nome)(consulta=consulta, dados=dados, **encontrado.groupdict())
+        if metodo_encontrado:
+            raise ErroRequisicao(405, f"método {metodo} não permitido")
+        raise ErroRequisicao(404, f"rota {caminho} não encontrada")
+
+    # Acesso ao armazenamento
+    async def _ler(self, funcao, *args):
+        import asyncio
+        return await asyncio.get_running_loop().run_in_executor(self._executor, lambda: funcao(*args))
+
+    async def _alterar(self, operacao):
+        import asyncio
+        futuro = asyncio.get_running_loop().create_future()
+        await self._fila.put((operacao, futuro))
+        return await futuro
+
+    async def _escrever(self):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        while True:
+            pendentes = [await self._fila.get()]
+            while len(pendentes) < self.LOTE_MAXIMO and not self._fila.empty():
+                pendentes.append(self._fila.get_nowait())
+            try:
+                resultados = await loop.run_in_executor(
+                    self._executor, self._aplicar_lote, [operacao for operacao, _ in pendentes])
+            except Exception as e:
+                resultados = [e] * len(pendentes)
+            for (_, futuro), resultado in zip(pendentes, resultados):
+                if futuro.done():
+                    continue
+                if isinstance(resultado, Exception):
+                    futuro.set_exception(resultado)
+                else:
+                    futuro.set_result(resultado)
+
+    async def _vigiar_sla(self):
+        """Escala tickets com SLA vencido; roda no executor, entre os lotes."""
+        import asyncio
+        while True:
+            try:
+                await self._ler(self.sistema.verificar_sla)
+            except Exception as e:
+                eventos.emitir("verificar_sla", f"Erro ao verificar SLA: {e}", "erro")
+            await asyncio.sleep(self.INTERVALO_SLA)
+
+    def _aplicar_lote(self, operacoes) -> list:
+        """Aplica as operações com uma única gravação. Se a gravação falhar,
+        cada operação é repetida sozinha, para que uma requisição com problema
+        não derrube as demais do lote."""
+        resultados = []
+        with self.sistema.lote() as lote:
+            for operacao in operacoes:
+                try:
+                    resultados.append(operacao())
+                except Exception as e:
+                    resultados.append(e)
+        if lote.gravado:
+            return resultados
+        if len(operacoes) == 1:
+            return [ErroRequisicao(500, "falha ao gravar")]
+        return [self._aplicar_lote([operacao])[0] for operacao in operacoes]
+
+    def _operacao(self, ticket_id: str, dados: Dict, metodo, *args):
+        """Operação da fila de escrita: aplica ``metodo(ticket_id, *args)``
+        como o autor da requisição e devolve o ticket resultante."""
+        autor = str(dados.get("autor") or self.AUTOR_PADRAO)
+
+        def operacao():
+            self.sistema.definir_usuario(autor)
+            if not metodo(ticket_id, *args):
+                raise ErroRequisicao(404, f"ticket {ticket_id} não encontrado")
+            return self.sistema._obter_ticket(ticket_id).to_dict()
+        return operacao
+
+    @staticmethod
+    def _campo(dados: Dict, nome: str, opcoes: Optional[Iterable[str]] = None) -> str:
+        valor = dados.get(nome)
+        if not isinstance(valor, str) or not valor.strip():
+            raise ErroRequisicao(400, f"campo '{nome}' obrigatório")
+        if opcoes is not None and valor not in opcoes:
+            raise ErroRequisicao(400, f"'{nome}' inválido: {valor}")
+        return valor.strip()
+
+    @staticmethod
+    def _campo_opcional(dados: Dict, nome: str) -> Optional[str]:
+        valor = dados.get(nome)
+        if valor is not None and not isinstance(valor, str):
+            raise ErroRequisicao(400, f"'{nome}' deve ser texto")
+        return valor.strip() or None if valor else None
+
+    # Rotas
+    async def _criar(self, consulta, dados):
+        titulo = self._campo(dados, "titulo")
+        descricao = self._campo(dados, "descricao")
+        prioridade = self._campo_opcional(dados, "prioridade") or PrioridadeEnum.MEDIA.name
+        if prioridade not in PrioridadeEnum.__members__:
+            raise ErroRequisicao(400, f"'prioridade' inválido: {prioridade}")
+        categoria = self._campo_opcional(dados, "categoria")
+        atribuido_a = self._campo_opcional(dados, "atribuido_a")
+        autor = str(dados.get("autor") or self.AUTOR_PADRAO)
+
+        def operacao():
+            self.sistema.definir_usuario(autor)
+            return self.sistema.criar_ticket(
+                titulo=titulo, descricao=descricao, prioridade=prioridade,
+                categoria=categoria, atribuido_a=atribuido_a
+            ).to_dict()
+        return 201, await self._alterar(operacao)
+
+    async def _listar(self, consulta, dados):
+        if consulta.get("busca"):
+            resumos = await self._ler(self.sistema.buscar_tickets, consulta["busca"])
+        elif {"ordenar_por", "desde", "ate", "limite", "cursor"} & consulta.keys():
+            try:
+                limite = int(consulta["limite"]) if consulta.get("limite") else None
+                pagina = await self._ler(lambda: self.sistema.listar_resumos(
+                    status=consulta.get("status"), prioridade=consulta.get("prioridade"),
+                    usuario=consulta.get("usuario"), categoria=consulta.get("categoria"),
+                    ordenar_por=consulta.get("ordenar_por"), decrescente=consulta.get("decrescente") == "1",
+                    desde=consulta.get("desde"), ate=consulta.get("ate"), limite=limite,
+                    cursor=consulta.get("cursor")))
+            except ValueError as e:
+                raise ErroRequisicao(400, str(e))
+            return 200, {"itens": [asdict(r) for r in pagina], "cursor": pagina.cursor}
+        else:
+            resumos = await self._ler(lambda: self.sistema.listar_resumos(
+                status=consulta.get("status"), prioridade=consulta.get("prioridade"),
+                usuario=consulta.get("usuario"), categoria=consulta.get("categoria")))
+        return 200, [asdict(r) for r in resumos]
+
+    async def _obter(self, consulta, dados, ticket_id):
+        ticket = await self._ler(self.sistema.gerenciador.obter_ticket, ticket_id)
+        if ticket is None:
+            raise ErroRequisicao(404, f"ticket {ticket_id} não encontrado")
+        return 200, ticket.to_dict()
+
+    async def _status(self, consulta, dados, ticket_id):
+        status = self._campo(dados, "status", [s.value for s in StatusEnum])
+        return 200, await self._alterar(self._operacao(ticket_id, dados, self.sistema.atualizar_status, status))
+
+    async def _prioridade(self, consulta, dados, ticket_id):
+        prioridade = self._campo(dados, "prioridade", PrioridadeEnum.__members__)
+        return 200, await self._alterar(
+            self._operacao(ticket_id, dados, self.sistema.atualizar_prioridade, prioridade))
+
+    async def _atribuir(self, consulta, dados, ticket_id):
+        usuario = self._campo(dados, "usuario")
+        return 200, await self._alterar(self._operacao(ticket_id, dados, self.sistema.atribuir_ticket, usuario))
+
+    async def _comentar(self, consulta, dados, ticket_id):
+        conteudo = self._campo(dados, "conteudo")
+        return 201, await self._alterar(
+            self._operacao(ticket_id, dados, self.sistema.adicionar_comentario, conteudo))
+
+    async def _liberar(self, consulta, dados, ticket_id):
+        autor = str(dados.get("autor") or self.AUTOR_PADRAO)
+        if not await self._ler(self._como_autor, autor, self.sistema.liberar_ticket, ticket_id):
+            raise ErroRequisicao(404, f"ticket {ticket_id} não reservado por {autor}")
+        return 200, (await self._ler(self.sistema.gerenciador.obter_ticket, ticket_id)).to_dict()
+
+    async def _proximo(self, consulta, dados):
+        ticket = await self._ler(self._como_autor, str(dados.get("autor") or self.AUTOR_PADRAO),
+                                 self.sistema.proximo_ticket)
+        if ticket is None:
+            raise ErroRequisicao(404, "nenhum ticket aguardando atendimento")
+        return 200, ticket.to_dict()
+
+    def _como_autor(self, autor: str, metodo, *args):
+        """Reservas gravam na hora (fora de lote()): rodam direto no executor,
+        que também executa os lotes da tarefa de escrita, um de cada vez."""
+        self.sistema.definir_usuario(autor)
+        return metodo(*args)
+
+    async def _historico(self, consulta, dados, ticket_id):
+        ticket = await self._ler(self.sistema.gerenciador.obter_ticket, ticket_id)
+        if ticket is None:
+            raise ErroRequisicao(404, f"ticket {ticket_id} não encontrado")
+        return 200, ticket.to_dict()["historico"]
+
+    async def _relatorio(self, consulta, dados):
+        return 200, await self._ler(self.sistema.obter_estatisticas)
+
+
+def executar_troca(acao: str, argumentos: List[str]):
+    """python main.py --import|--export arquivo [--formato jsonl|csv] [--lote N]
+
+    Mensagens e progresso vão para a saída de erro, deixando a saída padrão
+    livre para ``--export -``.
+    """
+    caminho = argumentos[0]
+    opcoes = dict(zip(argumentos[1::2], argumentos[2::2]))
+    formato = opcoes.get("--formato")
+    eventos.silenciar()
+    eventos.apresentar(ApresentadorTerminal("info", sys.stderr))
+
+    def progresso(total: int, segundos: float):
+        print(f"  {total} tickets ({total / max(segundos, 1e-9):.0f}/s)", file=sys.stderr, flush=True)
+
+    sistema = SistemaTickets()
+    if acao == "--import":
+        sistema.importar_tickets(caminho, formato, int(opcoes.get("--lote", 1000)), progresso)
+    else:
+        sistema.exportar_tickets(caminho, formato, progresso)
+
+
+def executar_servidor(host: str = "127.0.0.1", porta: int = 8080, arquivo_dados: Optional[str] = None):
+    import asyncio
+    # Sob carga, só avisos e erros chegam ao terminal; o resto fica no log (TICKETFLOW_LOG)
+    eventos.silenciar()
+    eventos.apresentar(ApresentadorTerminal("aviso"))
+    servidor = ServidorHTTP(SistemaTickets(arquivo_dados), host, porta)
+    try:
+        asyncio.run(servidor.servir())
+    except KeyboardInterrupt:
+        print("\n✓ Servidor encerrado")
+
+
+def executar_agendador_sla(intervalo: float = 60.0, arquivo_dados: Optional[str] = None):
+    """Processo dedicado ao SLA: dorme até o próximo vencimento (no máximo
+    ``intervalo`` segundos, para perceber tickets de outros processos) e
+    escala os tickets vencidos."""
+    sistema = SistemaTickets(arquivo_dados)
+    print("⏰ Agendador de SLA ativo (Ctrl+C para encerrar)")
+    try:
+        while True:
+            sistema.verificar_sla()
+            proximo = sistema.proximo_prazo_sla()
+            espera = intervalo if proximo is None else (proximo - datetime.now()).total_seconds()
+            time.sleep(min(intervalo, max(1.0, espera)))
+    except KeyboardInterrupt:
+        print("\n✓ Agendador encerrado")
+
+
 # Embedded compact GUI + CLI (merged to reduce file count)
-import tkinter as tk
-from tkinter import Tk, Frame, Listbox, Scrollbar, Button, Label, Entry, Text, END, Toplevel, StringVar, OptionMenu, messagebox, simpledialog
+def carregar_tk():
+    """Importa o tkinter quando a primeira janela é aberta.
+
+    O núcleo (modelos, gerenciadores, SistemaTickets, UserManager), a CLI e
+    o servidor não dependem de interface gráfica: importar este módulo não
+    carrega o tkinter, e servidores sem as bibliotecas do Tk continuam
+    funcionando. Os nomes ficam disponíveis como globais do módulo.
+    """
+    global tk, Tk, Frame, Scrollbar, Button, Label, Entry, Text, END, Toplevel, StringVar, OptionMenu
+    global messagebox, simpledialog, ttk
+    if "Tk" in globals():
+        return
+    try:
+        import tkinter as tk
+        from tkinter import Tk, Frame, Scrollbar, Button, Label, Entry, Text, END, Toplevel, StringVar, OptionMenu, messagebox, simpledialog, ttk
+    except ImportError as e:
+        raise RuntimeError(f"interface gráfica indisponível ({e}); use --cli ou --serve") from e
+
+
+class ListaVirtual:
+    """Treeview que desenha só as linhas visíveis de um ModeloListaTickets.
+
+    A árvore tem um conjunto fixo de itens (um por linha visível) cujos
+    valores são trocados ao rolar; a barra de rolagem representa a posição
+    na lista inteira. Redesenhar custa o número de linhas na tela, não o
+    número de tickets.
+    """
+
+    # (coluna da árvore, título, largura, coluna de ordenação do modelo)
+    COLUNAS = (
+        ("id", "ID", 125, "ordem"),
+        ("titulo", "Título", 180, None),
+        ("status", "Status", 95, "status"),
+        ("prioridade", "Prioridade", 75, "prioridade"),
+        ("criado_em", "Criado", 110, "idade"),
+    )
+    ALTURA_LINHA = 20
+
+    def __init__(self, pai, modelo: ModeloListaTickets, ao_abrir):
+        self.modelo = modelo
+        self.inicio = 0
+        self.linhas = 20
+        self._selecionado: Optional[str] = None
+        self._ids_visiveis: List[str] = []
+        self.frame = Frame(pai, bg="white")
+        self.arvore = ttk.Treeview(self.frame, columns=[c[0] for c in self.COLUNAS],
+                                   show="headings", selectmode="browse")
+        for nome, titulo, largura, coluna in self.COLUNAS:
+            comando = (lambda c=coluna: self.ordenar(c)) if coluna else ""
+            self.arvore.heading(nome, text=titulo, command=comando)
+            self.arvore.column(nome, width=largura, minwidth=40, stretch=(nome == "titulo"))
+        self.barra = Scrollbar(self.frame, command=self._rolar)
+        self.arvore.pack(side="left", fill="both", expand=True)
+        self.barra.pack(side="left", fill="y")
+        self.arvore.bind("<Configure>", self._redimensionar)
+        self.arvore.bind("<<TreeviewSelect>>", self._ao_selecionar)
+        self.arvore.bind("<Double-Button-1>", lambda e: ao_abrir())
+        self.arvore.bind("<MouseWheel>", lambda e: self._rolar("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.arvore.bind("<Button-4>", lambda e: self._rolar("scroll", -1, "units"))
+        self.arvore.bind("<Button-5>", lambda e: self._rolar("scroll", 1, "units"))
+        self.arvore.bind("<Up>", lambda e: self._mover_selecao(-1))
+        self.arvore.bind("<Down>", lambda e: self._mover_selecao(1))
+
+    def selecionado(self) -> Optional[str]:
+        if self._selecionado is not None and self._selecionado not in self.modelo:
+            self._selecionado = None
+        return self._selecionado
+
+    def renderizar(self):
+        total = len(self.modelo)
+        self.inicio = max(0, min(self.inicio, total - self.linhas))
+        resumos = self.modelo.fatia(self.inicio, self.linhas)
+        itens = self.arvore.get_children()
+        for iid in itens[len(resumos):]:
+            self.arvore.delete(iid)
+        for i, resumo in enumerate(resumos):
+            valores = (resumo.id, resumo.titulo, resumo.status, resumo.prioridade,
+                       (resumo.criado_em or "")[:16].replace("T", " "))
+            if i < len(itens):
+                self.arvore.item(itens[i], values=valores)
+            else:
+                self.arvore.insert("", END, iid=str(i), values=valores)
+        self._ids_visiveis = [r.id for r in resumos]
+        selecionado = self.selecionado()
+        if selecionado in self._ids_visiveis:
+            self.arvore.selection_set(str(self._ids_visiveis.index(selecionado)))
+        elif self.arvore.selection():
+            self.arvore.selection_remove(*self.arvore.selection())
+        if total:
+            self.barra.set(self.inicio / total, min(1.0, (self.inicio + self.linhas) / total))
+        else:
+            self.barra.set(0.0, 1.0)
+
+    def ordenar(self, coluna: str):
+        decrescente = not self.modelo.decrescente if coluna == self.modelo.coluna else False
+        self.modelo.ordenar(coluna, decrescente)
+        for nome, titulo, _, col in self.COLUNAS:
+            seta = (" ▼" if decrescente else " ▲") if col == coluna else ""
+            self.arvore.heading(nome, text=titulo + seta)
+        self.inicio = 0
+        self.mostrar(self.selecionado())
+
+    def mostrar(self, ticket_id: Optional[str]):
+        """Rola até a linha do ticket (se houver) e redesenha."""
+        posicao = self.modelo.posicao(ticket_id) if ticket_id else None
+        if posicao is not None and not self.inicio <= posicao < self.inicio + self.linhas:
+            self.inicio = posicao - self.linhas // 2
+        self.renderizar()
+
+    def _ao_selecionar(self, evento=None):
+        selecao = self.arvore.selection()
+        if selecao and int(selecao[0]) < len(self._ids_visiveis):
+            self._selecionado = self._ids_visiveis[int(selecao[0])]
+
+    def _mover_selecao(self, passo: int):
+        atual = self.modelo.posicao(self.selecionado()) if self.selecionado() else None
+        destino = 0 if atual is None else min(max(atual + passo, 0), len(self.modelo) - 1)
+        linha = self.modelo.fatia(destino, 1)
+        if linha:
+            self._selecionado = linha[0].id
+            self.mostrar(self._selecionado)
+        return "break"
+
+    def _rolar(self, acao, quantidade, unidade=None):
+        if acao == "moveto":
+            self.inicio = int(float(quantidade) * len(self.modelo))
+        elif acao == "scroll":
+            passo = self.linhas - 1 if unidade == "pages" else 1
+            self.inicio += int(quantidade) * passo
+        self.renderizar()
+
+    def _redimensionar(self, evento):
+        linhas = max(1, (evento.height - self.ALTURA_LINHA) // self.ALTURA_LINHA)
+        if linhas != self.linhas:
+            self.linhas = linhas
+            self.renderizar()
 
 
 class InterfaceGUI:
+    # Espera após a última tecla antes de consultar o índice de busca
+    ATRASO_BUSCA_MS = 200
+    # Máximo de resultados exibidos por busca
+    LIMITE_BUSCA = 500
+    # A lista é carregada em páginas: a primeira aparece sem esperar as demais
+    TAMANHO_PAGINA = 2000
+    # Intervalo de consulta aos resultados da fila de trabalho
+    INTERVALO_ENTREGA_MS = 30
+    # Indicador da barra de estado; avisos (ex.: busca parcial) ficam até a
+    # próxima operação em vez de serem apagados junto com ele
+    CARREGANDO = "⏳ Carregando..."
+    # Sem tarefas pendentes, a fila só recebe avisos do observador de arquivos
+    INTERVALO_OCIOSO_MS = 250
+    # Verificação dos prazos de SLA (só os tickets vencidos são lidos)
+    INTERVALO_SLA_MS = 60000
+
     def __init__(self):
+        carregar_tk()
         self.sistema = SistemaTickets()
         self.root = Tk()
         self.root.title("TicketFlow - Gerenciador de Chamados")
@@ -508,8 +4482,25 @@ class InterfaceGUI:
         self.warning_color = "#f39c12"
         self.root.configure(bg=self.bg_color)
         self.usuario_atual = StringVar(value="Usuário")
+        self.estado = StringVar(value="")
+        self._busca_agendada = None
+        self._desenho_agendado = None
+        self._entrega_agendada = None
+        self._consulta = ""
+        self.modelo = ModeloListaTickets()
+        self.trabalho = FilaTrabalho()
         self._build_ui()
+        # Avisos e erros das operações aparecem no cabeçalho
+        eventos.apresentar(self._apresentar_evento)
+        # As notificações chegam na thread de trabalho; a lista é alterada na principal
+        self.sistema.gerenciador.assinar(
+            lambda i, t: self.trabalho.no_principal(self._ao_alterar_ticket, i, ResumoTicket.de_ticket(t) if t else None))
+        # Gravações de outras janelas/processos chegam como linhas alteradas
+        self.observador = self.sistema.observar_alteracoes(
+            lambda: self.trabalho.no_principal(self._alteracao_externa))
         self._refresh_list()
+        if self.sistema.sla_ativo:
+            self._verificar_sla()
 
     def _build_ui(self):
         header = Frame(self.root, bg=self.sidebar_color, height=48)
@@ -517,11 +4508,12 @@ class InterfaceGUI:
         header.pack_propagate(False)
         Label(header, text="🎫 TicketFlow", bg=self.sidebar_color, fg="white", font=("Helvetica", 14, "bold")).pack(side="left", padx=12)
         Label(header, textvariable=self.usuario_atual, bg=self.sidebar_color, fg="white").pack(side="right", padx=12)
+        Label(header, textvariable=self.estado, bg=self.sidebar_color, fg=self.warning_color).pack(side="right", padx=12)
 
         main_content = Frame(self.root, bg=self.bg_color)
         main_content.pack(fill="both", expand=True)
 
-        left_panel = Frame(main_content, bg=self.sidebar_color, width=340)
+        left_panel = Frame(main_content, bg=self.sidebar_color, width=480)
         left_panel.pack(side="left", fill="y")
         left_panel.pack_propagate(False)
 
@@ -540,19 +4532,16 @@ class InterfaceGUI:
         Entry(search_frame, textvariable=self.search_var).pack(fill="x", pady=4)
 
         Label(left_panel, text="Tickets", bg=self.sidebar_color, fg="white").pack(anchor="w", padx=8, pady=(6, 0))
-        list_frame = Frame(left_panel, bg="white")
-        list_frame.pack(fill="both", expand=True, padx=8, pady=8)
-        self.listbox = Listbox(list_frame)
-        self.listbox.pack(side="left", fill="both", expand=True)
-        self.listbox.bind("<Double-Button-1>", lambda e: self._visualizar())
-        Scrollbar(list_frame, command=self.listbox.yview).pack(side="left", fill="y")
+        self.lista = ListaVirtual(left_panel, self.modelo, self._visualizar)
+        self.lista.frame.pack(fill="both", expand=True, padx=8, pady=8)
 
         btn_frame = Frame(left_panel, bg=self.sidebar_color)
         btn_frame.pack(fill="x", padx=8, pady=8)
+        Button(btn_frame, text="Próximo Ticket", command=self._proximo_ticket, bg=self.success_color, fg="white").pack(fill="x", pady=2)
         Button(btn_frame, text="Novo", command=self._novo_ticket, bg=self.button_color, fg="white").pack(fill="x", pady=2)
         Button(btn_frame, text="Visualizar", command=self._visualizar, bg=self.button_color, fg="white").pack(fill="x", pady=2)
         Button(btn_frame, text="Relatório", command=self._gerar_relatorio, bg=self.button_color, fg="white").pack(fill="x", pady=2)
-        Button(btn_frame, text="Atualizar", command=self._refresh_list, bg="#95a5a6", fg="white").pack(fill="x", pady=2)
+        Button(btn_frame, text="Atualizar", command=self._atualizar_lista, bg="#95a5a6", fg="white").pack(fill="x", pady=2)
 
         right_panel = Frame(main_content, bg="white")
         right_panel.pack(side="right", fill="both", expand=True, padx=10, pady=10)
@@ -562,24 +4551,111 @@ class InterfaceGUI:
         actions = Frame(right_panel, bg="white")
         actions.pack(fill="x")
         Button(actions, text="Atribuir", command=self._atribuir, bg=self.button_color, fg="white").pack(side="left", padx=4)
+        Button(actions, text="Devolver", command=self._liberar_ticket, bg="#95a5a6", fg="white").pack(side="left", padx=4)
         Button(actions, text="Status", command=self._atualizar_status, bg=self.button_color, fg="white").pack(side="left", padx=4)
         Button(actions, text="Prioridade", command=self._atualizar_prioridade, bg=self.warning_color, fg="white").pack(side="left", padx=4)
         Button(actions, text="Comentar", command=self._adicionar_comentario, bg=self.button_color, fg="white").pack(side="left", padx=4)
         Button(actions, text="Deletar", command=self._deletar_ticket, bg=self.danger_color, fg="white").pack(side="left", padx=4)
 
+    def _filtrar_lista(self):
+        """Agenda a busca (debounce) para não consultar a cada tecla."""
+        if self._busca_agendada is not None:
+            self.root.after_cancel(self._busca_agendada)
+        self._busca_agendada = self.root.after(self.ATRASO_BUSCA_MS, self._refresh_list)
+
+    def _executar(self, funcao, *args, ao_concluir=None, chave=None):
+        """Executa uma operação do SistemaTickets na fila de trabalho."""
+        self.trabalho.enviar(funcao, *args, ao_concluir=ao_concluir, ao_falhar=self._mostrar_erro, chave=chave)
+        self.estado.set(self.CARREGANDO)
+        self._agendar_entrega()
+
+    def _agendar_entrega(self):
+        if self._entrega_agendada is not None:
+            self.root.after_cancel(self._entrega_agendada)
+        intervalo = self.INTERVALO_ENTREGA_MS if self.trabalho.pendentes else self.INTERVALO_OCIOSO_MS
+        self._entrega_agendada = self.root.after(intervalo, self._entregar)
+
+    def _entregar(self):
+        self._entrega_agendada = None
+        self.trabalho.entregar()
+        if not self.trabalho.pendentes and self.estado.get() == self.CARREGANDO:
+            self.estado.set("")
+        self._agendar_entrega()
+
+    def _verificar_sla(self):
+        self.trabalho.enviar(self.sistema.verificar_sla, ao_falhar=self._mostrar_erro, chave="sla")
+        self._agendar_entrega()
+        self.root.after(self.INTERVALO_SLA_MS, self._verificar_sla)
+
+    def _alteracao_externa(self):
+        self._executar(self.sistema.gerenciador.sincronizar, chave="sincronizar")
+
+    def _mostrar_erro(self, erro):
+        messagebox.showerror("Erro", str(erro))
+
     def _refresh_list(self, *a):
-        tickets = self.sistema.listar_tickets()
-        self.listbox.delete(0, END)
-        for t in tickets:
-            display = f"{t.id} - {t.titulo} [{t.status}] ({t.prioridade})"
-            self.listbox.insert(END, display)
+        """Recarrega a lista inteira: só na abertura e quando a busca muda.
+        Um novo recarregamento descarta o anterior ainda em andamento."""
+        if self._busca_agendada is not None:
+            self.root.after_cancel(self._busca_agendada)
+            self._busca_agendada = None
+        consulta = self.search_var.get().strip()
+        self._consulta = consulta
+        if consulta:
+            self._executar(self.sistema.buscar_tickets, consulta, self.LIMITE_BUSCA,
+                           ao_concluir=self._carregar_lista, chave="lista")
+        else:
+            self._executar(self._pagina, None, ao_concluir=self._carregar_lista, chave="lista")
+
+    def _pagina(self, cursor):
+        return self.sistema.listar_resumos(ordenar_por="criado_em", limite=self.TAMANHO_PAGINA, cursor=cursor)
+
+    def _carregar_lista(self, resumos):
+        if getattr(resumos, "truncado", False):
+            self.estado.set(f"⚠️ Resultados parciais: só {IndiceBusca.VARREDURA_MAXIMA} tickets examinados, refine a busca")
+        self.modelo.carregar(resumos)
+        self.lista.inicio = 0
+        self.lista.renderizar()
+        self._pedir_proxima_pagina(resumos)
+
+    def _acrescentar_pagina(self, resumos):
+        for resumo in resumos:
+            self.modelo.aplicar(resumo.id, resumo)
+        self.lista.renderizar()
+        self._pedir_proxima_pagina(resumos)
+
+    def _pedir_proxima_pagina(self, resumos):
+        cursor = getattr(resumos, "cursor", None)
+        if cursor:
+            self._executar(self._pagina, cursor, ao_concluir=self._acrescentar_pagina, chave="lista")
+
+    def _atualizar_lista(self):
+        """Traz alterações feitas por outros processos; o gerenciador notifica
+        só os tickets que mudaram e cada um é aplicado à lista."""
+        if self._consulta:
+            self._refresh_list()
+        else:
+            self._executar(self.sistema.gerenciador.sincronizar, chave="sincronizar")
+
+    def _ao_alterar_ticket(self, ticket_id: str, resumo: Optional[ResumoTicket]):
+        # Durante uma busca, só atualiza as linhas já exibidas; tickets novos
+        # aparecem quando a busca é refeita.
+        if self._consulta and ticket_id not in self.modelo:
+            return
+        self.modelo.aplicar(ticket_id, resumo)
+        if self._desenho_agendado is None:
+            self._desenho_agendado = self.root.after_idle(self._redesenhar)
+
+    def _redesenhar(self):
+        self._desenho_agendado = None
+        self.lista.renderizar()
 
     def _get_selected_id(self):
-        sel = self.listbox.curselection()
-        if not sel:
+        ticket_id = self.lista.selecionado()
+        if not ticket_id:
             messagebox.showwarning("Seleção", "Selecione um ticket")
             return None
-        return self.listbox.get(sel[0]).split(" - ")[0].strip()
+        return ticket_id
 
     def _novo_ticket(self):
         w = Toplevel(self.root)
@@ -608,9 +4684,8 @@ class InterfaceGUI:
             pr = prio_var.get()
             cat = categoria.get().strip() or None
             at = atrib.get().strip() or None
-            self.sistema.criar_ticket(titulo=t, descricao=d, prioridade=pr, categoria=cat, atribuido_a=at)
+            self._executar(lambda: self.sistema.criar_ticket(titulo=t, descricao=d, prioridade=pr, categoria=cat, atribuido_a=at))
             w.destroy()
-            self._refresh_list()
 
         Button(w, text="Criar", command=criar).pack(pady=6)
 
@@ -618,7 +4693,27 @@ class InterfaceGUI:
         tid = self._get_selected_id()
         if not tid:
             return
-        info = self.sistema.visualizar_ticket(tid)
+        self._executar(self.sistema.visualizar_ticket, tid, ao_concluir=self._exibir_detalhes, chave="detalhes")
+
+    def _proximo_ticket(self):
+        nome = self.sistema.usuario_atual
+        self._executar(self.sistema.proximo_ticket, nome, ao_concluir=self._exibir_proximo, chave="detalhes")
+
+    def _exibir_proximo(self, ticket):
+        if ticket is None:
+            messagebox.showinfo("Fila", "Nenhum ticket aguardando atendimento")
+            return
+        self.lista.mostrar(ticket.id)
+        self._executar(self.sistema.visualizar_ticket, ticket.id, ao_concluir=self._exibir_detalhes, chave="detalhes")
+
+    def _liberar_ticket(self):
+        tid = self._get_selected_id()
+        if not tid:
+            return
+        self._executar(self.sistema.liberar_ticket, tid,
+                       ao_concluir=lambda ok: ok or messagebox.showwarning("Fila", f"O ticket {tid} não está reservado para você"))
+
+    def _exibir_detalhes(self, info):
         self.text.delete("1.0", END)
         self.text.insert(END, info)
 
@@ -628,8 +4723,7 @@ class InterfaceGUI:
             return
         nome = simpledialog.askstring("Atribuir", "Nome do usuário:")
         if nome:
-            self.sistema.atribuir_ticket(tid, nome)
-            self._refresh_list()
+            self._executar(self.sistema.atribuir_ticket, tid, nome)
 
     def _atualizar_status(self):
         tid = self._get_selected_id()
@@ -638,8 +4732,7 @@ class InterfaceGUI:
         choices = [s.value for s in StatusEnum]
         novo = simpledialog.askstring("Status", f"Escolha status: {choices}")
         if novo and novo in choices:
-            self.sistema.atualizar_status(tid, novo)
-            self._refresh_list()
+            self._executar(self.sistema.atualizar_status, tid, novo)
         else:
             messagebox.showinfo("Info", "Status inválido ou cancelado.")
 
@@ -650,8 +4743,7 @@ class InterfaceGUI:
         choices = [p.name for p in PrioridadeEnum]
         novo = simpledialog.askstring("Prioridade", f"Escolha prioridade: {choices}")
         if novo and novo in choices:
-            self.sistema.atualizar_prioridade(tid, novo)
-            self._refresh_list()
+            self._executar(self.sistema.atualizar_prioridade, tid, novo)
         else:
             messagebox.showinfo("Info", "Prioridade inválida ou cancelado.")
 
@@ -661,7 +4753,7 @@ class InterfaceGUI:
             return
         texto = simpledialog.askstring("Comentário", "Comentário:")
         if texto:
-            self.sistema.adicionar_comentario(tid, texto)
+            self._executar(self.sistema.adicionar_comentario, tid, texto)
             self._visualizar()
 
     def _deletar_ticket(self):
@@ -669,13 +4761,13 @@ class InterfaceGUI:
         if not tid:
             return
         if messagebox.askyesno("Confirmar", f"Tem certeza que deseja deletar o ticket {tid}?"):
-            self.sistema.deletar_ticket(tid)
-            self._refresh_list()
-            self.text.delete("1.0", END)
-            self.text.insert(END, "Ticket deletado.")
+            self._executar(self.sistema.deletar_ticket, tid,
+                           ao_concluir=lambda ok: self._exibir_detalhes("Ticket deletado." if ok else f"✗ Ticket {tid} não encontrado"))
 
     def _gerar_relatorio(self):
-        rel = self.sistema.gerar_relatorio_completo()
+        self._executar(self.sistema.gerar_relatorio_completo, ao_concluir=self._exibir_relatorio, chave="relatorio")
+
+    def _exibir_relatorio(self, rel):
         w = Toplevel(self.root)
         w.title("Relatório")
         t = Text(w, width=100, height=30)
@@ -685,16 +4777,28 @@ class InterfaceGUI:
     def _definir_usuario_campo(self, entry_field):
         nome = entry_field.get().strip()
         if nome:
-            self.sistema.definir_usuario(nome)
+            self._executar(self.sistema.definir_usuario, nome)
             self.usuario_atual.set(f"👤 {nome}")
             entry_field.delete(0, END)
             messagebox.showinfo("Sucesso", f"Usuário atual: {nome}")
 
+    def _apresentar_evento(self, evento):
+        if RegistroEventos.NIVEIS[evento["nivel"]] >= RegistroEventos.NIVEIS["aviso"]:
+            self.trabalho.no_principal(self.estado.set, evento["mensagem"])
+
     def run(self):
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            eventos.remover_apresentador(self._apresentar_evento)
+            self.observador.parar()
+            self.trabalho.encerrar()
 
 
 class InterfaceCLI:
+    # Tickets exibidos por página nas listagens
+    TAMANHO_PAGINA = 20
+
     def __init__(self):
         self.sistema = SistemaTickets()
         self.usuario_atual = "admin"
@@ -714,6 +4818,13 @@ class InterfaceCLI:
 ║  8. Ver histórico
 ║  9. Gerar relatório
 ║  10. Definir usuário
+║  11. Buscar tickets
+║  12. Acompanhar alterações
+║  13. Pegar próximo ticket
+║  14. Devolver ticket à fila
+║  15. Carga dos agentes / rebalancear
+║  16. Configurar agentes
+║  17. Estatísticas de desempenho
 ║  0. Sair
 ╠════════════════════════════════════════════════════════════════╣
 """)
@@ -754,10 +4865,16 @@ class InterfaceCLI:
         print("2. Filtrar por status")
         print("3. Filtrar por prioridade")
         print("4. Filtrar por usuário")
+        print("5. Filtrar por categoria")
+        print("6. Atualizados na última hora")
         opcao = input("Escolha uma opção: ").strip()
         status_filter = None
         prioridade_filter = None
         usuario_filter = None
+        categoria_filter = None
+        ordenar_por = "criado_em"
+        decrescente = False
+        desde = None
         if opcao == "2":
             print("\nStatus disponíveis:")
             for i, s in enumerate(StatusEnum, 1):
@@ -778,24 +4895,132 @@ class InterfaceCLI:
                 return
         elif opcao == "4":
             usuario_filter = input("Nome do usuário: ").strip()
-        tickets = self.sistema.listar_tickets(
-            status=status_filter,
-            prioridade=prioridade_filter,
-            usuario=usuario_filter
-        )
+        elif opcao == "5":
+            categoria_filter = input("Categoria: ").strip()
+        elif opcao == "6":
+            ordenar_por = "atualizado_em"
+            decrescente = True
+            desde = datetime.now() - timedelta(hours=1)
+        cursor = None
+        while True:
+            pagina = self.sistema.listar_resumos(
+                status=status_filter,
+                prioridade=prioridade_filter,
+                usuario=usuario_filter,
+                categoria=categoria_filter,
+                ordenar_por=ordenar_por,
+                decrescente=decrescente,
+                desde=desde,
+                limite=self.TAMANHO_PAGINA,
+                cursor=cursor
+            )
+            if not pagina and cursor is None:
+                print("✗ Nenhum ticket encontrado")
+                return
+            self._exibir_tabela_tickets(pagina)
+            cursor = pagina.cursor
+            if not cursor or input("\nEnter para a próxima página, 0 para voltar: ").strip() == "0":
+                return
+
+    def buscar_tickets_interativo(self):
+        consulta = input("Buscar: ").strip()
+        if not consulta:
+            print("✗ Busca não pode estar vazia")
+            return
+        tickets = self.sistema.buscar_tickets(consulta)
         if not tickets:
             print("✗ Nenhum ticket encontrado")
             return
         self._exibir_tabela_tickets(tickets)
 
+    def acompanhar_alteracoes_interativo(self):
+        print("\n--- ACOMPANHAR ALTERAÇÕES (Ctrl+C para voltar) ---")
+        conhecidos = {r.id for r in self.sistema.listar_resumos()}
+
+        def exibir(ticket_id, ticket):
+            if ticket is None:
+                conhecidos.discard(ticket_id)
+                print(f"🗑️  {ticket_id} removido")
+                return
+            acao = "atualizado" if ticket_id in conhecidos else "criado"
+            conhecidos.add(ticket_id)
+            print(f"{'✏️ ' if acao == 'atualizado' else '➕'} {ticket_id} {acao}: "
+                  f"{ticket.titulo} [{ticket.status}] ({ticket.prioridade})")
+
+        alterado = threading.Event()
+        self.sistema.gerenciador.assinar(exibir)
+        observador = self.sistema.observar_alteracoes(alterado.set)
+        try:
+            while True:
+                if alterado.wait(0.5):
+                    alterado.clear()
+                    self.sistema.gerenciador.sincronizar()
+        except KeyboardInterrupt:
+            print()
+        finally:
+            observador.parar()
+            self.sistema.gerenciador.cancelar_assinatura(exibir)
+
+    def proximo_ticket_interativo(self):
+        ticket = self.sistema.proximo_ticket(self.usuario_atual)
+        if ticket:
+            print(self.sistema.visualizar_ticket(ticket.id))
+
+    def liberar_ticket_interativo(self):
+        ticket_id = input("ID do ticket: ").strip().upper()
+        self.sistema.liberar_ticket(ticket_id, self.usuario_atual)
+
+    def carga_agentes_interativo(self):
+        cargas = self.sistema.cargas_agentes()
+        if not cargas:
+            print("✗ Nenhum agente configurado (opção 16)")
+            return
+        print(f"\nAtribuição automática: {'ligada' if self.sistema.atribuicao_automatica else 'desligada'}")
+        print(f"\n{'Agente':<20} {'Em aberto':>10}  Categorias")
+        print("─" * 60)
+        for agente, carga in sorted(cargas.items(), key=lambda item: (-item[1], item[0])):
+            categorias = ", ".join(self.sistema.agentes.get(agente) or []) or "todas"
+            print(f"{agente:<20} {carga:>10}  {categorias}")
+        if input("\nRebalancear agora? (s/N): ").strip().lower() == "s":
+            for ticket_id, origem, destino in self.sistema.rebalancear_atribuicoes():
+                print(f"  {ticket_id}: {origem} → {destino}")
+
+    def configurar_agentes_interativo(self):
+        print("\n--- CONFIGURAR AGENTES (nome vazio para terminar) ---")
+        agentes = {}
+        while True:
+            nome = input("Agente: ").strip()
+            if not nome:
+                break
+            categorias = input("  Categorias (separadas por vírgula, vazio = todas): ")
+            agentes[nome] = [c.strip() for c in categorias.split(",") if c.strip()]
+        if not agentes:
+            print("✗ Nenhum agente informado")
+            return
+        automatico = input("Atribuir automaticamente os tickets novos? (s/N): ").strip().lower() == "s"
+        self.sistema.definir_agentes(agentes, automatico)
+
+    def estatisticas_desempenho_interativo(self):
+        if not perfil.ativo:
+            print("✗ Instrumentação desligada (use --profile ou TICKETFLOW_PERFIL=1)")
+            if input("Ligar agora? (s/N): ").strip().lower() == "s":
+                perfil.ativar()
+                print("✓ Instrumentação ligada: as próximas operações serão medidas")
+            return
+        print("\n--- ESTATÍSTICAS DE DESEMPENHO ---")
+        print(perfil.relatorio())
+        if input("\nZerar as medições? (s/N): ").strip().lower() == "s":
+            perfil.zerar()
+            print("✓ Medições zeradas")
+
     def _exibir_tabela_tickets(self, tickets):
         print("\n")
-        print(f"{'ID':<10} {'Título':<30} {'Status':<15} {'Prioridade':<10} {'Atribuído':<15}")
-        print("─" * 85)
+        print(f"{'ID':<16} {'Título':<30} {'Status':<15} {'Prioridade':<10} {'Atribuído':<15}")
+        print("─" * 91)
         for ticket in tickets:
             titulo = ticket.titulo[:27] + "..." if len(ticket.titulo) > 30 else ticket.titulo
             atribuido = ticket.atribuido_a if ticket.atribuido_a else "N/A"
-            print(f"{ticket.id:<10} {titulo:<30} {ticket.status:<15} {ticket.prioridade:<10} {atribuido:<15}")
+            print(f"{ticket.id:<16} {titulo:<30} {ticket.status:<15} {ticket.prioridade:<10} {atribuido:<15}")
 
     def visualizar_ticket_interativo(self):
         ticket_id = input("ID do ticket: ").strip().upper()
@@ -873,6 +5098,8 @@ class InterfaceCLI:
         print("║    BEM-VINDO AO SISTEMA DE GERENCIAMENTO DE TICKETS          ║")
         print("╚════════════════════════════════════════════════════════════════╝")
         while True:
+            if self.sistema.sla_ativo:
+                self.sistema.verificar_sla()
             self.exibir_menu_principal()
             print(f"Usuário atual: {self.usuario_atual}\n")
             opcao = input("Escolha uma opção: ").strip()
@@ -896,6 +5123,20 @@ class InterfaceCLI:
                 self.gerar_relatorio_interativo()
             elif opcao == "10":
                 self.definir_usuario_interativo()
+            elif opcao == "11":
+                self.buscar_tickets_interativo()
+            elif opcao == "12":
+                self.acompanhar_alteracoes_interativo()
+            elif opcao == "13":
+                self.proximo_ticket_interativo()
+            elif opcao == "14":
+                self.liberar_ticket_interativo()
+            elif opcao == "15":
+                self.carga_agentes_interativo()
+            elif opcao == "16":
+                self.configurar_agentes_interativo()
+            elif opcao == "17":
+                self.estatisticas_desempenho_interativo()
             elif opcao == "0":
                 print("\n✓ Até logo!")
                 break
@@ -954,6 +5195,7 @@ def executar_demo():
 def launch_public_submit():
     """Abre uma janela simples para o público abrir um chamado (modo limit)
     Não mostra listagens ou controles administrativos: apenas cria um ticket."""
+    carregar_tk()
     sistema = SistemaTickets()
     root = Tk()
     root.title("Abrir Chamado - TicketFlow")
@@ -1045,9 +5287,39 @@ def menu_principal():
             print(f"❌ Erro: {str(e)}")
 
 if __name__ == "__main__":
+    # --profile (ou --profile=cprofile) vale para qualquer modo
+    for argumento in [a for a in sys.argv[1:] if a == "--profile" or a.startswith("--profile=")]:
+        sys.argv.remove(argumento)
+        perfil.configurar(argumento.partition("=")[2] or "1")
     try:
         if len(sys.argv) > 1 and sys.argv[1] == "--demo":
             executar_demo()
+        elif len(sys.argv) > 3 and sys.argv[1] == "--migrar-sqlite":
+            total = migrar_json_para_sqlite(sys.argv[2], sys.argv[3])
+            print(f"✓ {total} tickets migrados para {sys.argv[3]}")
+        elif len(sys.argv) > 3 and sys.argv[1] == "--migrar-fragmentos":
+            total = migrar_json_para_fragmentos(sys.argv[2], sys.argv[3])
+            print(f"✓ {total} tickets migrados para {sys.argv[3]}")
+        elif len(sys.argv) > 2 and sys.argv[1] in ("--import", "--export"):
+            executar_troca(sys.argv[1], sys.argv[2:])
+        elif len(sys.argv) > 1 and sys.argv[1] == "--verificar-estatisticas":
+            divergencias = SistemaTickets().verificar_estatisticas(corrigir=True)
+            if not divergencias:
+                print("✓ Estatísticas consistentes")
+            for campo, diferencas in divergencias.items():
+                for valor, (mantido, recalculado) in diferencas.items():
+                    print(f"✗ {campo}={valor}: mantido {mantido}, recalculado {recalculado} (corrigido)")
+        elif len(sys.argv) > 1 and sys.argv[1] == "--sla":
+            # python main.py --sla [intervalo em segundos]
+            executar_agendador_sla(float(sys.argv[2]) if len(sys.argv) > 2 else 60.0)
+        elif len(sys.argv) > 1 and sys.argv[1] == "--rebalancear":
+            for ticket_id, origem, destino in SistemaTickets().rebalancear_atribuicoes():
+                print(f"  {ticket_id}: {origem} → {destino}")
+        elif len(sys.argv) > 1 and sys.argv[1] == "--serve":
+            # python main.py --serve [porta] [host]
+            porta = int(sys.argv[2]) if len(sys.argv) > 2 else 8080
+            host = sys.argv[3] if len(sys.argv) > 3 else "127.0.0.1"
+            executar_servidor(host, porta)
         elif len(sys.argv) > 1 and sys.argv[1] == "--cli":
             interface_cli = InterfaceCLI()
             interface_cli.executar()
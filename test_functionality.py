@@ -8,6 +8,14 @@ Valida se todos os módulos e funcionalidades funcionam corretamente
 import sys
 import os
 
+
+def limpar_arquivos(*arquivos):
+    """Remove os arquivos de teste e os auxiliares (bloqueio, journal, ids)"""
+    for arquivo in arquivos:
+        for caminho in (arquivo, arquivo + ".lock", arquivo + ".journal", arquivo + ".ids.lock"):
+            if os.path.exists(caminho):
+                os.remove(caminho)
+
 def test_imports():
     """Testa se todos os módulos podem ser importados"""
     print("\n" + "="*60)
@@ -61,8 +69,7 @@ def test_ticket_creation():
         print(f"✅ Total de tickets: {len(tickets)}")
         
         # Limpar arquivo de teste
-        if os.path.exists(test_file):
-            os.remove(test_file)
+        limpar_arquivos(test_file)
         
         return True
     except Exception as e:
@@ -122,8 +129,7 @@ def test_json_persistence():
             raise Exception("Dados não foram recuperados")
         
         # Limpar
-        if os.path.exists(test_file):
-            os.remove(test_file)
+        limpar_arquivos(test_file)
         
         return True
     except Exception as e:
@@ -156,14 +162,1512 @@ def test_status_operations():
             print(f"✅ Status alterado para: {status.value}")
         
         # Limpar
-        if os.path.exists(test_file):
-            os.remove(test_file)
+        limpar_arquivos(test_file)
         
         return True
     except Exception as e:
         print(f"❌ Erro ao testar status: {e}")
         return False
 
+def test_cache_memoria():
+    """Testa o cache em memória e a detecção de alterações externas"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 6: Cache em Memória")
+    print("="*60)
+    
+    try:
+        import json
+        from main import GerenciadorDados, SistemaTickets, PrioridadeEnum
+        
+        test_file = "test_cache.json"
+        sistema = SistemaTickets(test_file)
+        ticket = sistema.criar_ticket(
+            titulo="Teste Cache",
+            descricao="Teste",
+            prioridade=PrioridadeEnum.BAIXA.name
+        )
+        
+        # Alterar o objeto retornado não pode afetar o cache
+        copia = sistema.gerenciador.obter_ticket(ticket.id)
+        copia.titulo = "Alterado sem salvar"
+        if sistema.gerenciador.obter_ticket(ticket.id).titulo != "Teste Cache":
+            raise Exception("Cache foi alterado sem salvar_ticket")
+        print("✅ Cache isolado dos objetos retornados")
+        
+        # Outro processo reescreve o arquivo: o cache deve ser recarregado
+        outro = GerenciadorDados(test_file)
+        outro_ticket = outro.obter_ticket(ticket.id)
+        outro_ticket.titulo = "Alterado por outro processo"
+        outro.salvar_ticket(outro_ticket)
+        with open(test_file, 'r', encoding='utf-8') as f:
+            dados = json.load(f)
+        dados["tickets"][0]["status"] = "fechado"
+        with open(test_file, 'w', encoding='utf-8') as f:
+            json.dump(dados, f)
+        recarregado = sistema.gerenciador.obter_ticket(ticket.id)
+        if recarregado.titulo != "Alterado por outro processo" or recarregado.status != "fechado":
+            raise Exception("Alteração externa não foi detectada")
+        print("✅ Alteração externa detectada e recarregada")
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no cache: {e}")
+        return False
+
+def test_journal():
+    """Testa o armazenamento em journal com compactação"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 7: Journal e Compactação")
+    print("="*60)
+    
+    try:
+        from main import GerenciadorDadosJournal, SistemaTickets, StatusEnum
+        
+        test_file = "test_journal.json"
+        sistema = SistemaTickets("journal://" + test_file)
+        sistema.gerenciador.limite_registros = 5
+        tickets = [sistema.criar_ticket(titulo=f"Journal {i}", descricao="Teste") for i in range(3)]
+        sistema.atualizar_status(tickets[0].id, StatusEnum.FECHADO.value)
+        sistema.gerenciador.deletar_ticket(tickets[1].id)
+        
+        # Nova instância reconstrói o estado a partir de snapshot + journal
+        outro = GerenciadorDadosJournal(test_file)
+        ids = sorted(t.id for t in outro.obter_todos_tickets())
+        if ids != sorted([tickets[0].id, tickets[2].id]):
+            raise Exception("Replay do journal incorreto")
+        if outro.obter_ticket(tickets[0].id).status != StatusEnum.FECHADO.value:
+            raise Exception("Status não foi reproduzido do journal")
+        print("✅ Snapshot + journal reproduzidos corretamente")
+        
+        # O quinto registro dispara a compactação
+        if os.path.getsize(test_file + ".journal") != 0:
+            raise Exception("Journal não foi compactado")
+        sistema.criar_ticket(titulo="Após compactação", descricao="Teste")
+        if len(outro.obter_todos_tickets()) != 3:
+            raise Exception("Registro novo no journal não foi lido")
+        print("✅ Journal compactado no snapshot")
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no journal: {e}")
+        return False
+
+def test_sqlite():
+    """Testa o backend SQLite e a migração a partir do JSON"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 8: Backend SQLite")
+    print("="*60)
+    
+    test_json = "test_migracao.json"
+    test_db = "test_migracao.db"
+    try:
+        from main import SistemaTickets, StatusEnum, PrioridadeEnum, migrar_json_para_sqlite
+        
+        origem = SistemaTickets(test_json)
+        t1 = origem.criar_ticket(titulo="SQL 1", descricao="Teste", prioridade=PrioridadeEnum.CRITICA.name, atribuido_a="Ana")
+        origem.criar_ticket(titulo="SQL 2", descricao="Teste", atribuido_a="Bruno")
+        origem.adicionar_comentario(t1.id, "Primeiro comentário")
+        origem.atualizar_status(t1.id, StatusEnum.EM_ANDAMENTO.value)
+        
+        if migrar_json_para_sqlite(test_json, test_db) != 2:
+            raise Exception("Quantidade migrada incorreta")
+        sistema = SistemaTickets(test_db)
+        migrado = sistema.gerenciador.obter_ticket(t1.id)
+        if migrado.to_dict() != origem.gerenciador.obter_ticket(t1.id).to_dict():
+            raise Exception("Ticket migrado difere do original")
+        print("✅ Migração preserva histórico e comentários")
+        
+        if sistema.obter_estatisticas() != origem.obter_estatisticas():
+            raise Exception("Relatório SQLite difere do JSON")
+        sistema.atualizar_prioridade(t1.id, PrioridadeEnum.BAIXA.name)
+        if [t.id for t in sistema.gerenciador.obter_tickets_por_usuario("Ana")] != [t1.id]:
+            raise Exception("Filtro por usuário incorreto")
+        if len(sistema.obter_historico(t1.id)) != 4:
+            raise Exception("Histórico incremental incorreto")
+        sistema.gerenciador.deletar_ticket(t1.id)
+        if sistema.obter_estatisticas()["total_tickets"] != 1:
+            raise Exception("Deleção não aplicada")
+        sistema.gerenciador.fechar()
+        print("✅ Consultas e relatório via SQLite")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no SQLite: {e}")
+        return False
+    finally:
+        limpar_arquivos(test_json, test_db, test_db + "-wal", test_db + "-shm")
+
+def test_indices_secundarios():
+    """Testa os filtros combinados pelos índices secundários"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 9: Índices Secundários")
+    print("="*60)
+    
+    try:
+        from main import SistemaTickets, StatusEnum, PrioridadeEnum
+        
+        test_file = "test_indices.json"
+        sistema = SistemaTickets(test_file)
+        a = sistema.criar_ticket(titulo="A", descricao="Teste", prioridade=PrioridadeEnum.ALTA.name, categoria="Bug", atribuido_a="Ana")
+        b = sistema.criar_ticket(titulo="B", descricao="Teste", prioridade=PrioridadeEnum.ALTA.name, categoria="Bug")
+        c = sistema.criar_ticket(titulo="C", descricao="Teste", prioridade=PrioridadeEnum.BAIXA.name, atribuido_a="Ana")
+        
+        if [t.id for t in sistema.listar_tickets(prioridade="ALTA")] != [a.id, b.id]:
+            raise Exception("Filtro por prioridade incorreto")
+        if [t.id for t in sistema.listar_tickets(prioridade="ALTA", usuario="Ana")] != [a.id]:
+            raise Exception("Filtro combinado incorreto")
+        print("✅ Filtros combinados preservam a ordem")
+        
+        sistema.atualizar_status(a.id, StatusEnum.RESOLVIDO.value)
+        sistema.atribuir_ticket(b.id, "Ana")
+        sistema.gerenciador.deletar_ticket(c.id)
+        if [t.id for t in sistema.listar_tickets(status=StatusEnum.ABERTO.value, usuario="Ana")] != [b.id]:
+            raise Exception("Índice não acompanhou as alterações")
+        if [t.id for t in sistema.listar_tickets(categoria="Bug", status=StatusEnum.RESOLVIDO.value)] != [a.id]:
+            raise Exception("Filtro por categoria incorreto")
+        print("✅ Índices atualizados incrementalmente")
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro nos índices: {e}")
+        return False
+
+def test_estatisticas_incrementais():
+    """Testa o relatório incremental e a verificação de divergências"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 10: Estatísticas Incrementais")
+    print("="*60)
+    
+    try:
+        from main import SistemaTickets, StatusEnum, PrioridadeEnum
+        
+        test_file = "test_estatisticas.json"
+        sistema = SistemaTickets(test_file)
+        a = sistema.criar_ticket(titulo="A", descricao="Teste", prioridade=PrioridadeEnum.CRITICA.name, atribuido_a="Ana")
+        sistema.criar_ticket(titulo="B", descricao="Teste", atribuido_a="Ana")
+        sistema.atualizar_status(a.id, StatusEnum.EM_ANDAMENTO.value)
+        
+        stats = sistema.obter_estatisticas()
+        esperado = {
+            "total_tickets": 2,
+            "por_status": {"em_andamento": 1, "aberto": 1},
+            "por_prioridade": {"CRITICA": 1, "MEDIA": 1},
+            "por_usuario": {"Ana": 2},
+            "tickets_abertos": 1,
+            "tickets_criticos": 1
+        }
+        if stats != esperado:
+            raise Exception(f"Relatório incorreto: {stats}")
+        print("✅ Relatório a partir dos contadores mantidos")
+        
+        # Simular divergência e reconstruir
+        sistema.gerenciador._indices["status"]["aberto"].add("FANTASMA")
+        divergencias = sistema.verificar_estatisticas()
+        if divergencias != {"status": {"aberto": (2, 1)}}:
+            raise Exception(f"Divergência não detectada: {divergencias}")
+        if sistema.verificar_estatisticas() or sistema.obter_estatisticas() != esperado:
+            raise Exception("Contadores não foram reconstruídos")
+        print("✅ Divergência detectada e corrigida")
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro nas estatísticas: {e}")
+        return False
+
+def test_operacoes_em_lote():
+    """Testa alterações em lote com uma única gravação"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 11: Operações em Lote")
+    print("="*60)
+    
+    try:
+        from main import SistemaTickets, GerenciadorDados, StatusEnum, eventos
+        
+        test_file = "test_lote.json"
+        sistema = SistemaTickets(test_file)
+        with sistema.lote():
+            tickets = [sistema.criar_ticket(titulo=f"Lote {i}", descricao="Teste") for i in range(5)]
+        
+        gravacoes = []
+        gravar_original = sistema.gerenciador._gravar
+        sistema.gerenciador._gravar = lambda alteracoes: (gravacoes.append(len(alteracoes)), gravar_original(alteracoes))
+        ids = [t.id for t in tickets] + ["INEXISTENTE"]
+        resultados = sistema.atualizar_em_lote(ids, status=StatusEnum.EM_ANDAMENTO.value, atribuido_a="Ana", comentario="Turno encerrado")
+        if gravacoes != [5]:
+            raise Exception(f"Esperada uma única gravação, houve {gravacoes}")
+        if resultados != {**{t.id: True for t in tickets}, "INEXISTENTE": False}:
+            raise Exception(f"Resultados incorretos: {resultados}")
+        print("✅ 5 tickets alterados com uma gravação")
+        
+        recarregado = GerenciadorDados(test_file).obter_ticket(tickets[0].id)
+        if recarregado.atribuido_a != "Ana" or len(recarregado.historico) != 4 or len(recarregado.comentarios) != 1:
+            raise Exception("Alterações do lote não persistidas")
+        print("✅ Histórico registrado para cada alteração")
+        
+        # Exceção dentro do bloco descarta o lote
+        try:
+            with sistema.lote():
+                sistema.atualizar_status(tickets[0].id, StatusEnum.FECHADO.value)
+                raise RuntimeError("abortar")
+        except RuntimeError:
+            pass
+        if sistema.gerenciador.obter_ticket(tickets[0].id).status != StatusEnum.EM_ANDAMENTO.value:
+            raise Exception("Lote abortado foi gravado")
+        print("✅ Lote abortado não é gravado")
+        
+        # Falha na gravação do lote vira False para cada ticket e evento de erro
+        recebidos = []
+        eventos.apresentar(recebidos.append)
+        def falhar(alteracoes):
+            raise OSError("disco cheio")
+        sistema.gerenciador._gravar = falhar
+        try:
+            resultados = sistema.atualizar_em_lote([t.id for t in tickets], status=StatusEnum.FECHADO.value)
+        finally:
+            del sistema.gerenciador._gravar
+            eventos.remover_apresentador(recebidos.append)
+        if resultados != {t.id: False for t in tickets}:
+            raise Exception(f"Falha na gravação do lote não refletida: {resultados}")
+        if not any(e["op"] == "lote" and e["nivel"] == "erro" for e in recebidos):
+            raise Exception("Falha na gravação do lote sem evento de erro")
+        recarregado = GerenciadorDados(test_file).obter_ticket(tickets[0].id)
+        if recarregado.status != StatusEnum.EM_ANDAMENTO.value:
+            raise Exception("Lote com falha alterou o arquivo")
+        print("✅ Falha na gravação do lote reportada por ticket")
+        
+        # Dentro de um lote externo o resultado não depende da gravação pendente
+        with sistema.lote():
+            resultados = sistema.atualizar_em_lote([tickets[0].id], prioridade="ALTA")
+        if resultados != {tickets[0].id: True}:
+            raise Exception(f"Lote aninhado reportou falha: {resultados}")
+        if GerenciadorDados(test_file).obter_ticket(tickets[0].id).prioridade != "ALTA":
+            raise Exception("Lote aninhado não persistido")
+        print("✅ Lote aninhado gravado pelo lote externo")
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no lote: {e}")
+        return False
+
+def test_concorrencia():
+    """Testa gravações concorrentes de vários processos"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 12: Concorrência entre Processos")
+    print("="*60)
+    
+    try:
+        from bench_concorrencia import executar_estresse, executar_estresse_mesmo_ticket
+        
+        for dados in ("test_concorrencia.json", "journal://test_concorrencia_journal.json"):
+            esperados, encontrados, perdidos, _ = executar_estresse(dados, processos=3, tickets_por_processo=4)
+            if perdidos or encontrados != esperados:
+                raise Exception(f"{len(perdidos)} ticket(s) perdido(s) em {dados}")
+            print(f"✅ {esperados} tickets criados sem perdas em {dados}")
+        
+        for dados in ("test_concorrencia.json", "journal://test_concorrencia_journal.json"):
+            comentarios, gravados, historico, no_historico, _ = executar_estresse_mesmo_ticket(
+                dados, processos=3, alteracoes_por_processo=5)
+            if gravados != comentarios or no_historico != historico:
+                raise Exception(f"alterações perdidas no mesmo ticket em {dados}: "
+                                f"{gravados}/{comentarios} comentários, {no_historico}/{historico} histórico")
+            print(f"✅ {comentarios} comentários e {historico} entradas de histórico no mesmo ticket em {dados}")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro de concorrência: {e}")
+        return False
+
+def test_fragmentos():
+    """Testa o armazenamento fragmentado e a migração do arquivo plano"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 13: Armazenamento Fragmentado")
+    print("="*60)
+    
+    import shutil
+    test_json = "test_fragmentos.json"
+    test_dir = "test_fragmentos"
+    try:
+        from main import SistemaTickets, GerenciadorDadosFragmentado, StatusEnum, migrar_json_para_fragmentos
+        
+        origem = SistemaTickets(test_json)
+        antigo = origem.criar_ticket(titulo="Antigo", descricao="Teste", atribuido_a="Ana")
+        origem.atualizar_status(antigo.id, StatusEnum.FECHADO.value)
+        mais_antigo = origem.gerenciador.obter_ticket(antigo.id)
+        mais_antigo.id, mais_antigo.criado_em = "ANTIGO02", "2024-01-15T10:00:00"
+        origem.gerenciador.salvar_ticket(mais_antigo)
+        ativo = origem.criar_ticket(titulo="Ativo", descricao="Teste", atribuido_a="Ana")
+        
+        if migrar_json_para_fragmentos(test_json, test_dir) != 3:
+            raise Exception("Quantidade migrada incorreta")
+        if sorted(os.listdir(test_dir)) != sorted([
+            "ativos.json", "ativos.json.lock", f"fechados-{antigo.criado_em[:7]}.json",
+            f"fechados-{antigo.criado_em[:7]}.json.lock", "fechados-2024-01.json",
+            "fechados-2024-01.json.lock", "manifesto.json", "manifesto.json.lock"
+        ]):
+            raise Exception(f"Fragmentos inesperados: {os.listdir(test_dir)}")
+        print("✅ Migração divide ativos e arquivo mensal")
+        
+        sistema = SistemaTickets("fragmentos://" + test_dir)
+        if [t.id for t in sistema.listar_tickets(status=StatusEnum.ABERTO.value)] != [ativo.id]:
+            raise Exception("Filtro por status ativo incorreto")
+        if sistema.obter_estatisticas() != origem.obter_estatisticas():
+            raise Exception("Relatório fragmentado difere do plano")
+        if set(sistema.gerenciador._fragmentos) != {"ativos"}:
+            raise Exception("Fragmentos arquivados foram abertos sem necessidade")
+        if sistema.gerenciador.obter_ticket("ANTIGO02").titulo != "Antigo":
+            raise Exception("Ticket arquivado não encontrado")
+        if set(sistema.gerenciador._fragmentos) != {"ativos", "fechados-2024-01"}:
+            raise Exception("obter_ticket abriu mais de um fragmento arquivado")
+        print("✅ Consultas ativas e relatório não abrem o arquivo morto")
+        
+        sistema.atualizar_status("ANTIGO02", StatusEnum.REABERTO.value)
+        sistema.atualizar_status(ativo.id, StatusEnum.FECHADO.value)
+        outro = GerenciadorDadosFragmentado(test_dir)
+        if [t.id for t in outro.filtrar_tickets(status=StatusEnum.REABERTO.value)] != ["ANTIGO02"]:
+            raise Exception("Ticket reaberto não voltou aos ativos")
+        if outro.obter_ticket(ativo.id).status != StatusEnum.FECHADO.value:
+            raise Exception("Ticket fechado não foi arquivado")
+        if outro.verificar_estatisticas() or outro.gerar_relatorio()["total_tickets"] != 3:
+            raise Exception("Manifesto inconsistente")
+        print("✅ Tickets migram entre fragmentos ao mudar de status")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro nos fragmentos: {e}")
+        return False
+    finally:
+        limpar_arquivos(test_json)
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+def test_resumos():
+    """Testa a listagem leve sem histórico e comentários"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 14: Listagem de Resumos")
+    print("="*60)
+    
+    test_json = "test_resumos.json"
+    test_db = "test_resumos.db"
+    try:
+        from main import SistemaTickets, ResumoTicket, StatusEnum, migrar_json_para_sqlite
+        
+        sistema = SistemaTickets(test_json)
+        a = sistema.criar_ticket(titulo="Longo", descricao="Teste", atribuido_a="Ana")
+        for i in range(20):
+            sistema.adicionar_comentario(a.id, f"Comentário {i}")
+        b = sistema.criar_ticket(titulo="Curto", descricao="Teste")
+        sistema.atualizar_status(b.id, StatusEnum.PAUSADO.value)
+        migrar_json_para_sqlite(test_json, test_db)
+        
+        for dados in (test_json, test_db):
+            s = SistemaTickets(dados)
+            resumos = s.listar_resumos()
+            if [r.id for r in resumos] != [a.id, b.id] or not all(isinstance(r, ResumoTicket) for r in resumos):
+                raise Exception(f"Resumos incorretos em {dados}")
+            if hasattr(resumos[0], "historico") or resumos[0].atribuido_a != "Ana":
+                raise Exception(f"Projeção incorreta em {dados}")
+            if [r.id for r in s.listar_resumos(status=StatusEnum.PAUSADO.value)] != [b.id]:
+                raise Exception(f"Filtro de resumos incorreto em {dados}")
+            if len(s.obter_historico(a.id)) != 21:
+                raise Exception(f"Histórico completo indisponível em {dados}")
+            print(f"✅ Resumos sem histórico em {dados}")
+        s.gerenciador.fechar()
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro nos resumos: {e}")
+        return False
+    finally:
+        limpar_arquivos(test_json, test_db, test_db + "-wal", test_db + "-shm")
+
+def test_representacao_compacta():
+    """Testa o histórico colunar e os valores internados"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 15: Representação Compacta")
+    print("="*60)
+    
+    try:
+        from main import SistemaTickets, GerenciadorDados, HistoricoColunar, Ticket, StatusEnum
+        
+        test_file = "test_compacto.json"
+        sistema = SistemaTickets(test_file)
+        ticket = sistema.criar_ticket(titulo="Compacto", descricao="Teste")
+        sistema.atualizar_status(ticket.id, StatusEnum.EM_ANDAMENTO.value)
+        esperado = sistema.gerenciador.obter_ticket(ticket.id).to_dict()
+        
+        sistema.gerenciador = GerenciadorDados(test_file, historico_colunar=True)
+        if not sistema.gerenciador.contem(ticket.id):
+            raise Exception("Ticket não carregado")
+        if not isinstance(sistema.gerenciador._tickets[ticket.id].historico, HistoricoColunar):
+            raise Exception("Histórico residente não é colunar")
+        sistema.adicionar_comentario(ticket.id, "Depois da conversão")
+        historico = sistema.obter_historico(ticket.id)
+        if len(historico) != 3 or historico[:2] != esperado["historico"] or historico[2]["campo"] != "comentario":
+            raise Exception("Histórico colunar incorreto")
+        if GerenciadorDados(test_file).obter_ticket(ticket.id).to_dict()["historico"] != list(historico):
+            raise Exception("Histórico colunar não foi persistido como lista de dicts")
+        print("✅ Histórico colunar equivalente à lista de dicts")
+        
+        a = Ticket.from_dict({"id": "A", "status": "".join(["abe", "rto"]), "prioridade": "".join(["BA", "IXA"])})
+        if a.status is not StatusEnum.ABERTO.value:
+            raise Exception("Valores não foram internados")
+        if sys.version_info >= (3, 10) and hasattr(a, "__dict__"):
+            raise Exception("Ticket não usa __slots__")
+        print("✅ Status e prioridade compartilham a string do enum")
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro na representação compacta: {e}")
+        return False
+
+def test_busca_textual():
+    """Testa o índice de busca textual"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 16: Busca Textual")
+    print("="*60)
+    
+    try:
+        from main import SistemaTickets
+        
+        test_file = "test_busca.json"
+        sistema = SistemaTickets(test_file)
+        a = sistema.criar_ticket(titulo="Impressora não imprime", descricao="Fila travada", categoria="Hardware")
+        b = sistema.criar_ticket(titulo="Erro de conexão", descricao="Usuário sem acesso à rede")
+        
+        if [t.id for t in sistema.buscar_tickets("impressao")] != [] or [t.id for t in sistema.buscar_tickets("IMPRE")] != [a.id]:
+            raise Exception("Busca por prefixo incorreta")
+        if [t.id for t in sistema.buscar_tickets("conexao rede")] != [b.id]:
+            raise Exception("Busca sem acentos incorreta")
+        print("✅ Prefixos e acentos tratados")
+        
+        sistema.adicionar_comentario(b.id, "Trocado o cabo da impressora")
+        if [t.id for t in sistema.buscar_tickets("impressora")] != [a.id, b.id]:
+            raise Exception("Comentário não indexado")
+        sistema.gerenciador.deletar_ticket(a.id)
+        if [t.id for t in sistema.buscar_tickets("impressora")] != [b.id] or sistema.buscar_tickets("hardware"):
+            raise Exception("Remoção não refletida no índice")
+        print("✅ Índice atualizado a cada alteração")
+        
+        outro = SistemaTickets(test_file)
+        c = outro.criar_ticket(titulo="Teclado quebrado", descricao="Tecla enter")
+        if [t.id for t in sistema.buscar_tickets("teclado")] != [c.id]:
+            raise Exception("Alteração de outra instância não indexada")
+        print("✅ Alterações de outra instância indexadas")
+        
+        # Prefixos amplos: o termo mais seletivo escolhe os candidatos e,
+        # se todos são amplos, a varredura com limite tem teto
+        from main import IndiceBusca, Ticket
+        indice = IndiceBusca()
+        for i in range(3000):
+            titulo = f"x{i} comum" if i % 2 else f"z{i} comum"
+            indice.atualizar(f"B{i}", Ticket(id=f"B{i}", titulo=titulo, descricao="", prioridade="ALTA"))
+        indice.atualizar("ALVO", Ticket(id="ALVO", titulo="x1 comum raro", descricao="", prioridade="ALTA"))
+        indice.atualizar("TARDE", Ticket(id="TARDE", titulo="xfim zfim", descricao="", prioridade="ALTA"))
+        if indice.buscar("x raro", limite=10) != ["ALVO"] or indice.buscar("comum raro") != ["ALVO"]:
+            raise Exception("Termo seletivo não usado para os candidatos")
+        if indice.buscar("x z", limite=10) != [] or indice.buscar("x z") != ["TARDE"]:
+            raise Exception("Varredura de prefixos amplos sem teto")
+        # Ao atingir o teto sem completar o limite o resultado vem marcado
+        if not indice.buscar("x z", limite=10).truncado or indice.buscar("x z").truncado:
+            raise Exception("Varredura interrompida pelo teto não sinalizada")
+        if indice.buscar("x comum", limite=10).truncado or indice.buscar("x raro", limite=10).truncado:
+            raise Exception("Busca completa marcada como parcial")
+        sistema._indice_busca = indice
+        parcial = sistema.buscar_tickets("x z", limite=10)
+        if parcial != [] or not parcial.truncado:
+            raise Exception("buscar_tickets não repassa o resultado parcial")
+        print(f"✅ Prefixos amplos: termo seletivo primeiro, varredura limitada a {IndiceBusca.VARREDURA_MAXIMA} e sinalizada")
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro na busca: {e}")
+        return False
+
+def test_lista_virtual():
+    """Testa o modelo da lista de tickets da GUI (ordenação e diferenças)"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 17: Lista Virtual")
+    print("="*60)
+    
+    try:
+        from main import SistemaTickets, ModeloListaTickets, ResumoTicket
+        
+        test_file = "test_lista.json"
+        sistema = SistemaTickets(test_file)
+        a = sistema.criar_ticket(titulo="A", descricao="a", prioridade="BAIXA")
+        b = sistema.criar_ticket(titulo="B", descricao="b", prioridade="CRITICA")
+        c = sistema.criar_ticket(titulo="C", descricao="c", prioridade="MEDIA")
+        
+        modelo = ModeloListaTickets()
+        modelo.carregar(sistema.listar_resumos())
+        sistema.gerenciador.assinar(
+            lambda i, t: modelo.aplicar(i, ResumoTicket.de_ticket(t) if t else None))
+        if [r.id for r in modelo.fatia(0, 10)] != [a.id, b.id, c.id]:
+            raise Exception("Ordem de chegada incorreta")
+        
+        modelo.ordenar("prioridade", decrescente=True)
+        if [r.id for r in modelo.fatia(0, 10)] != [b.id, c.id, a.id]:
+            raise Exception("Ordenação por prioridade incorreta")
+        if [r.id for r in modelo.fatia(1, 1)] != [c.id] or modelo.posicao(a.id) != 2:
+            raise Exception("Fatia/posição incorreta")
+        print("✅ Ordenação e fatias corretas")
+        
+        sistema.atualizar_prioridade(a.id, "ALTA")
+        sistema.atualizar_status(c.id, "fechado")
+        sistema.deletar_ticket(b.id)
+        if [r.id for r in modelo.fatia(0, 10)] != [a.id, c.id]:
+            raise Exception("Alterações não aplicadas")
+        modelo.ordenar("status")
+        if [r.status for r in modelo.fatia(0, 10)] != ["aberto", "fechado"]:
+            raise Exception("Ordenação por status incorreta")
+        print("✅ Alterações aplicadas linha a linha")
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro na lista virtual: {e}")
+        return False
+
+def test_fila_trabalho():
+    """Testa a fila de trabalho usada pela GUI (fora da thread principal)"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 18: Fila de Trabalho")
+    print("="*60)
+    
+    try:
+        import threading
+        import time
+        from main import SistemaTickets, FilaTrabalho
+        
+        test_file = "test_fila.json"
+        sistema = SistemaTickets(test_file)
+        fila = FilaTrabalho()
+        principal = threading.current_thread()
+        entregues = []
+        notificacoes = []
+        sistema.gerenciador.assinar(lambda i, t: fila.no_principal(
+            lambda: notificacoes.append((i, threading.current_thread() is principal))))
+        
+        fila.enviar(sistema.criar_ticket, "Fila", "Criado fora da thread principal")
+        fila.enviar(sistema.listar_resumos, ao_concluir=lambda r: entregues.append(("lista", len(r))))
+        if not fila.aguardar():
+            raise Exception("Tarefas não concluídas")
+        if entregues != [("lista", 1)] or len(notificacoes) != 1 or not notificacoes[0][1]:
+            raise Exception(f"Entrega incorreta: {entregues} {notificacoes}")
+        print("✅ Resultados e notificações entregues na thread principal")
+        
+        entregues.clear()
+        fila.enviar(time.sleep, 0.2)
+        for n in range(5):
+            fila.enviar(lambda n=n: n, ao_concluir=lambda n: entregues.append(n), chave="lista")
+        fila.aguardar()
+        if entregues != [4] or fila.pendentes != 0:
+            raise Exception(f"Requisições obsoletas não descartadas: {entregues}")
+        print("✅ Requisições obsoletas canceladas")
+        
+        erros = []
+        fila.enviar(lambda: 1 / 0, ao_falhar=erros.append)
+        fila.aguardar()
+        if len(erros) != 1 or not isinstance(erros[0], ZeroDivisionError):
+            raise Exception("Erro não entregue")
+        print("✅ Erros entregues ao retorno de falha")
+        
+        fila.encerrar()
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro na fila de trabalho: {e}")
+        return False
+
+def test_alteracoes_tempo_real():
+    """Testa o aviso de alterações entre instâncias (observador + sincronizar)"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 19: Alterações em Tempo Real")
+    print("="*60)
+    
+    try:
+        import shutil
+        import threading
+        from main import SistemaTickets, ObservadorAlteracoes
+        
+        for endereco in ("test_feed.json", "journal://test_feed_journal.json",
+                         "test_feed.db", "fragmentos://test_feed_fragmentos"):
+            admin = SistemaTickets(endereco)
+            publico = SistemaTickets(endereco)
+            admin.listar_resumos()
+            recebidos = []
+            admin.gerenciador.assinar(lambda i, t: recebidos.append((i, t.status if t else None)))
+            alterado = threading.Event()
+            observador = admin.observar_alteracoes(alterado.set, intervalo=0.2)
+            
+            novo = publico.criar_ticket(titulo="Público", descricao="Aberto por outra janela")
+            if not alterado.wait(5):
+                raise Exception(f"Observador não percebeu a gravação ({endereco})")
+            alterado.clear()
+            admin.gerenciador.sincronizar()
+            publico.atualizar_status(novo.id, "fechado")
+            admin.gerenciador.sincronizar()
+            publico.deletar_ticket(novo.id)
+            admin.gerenciador.sincronizar()
+            observador.parar()
+            if recebidos != [(novo.id, "aberto"), (novo.id, "fechado"), (novo.id, None)]:
+                raise Exception(f"Notificações incorretas em {endereco}: {recebidos}")
+            if hasattr(admin.gerenciador, "fechar"):
+                admin.gerenciador.fechar()
+                publico.gerenciador.fechar()
+        print("✅ Criação, alteração e remoção de outra instância notificadas")
+        
+        class ObservadorSemInotify(ObservadorAlteracoes):
+            def _abrir_inotify(self):
+                return None
+        
+        alterado = threading.Event()
+        sistema = SistemaTickets("test_feed.json")
+        observador = ObservadorSemInotify(sistema.gerenciador.arquivos_observados(), alterado.set, intervalo=0.1)
+        observador.iniciar()
+        SistemaTickets("test_feed.json").criar_ticket(titulo="Outro", descricao="Sem inotify")
+        ok = alterado.wait(5)
+        observador.parar()
+        if not ok:
+            raise Exception("Observador por intervalo não percebeu a gravação")
+        print("✅ Observação por intervalo (sem inotify) funciona")
+        
+        # Limpar
+        limpar_arquivos("test_feed.json", "test_feed_journal.json")
+        for sufixo in ("", "-wal", "-shm", ".ids.lock"):
+            if os.path.exists("test_feed.db" + sufixo):
+                os.remove("test_feed.db" + sufixo)
+        shutil.rmtree("test_feed_fragmentos", ignore_errors=True)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro nas alterações em tempo real: {e}")
+        return False
+
+def test_servidor_http():
+    """Testa a API HTTP/JSON (--serve)"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 20: Servidor HTTP")
+    print("="*60)
+    
+    try:
+        import asyncio
+        import json
+        import threading
+        import urllib.error
+        import urllib.request
+        from main import SistemaTickets, ServidorHTTP
+        
+        test_file = "test_http.json"
+        servidor = ServidorHTTP(SistemaTickets(test_file), porta=0)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(servidor.iniciar())
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{servidor.porta}"
+        
+        def chamar(metodo, caminho, dados=None):
+            corpo = json.dumps(dados).encode() if dados is not None else None
+            pedido = urllib.request.Request(base + caminho, data=corpo, method=metodo)
+            try:
+                with urllib.request.urlopen(pedido, timeout=10) as resposta:
+                    return resposta.status, json.loads(resposta.read())
+            except urllib.error.HTTPError as e:
+                return e.code, json.loads(e.read())
+        
+        try:
+            status, ticket = chamar("POST", "/tickets", {"titulo": "Via API", "descricao": "HTTP", "categoria": "Rede", "autor": "ana"})
+            if status != 201 or ticket["criado_por"] != "ana":
+                raise Exception(f"Criação falhou: {status} {ticket}")
+            tid = ticket["id"]
+            chamar("POST", f"/tickets/{tid}/status", {"status": "em_andamento"})
+            chamar("POST", f"/tickets/{tid}/prioridade", {"prioridade": "ALTA"})
+            chamar("POST", f"/tickets/{tid}/atribuir", {"usuario": "bruno"})
+            status, _ = chamar("POST", f"/tickets/{tid}/comentarios", {"conteudo": "Verificando"})
+            status, ticket = chamar("GET", f"/tickets/{tid}")
+            if (status, ticket["status"], ticket["prioridade"], ticket["atribuido_a"], len(ticket["comentarios"])) != \
+                    (200, "em_andamento", "ALTA", "bruno", 1):
+                raise Exception(f"Alterações não aplicadas: {ticket}")
+            if len(chamar("GET", f"/tickets/{tid}/historico")[1]) != 5:
+                raise Exception("Histórico incompleto")
+            print("✅ Criar, alterar, comentar e consultar via HTTP")
+            
+            if [t["id"] for t in chamar("GET", "/tickets?status=em_andamento&usuario=bruno")[1]] != [tid]:
+                raise Exception("Filtro da listagem incorreto")
+            pagina = chamar("GET", "/tickets?ordenar_por=atualizado_em&decrescente=1&limite=1")[1]
+            if [t["id"] for t in pagina["itens"]] != [tid] or pagina["cursor"] is not None:
+                raise Exception("Listagem paginada incorreta")
+            if chamar("GET", "/relatorio")[1]["total_tickets"] != 1:
+                raise Exception("Relatório incorreto")
+            if chamar("GET", "/tickets/NAOEXISTE")[0] != 404 or \
+                    chamar("POST", f"/tickets/{tid}/status", {"status": "xyz"})[0] != 400 or \
+                    chamar("DELETE", "/tickets")[0] != 405:
+                raise Exception("Erros HTTP incorretos")
+            if chamar("POST", "/tickets", {"titulo": "T", "descricao": "D", "categoria": ["a"]})[0] != 400 or \
+                    chamar("POST", "/tickets", {"titulo": "T", "descricao": "D", "prioridade": ["ALTA"]})[0] != 400:
+                raise Exception("Campos que não são texto deveriam dar 400")
+            print("✅ Listagem filtrada, relatório e erros")
+            
+            # Uma operação que impede a gravação do lote não derruba as outras
+            def valida():
+                return servidor.sistema.criar_ticket(titulo="Válido", descricao="x").to_dict()
+            def invalida():
+                return servidor.sistema.criar_ticket(titulo="Inválido", descricao="x", categoria=["a"]).to_dict()
+            resultados = servidor._aplicar_lote([valida, invalida])
+            if resultados[0]["titulo"] != "Válido" or getattr(resultados[1], "status", None) != 500:
+                raise Exception(f"Lote com falha não foi repetido por operação: {resultados}")
+            servidor.sistema.deletar_ticket(resultados[0]["id"])
+            print("✅ Falha na gravação do lote repete cada operação sozinha")
+            
+            resultados = []
+            def criar(i):
+                resultados.append(chamar("POST", "/tickets", {"titulo": f"Paralelo {i}", "descricao": "x"})[0])
+            threads = [threading.Thread(target=criar, args=(i,)) for i in range(20)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            if resultados.count(201) != 20 or len(SistemaTickets(test_file).listar_resumos()) != 21:
+                raise Exception("Criações concorrentes perdidas")
+            print("✅ Alterações concorrentes serializadas pela tarefa de escrita")
+        finally:
+            asyncio.run_coroutine_threadsafe(servidor.encerrar(), loop).result(10)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no servidor HTTP: {e}")
+        return False
+
+def _alocar_ids(caminho, quantidade, fila):
+    from main import AlocadorIds
+    alocador = AlocadorIds(caminho)
+    fila.put([alocador.novo() for _ in range(quantidade)])
+
+def test_alocador_ids():
+    """Testa o alocador de ids (únicos entre processos e ordenados pelo tempo)"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 21: Alocador de IDs")
+    print("="*60)
+    
+    try:
+        import multiprocessing
+        from main import AlocadorIds, BloqueioArquivo, SistemaTickets
+        
+        caminho = "test_ids"
+        alocador = AlocadorIds(caminho)
+        ids = [alocador.novo() for _ in range(3000)]
+        if len(set(ids)) != 3000 or ids != sorted(ids) or {len(i) for i in ids} != {15}:
+            raise Exception("Ids repetidos, fora de ordem ou de tamanho variável")
+        if BloqueioArquivo(caminho).geracao() != 3:
+            raise Exception("Blocos não reservados de 1024 em 1024")
+        print("✅ Ids únicos, ordenados e reservados em blocos")
+        
+        fila = multiprocessing.Queue()
+        processos = [multiprocessing.Process(target=_alocar_ids, args=(caminho, 500, fila)) for _ in range(4)]
+        for p in processos:
+            p.start()
+        todos = set(ids)
+        for _ in processos:
+            todos.update(fila.get())
+        for p in processos:
+            p.join()
+        if len(todos) != 5000:
+            raise Exception("Colisão entre processos")
+        print("✅ Sem colisões entre processos")
+        
+        test_file = "test_ids.json"
+        sistema = SistemaTickets(test_file)
+        a = sistema.criar_ticket(titulo="Primeiro", descricao="a")
+        b = sistema.criar_ticket(titulo="Segundo", descricao="b")
+        sistema.adicionar_comentario(a.id, "um")
+        sistema.adicionar_comentario(a.id, "dois")
+        comentarios = [c["id"] for c in sistema.gerenciador.obter_ticket(a.id).comentarios]
+        if not a.id < b.id or len(set(comentarios)) != 2:
+            raise Exception("Ids de tickets/comentários incorretos")
+        print("✅ Tickets e comentários usam o alocador")
+        
+        # Limpar
+        limpar_arquivos(test_file)
+        os.remove(caminho + ".lock")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no alocador de ids: {e}")
+        return False
+
+def test_indice_tempo():
+    """Testa listagens por intervalo de tempo e paginação por cursor"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 22: Índice de Tempo e Paginação")
+    print("="*60)
+    
+    try:
+        import shutil
+        from main import SistemaTickets, Ticket
+        
+        enderecos = ("test_tempo.json", "journal://test_tempo_journal.json",
+                     "test_tempo.db", "fragmentos://test_tempo_fragmentos")
+        for endereco in enderecos:
+            sistema = SistemaTickets(endereco)
+            tickets = []
+            for i in range(10):
+                ticket = Ticket(id=f"T{i:02d}", titulo=f"Ticket {i}", descricao="tempo",
+                                prioridade="ALTA" if i % 2 else "BAIXA",
+                                status="fechado" if i == 3 else "aberto",
+                                criado_em=f"2025-0{1 + i % 3}-{10 + i:02d}T08:00:00",
+                                atualizado_em=f"2025-04-{10 + i:02d}T08:00:00")
+                tickets.append(ticket)
+            sistema.gerenciador.salvar_tickets(tickets)
+            por_criacao = [t.id for t in sorted(tickets, key=lambda t: (t.criado_em, t.id))]
+            
+            paginas, cursor = [], None
+            while True:
+                pagina = sistema.listar_tickets(ordenar_por="criado_em", limite=4, cursor=cursor)
+                paginas.append([t.id for t in pagina])
+                cursor = pagina.cursor
+                if not cursor:
+                    break
+            if sum(paginas, []) != por_criacao or [len(p) for p in paginas] != [4, 4, 2]:
+                raise Exception(f"Paginação crescente incorreta em {endereco}: {paginas}")
+            
+            recentes = sistema.listar_resumos(ordenar_por="criado_em", decrescente=True, limite=3)
+            if [t.id for t in recentes] != por_criacao[::-1][:3]:
+                raise Exception(f"Mais recentes primeiro incorreto em {endereco}")
+            resto = sistema.listar_resumos(ordenar_por="criado_em", decrescente=True, cursor=recentes.cursor)
+            if [t.id for t in resto] != por_criacao[::-1][3:] or resto.cursor:
+                raise Exception(f"Cursor decrescente incorreto em {endereco}")
+            
+            intervalo = sistema.listar_tickets(desde="2025-02-01", ate="2025-03-01")
+            if sorted(t.id for t in intervalo) != ["T01", "T04", "T07"]:
+                raise Exception(f"Intervalo incorreto em {endereco}: {[t.id for t in intervalo]}")
+            
+            altas = sistema.listar_resumos(prioridade="ALTA", ordenar_por="atualizado_em", decrescente=True, limite=2)
+            if [t.id for t in altas] != ["T09", "T07"] or not altas.cursor:
+                raise Exception(f"Filtro com ordenação incorreto em {endereco}")
+            
+            sistema.atualizar_status("T00", "em_andamento")
+            sistema.deletar_ticket("T09")
+            ultimos = sistema.listar_resumos(ordenar_por="atualizado_em", decrescente=True, limite=2)
+            if [t.id for t in ultimos] != ["T00", "T08"]:
+                raise Exception(f"Índice não acompanhou alterações em {endereco}: {[t.id for t in ultimos]}")
+            if hasattr(sistema.gerenciador, "fechar"):
+                sistema.gerenciador.fechar()
+        print("✅ Intervalos, ordem crescente/decrescente e cursores em todos os backends")
+        
+        # Limpar
+        limpar_arquivos("test_tempo.json", "test_tempo_journal.json")
+        for sufixo in ("", "-wal", "-shm", ".ids.lock"):
+            if os.path.exists("test_tempo.db" + sufixo):
+                os.remove("test_tempo.db" + sufixo)
+        shutil.rmtree("test_tempo_fragmentos", ignore_errors=True)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no índice de tempo: {e}")
+        return False
+
+def _pegar_tickets(arquivo_dados, agente, fila):
+    from main import SistemaTickets
+    sistema = SistemaTickets(arquivo_dados)
+    ids = []
+    while True:
+        ticket = sistema.proximo_ticket(agente)
+        if ticket is None:
+            break
+        ids.append(ticket.id)
+    fila.put(ids)
+
+def test_fila_triagem():
+    """Testa a fila de triagem (próximo ticket, reserva e devolução)"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 23: Fila de Triagem")
+    print("="*60)
+    
+    try:
+        import multiprocessing
+        import shutil
+        from main import SistemaTickets, Ticket
+        
+        enderecos = ("test_triagem.json", "journal://test_triagem_journal.json",
+                     "test_triagem.db", "fragmentos://test_triagem_fragmentos")
+        for endereco in enderecos:
+            sistema = SistemaTickets(endereco)
+            sistema.gerenciador.salvar_tickets([
+                Ticket(id="T1", titulo="Baixa antiga", descricao="x", prioridade="BAIXA", criado_em="2025-01-01T08:00:00"),
+                Ticket(id="T2", titulo="Alta nova", descricao="x", prioridade="ALTA", criado_em="2025-03-01T08:00:00"),
+                Ticket(id="T3", titulo="Alta antiga", descricao="x", prioridade="ALTA", criado_em="2025-02-01T08:00:00"),
+                Ticket(id="T4", titulo="Alta reaberta", descricao="x", prioridade="ALTA", status="reaberto",
+                       criado_em="2025-02-01T08:00:00"),
+                Ticket(id="T5", titulo="Crítica fechada", descricao="x", prioridade="CRITICA", status="fechado"),
+                Ticket(id="T6", titulo="Crítica atribuída", descricao="x", prioridade="CRITICA", atribuido_a="ana"),
+                Ticket(id="T7", titulo="Média", descricao="x", prioridade="MEDIA", criado_em="2025-01-15T08:00:00"),
+            ])
+            primeiro = sistema.proximo_ticket("bia")
+            sistema.atualizar_prioridade("T1", "CRITICA")
+            segundo = sistema.proximo_ticket("bia")
+            sistema.liberar_ticket(primeiro.id, "bia")
+            devolvido = sistema.proximo_ticket("caio")
+            restantes = [sistema.proximo_ticket("caio") for _ in range(4)]
+            negado = sistema.liberar_ticket("T3", "bia")
+            if primeiro.id != "T4" or segundo.id != "T1" or devolvido.id != "T4":
+                raise Exception(f"Ordem incorreta em {endereco}: {primeiro.id}, {segundo.id}, {devolvido.id}")
+            if [t and t.id for t in restantes] != ["T3", "T2", "T7", None] or negado:
+                raise Exception(f"Fila incorreta em {endereco}: {[t and t.id for t in restantes]}")
+            reservado = sistema.gerenciador.obter_ticket("T3")
+            if reservado.atribuido_a != "caio" or "reservado" not in reservado.historico[-1]["descricao"]:
+                raise Exception(f"Reserva não gravada em {endereco}")
+            if hasattr(sistema.gerenciador, "fechar"):
+                sistema.gerenciador.fechar()
+        print("✅ Prioridade, idade e reabertos; reserva, devolução e alterações incrementais")
+        
+        for endereco in ("journal://test_triagem_journal.json", "test_triagem.db"):
+            sistema = SistemaTickets(endereco)
+            with sistema.lote():
+                criados = {sistema.criar_ticket(titulo=f"Fila {i}", descricao="x").id for i in range(60)}
+            fila = multiprocessing.Queue()
+            processos = [multiprocessing.Process(target=_pegar_tickets, args=(endereco, f"agente{i}", fila))
+                         for i in range(4)]
+            for p in processos:
+                p.start()
+            pegos = []
+            for _ in processos:
+                pegos.extend(fila.get())
+            for p in processos:
+                p.join()
+            if sorted(pegos) != sorted(criados):
+                raise Exception(f"Tickets repetidos ou esquecidos entre agentes em {endereco}")
+            if hasattr(sistema.gerenciador, "fechar"):
+                sistema.gerenciador.fechar()
+        print("✅ Agentes concorrentes nunca recebem o mesmo ticket")
+        
+        # Limpar
+        limpar_arquivos("test_triagem.json", "test_triagem_journal.json")
+        for sufixo in ("", "-wal", "-shm", ".ids.lock"):
+            if os.path.exists("test_triagem.db" + sufixo):
+                os.remove("test_triagem.db" + sufixo)
+        shutil.rmtree("test_triagem_fragmentos", ignore_errors=True)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro na fila de triagem: {e}")
+        return False
+
+def test_atribuicao_automatica():
+    """Testa a atribuição automática por carga e o rebalanceamento"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 24: Atribuição Automática")
+    print("="*60)
+    
+    try:
+        import shutil
+        from main import SistemaTickets
+        
+        enderecos = ("test_balanceamento.json", "test_balanceamento.db", "fragmentos://test_balanceamento_fragmentos")
+        for endereco in enderecos:
+            sistema = SistemaTickets(endereco, arquivo_agentes="test_agentes.json")
+            sistema.criar_ticket(titulo="Antigo", descricao="x", categoria="Bug", atribuido_a="ana")
+            sistema.definir_agentes({"ana": ["Bug"], "bia": ["Bug", "Rede"], "caio": []})
+            
+            with sistema.lote():
+                bugs = [sistema.criar_ticket(titulo=f"Bug {i}", descricao="x", categoria="Bug") for i in range(5)]
+            rede = sistema.criar_ticket(titulo="Rede", descricao="x", categoria="Rede")
+            if sorted(t.atribuido_a for t in bugs) != ["ana", "bia", "bia", "caio", "caio"] or rede.atribuido_a != "bia":
+                raise Exception(f"Distribuição incorreta em {endereco}: {[t.atribuido_a for t in bugs]}, {rede.atribuido_a}")
+            if sistema.cargas_agentes() != {"ana": 2, "bia": 3, "caio": 2}:
+                raise Exception(f"Cargas incorretas em {endereco}: {sistema.cargas_agentes()}")
+            
+            # Fechar ou reatribuir atualiza as cargas sem recontar
+            sistema.atualizar_status(rede.id, "fechado")
+            sistema.atribuir_ticket(bugs[0].id, "bia")
+            with sistema.lote():
+                for i in range(4):
+                    sistema.criar_ticket(titulo=f"Manual {i}", descricao="x", categoria="Bug", atribuido_a="ana")
+            cargas = sistema.cargas_agentes()
+            movimentos = sistema.rebalancear_atribuicoes()
+            depois = sistema.cargas_agentes()
+            if max(depois.values()) - min(depois.values()) > 1 or sum(depois.values()) != sum(cargas.values()):
+                raise Exception(f"Rebalanceamento incorreto em {endereco}: {cargas} → {depois}")
+            for ticket_id, origem, destino in movimentos:
+                if sistema.gerenciador.obter_ticket(ticket_id).atribuido_a != destino:
+                    raise Exception(f"Rebalanceamento não gravado em {endereco}")
+            if SistemaTickets(endereco, arquivo_agentes="test_agentes.json").cargas_agentes() != depois:
+                raise Exception(f"Cargas divergem após recarregar {endereco}")
+            if hasattr(sistema.gerenciador, "fechar"):
+                sistema.gerenciador.fechar()
+        print("✅ Menor carga por categoria, cargas incrementais e rebalanceamento em lote")
+        
+        # Limpar
+        limpar_arquivos("test_balanceamento.json", "test_agentes.json")
+        for sufixo in ("", "-wal", "-shm", ".ids.lock"):
+            if os.path.exists("test_balanceamento.db" + sufixo):
+                os.remove("test_balanceamento.db" + sufixo)
+        shutil.rmtree("test_balanceamento_fragmentos", ignore_errors=True)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro na atribuição automática: {e}")
+        return False
+
+def test_sla():
+    """Testa a agenda de SLA e a escalada de tickets vencidos"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 25: SLA e Escalada")
+    print("="*60)
+    
+    try:
+        import shutil
+        import time
+        from datetime import datetime, timedelta
+        from main import SistemaTickets, Ticket, AgendaSLA, ResumoTicket
+        
+        inicio = datetime(2025, 6, 2, 8, 0, 0)
+        enderecos = ("test_sla.json", "test_sla.db", "fragmentos://test_sla_fragmentos")
+        for endereco in enderecos:
+            sistema = SistemaTickets(endereco, arquivo_agentes="test_sla_agentes.json")
+            sistema.definir_agentes({"ana": [], "bia": []}, automatico=False)
+            criado = inicio.isoformat()
+            sistema.gerenciador.salvar_tickets([
+                Ticket(id="S1", titulo="Baixa esquecida", descricao="x", prioridade="BAIXA",
+                       criado_em=criado, atualizado_em=criado),
+                Ticket(id="S2", titulo="Crítica parada", descricao="x", prioridade="CRITICA", status="em_andamento",
+                       atribuido_a="ana", criado_em=criado, atualizado_em=criado),
+                Ticket(id="S3", titulo="Fechada", descricao="x", prioridade="CRITICA", status="fechado",
+                       criado_em=criado, atualizado_em=criado),
+                Ticket(id="S4", titulo="Recente", descricao="x", prioridade="ALTA",
+                       criado_em=(inicio + timedelta(hours=30)).isoformat(),
+                       atualizado_em=(inicio + timedelta(hours=30)).isoformat()),
+            ])
+            agora = inicio + timedelta(hours=25)
+            escalados = {t.id: t for t in sistema.verificar_sla(agora)}
+            if sorted(escalados) != ["S1", "S2"]:
+                raise Exception(f"Vencidos incorretos em {endereco}: {sorted(escalados)}")
+            s1 = sistema.gerenciador.obter_ticket("S1")
+            s2 = sistema.gerenciador.obter_ticket("S2")
+            if s1.prioridade != "MEDIA" or s1.historico[-1]["usuario"] != "sla":
+                raise Exception(f"Prioridade não escalada em {endereco}")
+            if s2.atribuido_a != "bia" or "reatribuído" not in s2.historico[-1]["descricao"]:
+                raise Exception(f"Ticket crítico não reatribuído em {endereco}")
+            if sistema.verificar_sla(agora):
+                raise Exception(f"Escalada repetida sem novo prazo em {endereco}")
+            
+            # Nova prioridade tem seu próprio prazo a partir da escalada; em
+            # CRITICA a violação é registrada uma vez e não renova o prazo
+            proximo = sistema.proximo_prazo_sla()
+            if proximo != agora + timedelta(hours=8):
+                raise Exception(f"Próximo prazo incorreto em {endereco}: {proximo}")
+            depois = [t.id for t in sistema.verificar_sla(agora + timedelta(hours=8, seconds=1))]
+            if depois != ["S1"] or sistema.gerenciador.obter_ticket("S1").prioridade != "ALTA":
+                raise Exception(f"Segunda escalada incorreta em {endereco}: {depois}")
+            for hora in range(9, 57):
+                sistema.verificar_sla(agora + timedelta(hours=hora, seconds=1))
+            escaladas = {tid: [h["valor_novo"] for h in sistema.gerenciador.obter_ticket(tid).historico
+                               if h["usuario"] == "sla"] for tid in ("S1", "S2")}
+            if escaladas["S1"][:3] != ["MEDIA", "ALTA", "CRITICA"] or len(escaladas["S1"]) != 4 \
+                    or escaladas["S2"] != ["bia"]:
+                raise Exception(f"Escaladas repetidas em 48h em {endereco}: {escaladas}")
+            # Uma alteração feita por outra pessoa abre um novo prazo
+            sistema.atualizar_status("S2", "pausado")
+            if AgendaSLA().prazo(sistema.gerenciador.obter_ticket("S2")) is None:
+                raise Exception(f"Alteração manual não reabriu o prazo em {endereco}")
+            if hasattr(sistema.gerenciador, "fechar"):
+                sistema.gerenciador.fechar()
+        print("✅ Resposta e resolução vencidas escalam prioridade ou reatribuem, com histórico")
+        
+        agenda = AgendaSLA()
+        base = datetime.now() - timedelta(hours=200)
+        resumos = [ResumoTicket(id=f"R{i:06d}", titulo="t", prioridade="MEDIA", status="aberto",
+                                criado_em=(base + timedelta(seconds=i)).isoformat(),
+                                atualizado_em=(base + timedelta(seconds=i)).isoformat(), criado_por="x")
+                   for i in range(100000)]
+        t0 = time.perf_counter()
+        agenda.carregar(resumos)
+        montagem = time.perf_counter() - t0
+        corte = (base + timedelta(hours=8, seconds=999)).timestamp()
+        t0 = time.perf_counter()
+        vencidos = agenda.vencidos(corte)
+        tick = time.perf_counter() - t0
+        if len(vencidos) != 1000 or len(agenda) != 99000 or agenda.vencidos(corte):
+            raise Exception("Agenda com 100 mil prazos incorreta")
+        print(f"✅ 100 mil prazos: montagem {montagem:.2f}s, verificação com 1000 vencidos {tick * 1000:.1f}ms")
+        
+        # Limpar
+        limpar_arquivos("test_sla.json", "test_sla_agentes.json")
+        for sufixo in ("", "-wal", "-shm", ".ids.lock"):
+            if os.path.exists("test_sla.db" + sufixo):
+                os.remove("test_sla.db" + sufixo)
+        shutil.rmtree("test_sla_fragmentos", ignore_errors=True)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no SLA: {e}")
+        return False
+
+def test_inicializacao_sem_gui():
+    """Testa que o núcleo e a CLI funcionam sem tkinter (servidores headless)"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 26: Inicialização sem Interface Gráfica")
+    print("="*60)
+    
+    try:
+        import subprocess
+        import tempfile
+        
+        pasta = tempfile.mkdtemp(prefix="test_headless")
+        ambiente = dict(os.environ, TICKETFLOW_DADOS=os.path.join(pasta, "tickets.json"),
+                        TICKETFLOW_AGENTES=os.path.join(pasta, "agentes.json"))
+        raiz = os.path.dirname(os.path.abspath(__file__))
+        
+        # tkinter ausente: sys.modules["tkinter"] = None faz qualquer import falhar
+        codigo = (
+            "import sys; sys.modules['tkinter'] = None\n"
+            "import main\n"
+            "sistema = main.SistemaTickets()\n"
+            "ticket = sistema.criar_ticket(titulo='Headless', descricao='Sem Tk')\n"
+            "assert sistema.gerenciador.obter_ticket(ticket.id).titulo == 'Headless'\n"
+            "main.UserManager\n"
+            "try:\n"
+            "    main.launch_public_submit()\n"
+            "except RuntimeError as e:\n"
+            "    print('gui:', e)\n"
+            "print('carregados:', [m for m in ('asyncio', 'concurrent.futures') if m in sys.modules])\n"
+        )
+        resultado = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, env=ambiente,
+                                   capture_output=True, text=True, timeout=60)
+        assert resultado.returncode == 0, resultado.stderr
+        assert "gui: interface gráfica indisponível" in resultado.stdout, resultado.stdout
+        assert "carregados: []" in resultado.stdout, resultado.stdout
+        print("✅ Núcleo importado e usado sem tkinter; a GUI falha com mensagem clara")
+        
+        # --cli até o primeiro menu, também sem tkinter
+        codigo = (
+            "import sys, runpy; sys.modules['tkinter'] = None\n"
+            "sys.argv = ['main.py', '--cli']\n"
+            "runpy.run_path('main.py', run_name='__main__')\n"
+        )
+        resultado = subprocess.run([sys.executable, "-c", codigo], cwd=raiz, env=ambiente, input="0\n",
+                                   capture_output=True, text=True, timeout=60)
+        assert resultado.returncode == 0, resultado.stderr
+        assert "Até logo" in resultado.stdout, resultado.stdout
+        print("✅ main.py --cli inicia sem tkinter")
+        
+        import shutil
+        shutil.rmtree(pasta, ignore_errors=True)
+        return True
+    except Exception as e:
+        print(f"❌ Erro na inicialização sem GUI: {e}")
+        return False
+
+def test_benchmark_desempenho():
+    """Testa o benchmark de armazenamento e a comparação com baseline"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 27: Benchmark de Desempenho")
+    print("="*60)
+    
+    try:
+        import copy
+        import json
+        from bench_desempenho import executar_benchmark, comparar, gerar_tickets, OPERACOES, _em_processo
+        
+        # Bases sintéticas são reprodutíveis
+        primeira = [t.to_dict() for t in gerar_tickets(50, semente=7)]
+        assert primeira == [t.to_dict() for t in gerar_tickets(50, semente=7)]
+        assert any(t["comentarios"] for t in primeira) and any(t["historico"] for t in primeira)
+        print("✅ Base sintética determinística, com histórico e comentários")
+        
+        documento = executar_benchmark(tamanhos=[200], backends=["journal", "sqlite"], operacoes=10)
+        documento = json.loads(json.dumps(documento))
+        for chave in ("journal:200", "sqlite:200"):
+            medicao = documento["resultados"][chave]
+            assert set(medicao["operacoes"]) == set(OPERACOES), medicao["operacoes"].keys()
+            for metricas in medicao["operacoes"].values():
+                assert metricas["n"] > 0 and metricas["p50_ms"] <= metricas["p99_ms"] <= metricas["max_ms"]
+        print(f"✅ {len(OPERACOES)} operações medidas em {len(documento['resultados'])} backends")
+        
+        assert comparar(documento, documento) == []
+        baseline = copy.deepcopy(documento)
+        referencia = baseline["resultados"]["sqlite:200"]
+        referencia["operacoes"]["criar_ticket"]["por_segundo"] *= 10
+        if referencia["memoria_pico_mb"] is not None:
+            referencia["memoria_pico_mb"] /= 2
+        regressoes = comparar(documento, baseline, tolerancia=0.25)
+        assert any("criar_ticket por_segundo" in r for r in regressoes), regressoes
+        print(f"✅ Regressões detectadas contra a baseline: {len(regressoes)}")
+        
+        # Processo encerrado sem resultado (ex.: falta de memória) vira erro, não trava
+        try:
+            _em_processo(os._exit, 9)
+            raise AssertionError("processo sem resultado não gerou erro")
+        except RuntimeError as e:
+            assert "código de saída 9" in str(e), e
+        print("✅ Processo de medição encerrado sem resultado é relatado")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no benchmark de desempenho: {e}")
+        return False
+
+def test_instrumentacao():
+    """Testa as medições de fases, os contadores de bytes e o --profile"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 28: Instrumentação de Desempenho")
+    print("="*60)
+    
+    import subprocess
+    import tempfile
+    from main import SistemaTickets, perfil
+    
+    enderecos = ("test_perfil.json", "journal://test_perfil_journal.json", "test_perfil.db")
+    try:
+        assert not perfil.ativo
+        assert perfil.medir("fase") is perfil.medir("outra"), "desligada, medir() não deve criar objetos"
+        
+        perfil.ativar()
+        esperadas = {
+            "test_perfil.json": {"json.ler", "json.decodificar", "tickets.montar", "json.serializar", "json.gravar"},
+            "journal://test_perfil_journal.json": {"json.ler", "tickets.montar", "journal.gravar"},
+            "test_perfil.db": {"sqlite.gravar", "sqlite.consultar"},
+        }
+        for endereco in enderecos:
+            perfil.zerar()
+            sistema = SistemaTickets(endereco)
+            ticket = sistema.criar_ticket(titulo="Medido", descricao="Instrumentação", prioridade="ALTA")
+            sistema.adicionar_comentario(ticket.id, "comentário")
+            sistema.listar_tickets(prioridade="ALTA")
+            sistema.gerar_relatorio_completo()
+            estatisticas = perfil.estatisticas()
+            fases = set(estatisticas["tempos"])
+            faltando = (esperadas[endereco] | {"sistema.listar", "sistema.relatorio"}) - fases
+            assert not faltando, f"{endereco}: fases não medidas {faltando}"
+            if not endereco.endswith(".db"):
+                assert estatisticas["contadores"]["bytes_gravados"] > 0
+                assert estatisticas["contadores"]["bytes_lidos"] > 0
+            print(f"✅ {endereco}: {len(fases)} fases medidas")
+        
+        assert "sistema.listar" in perfil.relatorio()
+        perfil.desativar()
+        perfil.zerar()
+        SistemaTickets(enderecos[0]).listar_tickets()
+        assert perfil.estatisticas() == {"tempos": {}, "contadores": {}}
+        print("✅ Desligada, nenhuma medição é registrada")
+        
+        # --profile na linha de comando: tabela impressa ao sair
+        pasta = tempfile.mkdtemp(prefix="test_perfil")
+        ambiente = dict(os.environ, TICKETFLOW_DADOS=os.path.join(pasta, "tickets.json"),
+                        TICKETFLOW_AGENTES=os.path.join(pasta, "agentes.json"))
+        raiz = os.path.dirname(os.path.abspath(__file__))
+        resultado = subprocess.run([sys.executable, os.path.join(raiz, "main.py"), "--cli", "--profile"],
+                                   cwd=pasta, env=ambiente, input="9\n\n0\n", capture_output=True,
+                                   text=True, timeout=60)
+        assert resultado.returncode == 0, resultado.stderr
+        assert "Instrumentação do TicketFlow" in resultado.stderr and "sistema.relatorio" in resultado.stderr
+        print("✅ --profile imprime as fases medidas ao sair")
+        import shutil
+        shutil.rmtree(pasta, ignore_errors=True)
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro na instrumentação: {e}")
+        return False
+    finally:
+        perfil.desativar()
+        perfil.zerar()
+        limpar_arquivos("test_perfil.json", "test_perfil_journal.json")
+        for sufixo in ("", "-wal", "-shm", ".ids.lock"):
+            if os.path.exists("test_perfil.db" + sufixo):
+                os.remove("test_perfil.db" + sufixo)
+
+def test_log_eventos():
+    """Testa o log estruturado de eventos e os apresentadores"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 29: Log de Eventos")
+    print("="*60)
+    
+    import io
+    import json
+    import tempfile
+    from contextlib import redirect_stdout
+    from datetime import datetime
+    from main import SistemaTickets, eventos
+    
+    test_file = "test_eventos.json"
+    arquivo_log = os.path.join(tempfile.mkdtemp(prefix="test_eventos"), "eventos.jsonl")
+    try:
+        sistema = SistemaTickets(test_file)
+        sistema.definir_usuario("auditor")
+        
+        # O terminal continua recebendo as mensagens amigáveis
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            ticket = sistema.criar_ticket(titulo="Evento", descricao="Log estruturado")
+        assert f"✓ Ticket criado com sucesso: {ticket.id}" in saida.getvalue()
+        print("✅ Apresentador do terminal mantém as mensagens")
+        
+        # Em lote: nada na saída, tudo no arquivo JSON lines
+        eventos.registrar_em(arquivo_log)
+        saida = io.StringIO()
+        with redirect_stdout(saida), eventos.silencioso():
+            sistema.atualizar_status(ticket.id, "em_andamento")
+            sistema.adicionar_comentario(ticket.id, "nota")
+            sistema.atualizar_status("INEXISTENTE", "fechado")
+        assert saida.getvalue() == "", saida.getvalue()
+        assert eventos.descarregar()
+        with open(arquivo_log, encoding="utf-8") as f:
+            registros = [json.loads(linha) for linha in f]
+        assert [r["op"] for r in registros] == ["atualizar_status", "adicionar_comentario", "atualizar_status"]
+        assert [r["nivel"] for r in registros] == ["info", "info", "aviso"]
+        assert registros[0]["ticket_id"] == ticket.id and registros[0]["usuario"] == "auditor"
+        assert registros[0]["duracao_ms"] >= 0 and registros[2]["duracao_ms"] is None
+        assert registros[0]["ts"].startswith(str(datetime.now().year))
+        print(f"✅ {len(registros)} eventos gravados em JSON lines sem escrever na saída")
+        
+        # Apresentadores próprios (ex.: GUI) recebem o evento inteiro
+        recebidos = []
+        eventos.apresentar(recebidos.append)
+        with redirect_stdout(io.StringIO()):
+            sistema.deletar_ticket(ticket.id)
+        eventos.remover_apresentador(recebidos.append)
+        assert [e["op"] for e in recebidos] == ["deletar_ticket"]
+        print("✅ Apresentador próprio recebeu o evento estruturado")
+        
+        # Gravação com falha vira evento de erro e False, nunca "✓"
+        with redirect_stdout(io.StringIO()):
+            ticket = sistema.criar_ticket(titulo="Falha", descricao="Disco cheio")
+        recebidos = []
+        eventos.apresentar(recebidos.append)
+        def falhar(alteracoes):
+            raise OSError("disco cheio")
+        sistema.gerenciador._gravar = falhar
+        try:
+            with redirect_stdout(io.StringIO()):
+                resultados = [sistema.atualizar_status(ticket.id, "em_andamento"),
+                              sistema.atualizar_prioridade(ticket.id, "ALTA"),
+                              sistema.atribuir_ticket(ticket.id, "ana"),
+                              sistema.adicionar_comentario(ticket.id, "nota")]
+        finally:
+            del sistema.gerenciador._gravar
+            eventos.remover_apresentador(recebidos.append)
+        assert resultados == [False] * 4, resultados
+        operacoes = [e for e in recebidos if e["op"] in
+                     ("atualizar_status", "atualizar_prioridade", "atribuir_ticket", "adicionar_comentario")]
+        assert [e["nivel"] for e in operacoes] == ["erro"] * 4, operacoes
+        assert all(e["mensagem"].startswith("✗") for e in operacoes)
+        assert sistema.gerenciador.obter_ticket(ticket.id).status == "aberto"
+        print("✅ Falha ao gravar é relatada como erro, não como sucesso")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro no log de eventos: {e}")
+        return False
+    finally:
+        eventos.fechar()
+        limpar_arquivos(test_file)
+
+def test_importacao_exportacao():
+    """Testa a importação/exportação em fluxo (JSONL e CSV) entre backends"""
+    print("\n" + "="*60)
+    print("🧪 TESTE 30: Importação e Exportação em Fluxo")
+    print("="*60)
+    
+    import json
+    import shutil
+    import tempfile
+    from bench_desempenho import gerar_tickets
+    from main import AgendaSLA, SistemaTickets, eventos
+    
+    pasta = tempfile.mkdtemp(prefix="test_troca")
+    agentes = os.path.join(pasta, "agentes.json")
+    try:
+        originais = {t.id: t.to_dict() for t in gerar_tickets(250)}
+        origem = os.path.join(pasta, "origem.jsonl")
+        with open(origem, "w", encoding="utf-8") as f:
+            for dados in originais.values():
+                f.write(json.dumps(dados, ensure_ascii=False) + "\n")
+            f.write("{quebrado\n")
+            f.write(json.dumps({"titulo": "Sem descrição", "prioridade": "ALTA"}) + "\n")
+            f.write(json.dumps({"titulo": "T", "descricao": "D", "prioridade": "URGENTE"}) + "\n")
+            f.write(json.dumps({"titulo": "T", "descricao": "D", "prioridade": "BAIXA",
+                                "criado_em": "ontem"}) + "\n")
+            f.write(json.dumps({"titulo": "T", "descricao": "D", "prioridade": "ALTA",
+                                "historico": [{"x": 1}]}) + "\n")
+            f.write(json.dumps({"titulo": "Novo", "descricao": "Sem id", "prioridade": "MEDIA"}) + "\n")
+            f.write(json.dumps({"titulo": "Fuso", "descricao": "UTC", "prioridade": "CRITICA",
+                                "criado_em": "2025-01-01T00:00:00+00:00",
+                                "atualizado_em": "2025-01-01T01:00:00"}) + "\n")
+            # Repetido: uma vez contra o que já foi gravado, outra dentro do mesmo lote
+            repetido = json.dumps(next(iter(originais.values())), ensure_ascii=False) + "\n"
+            f.write(repetido + repetido)
+        
+        progresso = []
+        with eventos.silencioso():
+            sistema = SistemaTickets(os.path.join(pasta, "tickets.json"), agentes)
+            resultado = sistema.importar_tickets(origem, tamanho_lote=100,
+                                                 progresso=lambda total, _: progresso.append(total))
+        assert resultado == {"importados": 252, "substituidos": 2, "invalidos": 5, "lotes": 3}, resultado
+        assert progresso == [100, 200, 254], progresso
+        todos = {t.titulo: t for t in sistema.gerenciador.obter_todos_tickets()}
+        assert todos["Novo"].id and todos["Novo"].status == "aberto"
+        assert "+" not in todos["Fuso"].criado_em and AgendaSLA().prazo(todos["Fuso"]) is not None
+        print("✅ JSONL importado em 3 lotes; 5 linhas inválidas ignoradas; 2 substituições; id alocado")
+        
+        # JSON → CSV → SQLite → JSONL → fragmentos: nada se perde no caminho
+        anterior = sistema
+        for formato, endereco in (("csv", "sqlite://" + os.path.join(pasta, "tickets.db")),
+                                  ("jsonl", "fragmentos://" + os.path.join(pasta, "fragmentos"))):
+            arquivo = os.path.join(pasta, "troca." + formato)
+            with eventos.silencioso():
+                assert anterior.exportar_tickets(arquivo) == 252
+                destino = SistemaTickets(endereco, agentes)
+                assert destino.importar_tickets(arquivo)["importados"] == 252
+            anterior = destino
+        finais = {t.id: t.to_dict() for t in anterior.gerenciador.iterar_tickets()}
+        assert len(finais) == 252
+        assert all(finais[i] == dados for i, dados in originais.items())
+        print("✅ Ida e volta JSON → CSV → SQLite → JSONL → fragmentos preservou os tickets")
+        
+        # SQLite percorre em páginas por id
+        sqlite = SistemaTickets("sqlite://" + os.path.join(pasta, "tickets.db"), agentes).gerenciador
+        ids = [t.id for t in sqlite.iterar_tickets(tamanho_pagina=7)]
+        assert ids == sorted(finais) and len(set(ids)) == 252
+        sqlite.fechar()
+        print("✅ iterar_tickets do SQLite pagina por id sem repetir tickets")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Erro na importação/exportação: {e}")
+        return False
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
 def main():
     """Executa todos os testes"""
     print("\n" + "="*60)
@@ -178,6 +1682,31 @@ def main():
     results.append(("Tkinter", test_tkinter()))
     results.append(("Persistência JSON", test_json_persistence()))
     results.append(("Operações de Status", test_status_operations()))
+    results.append(("Cache em Memória", test_cache_memoria()))
+    results.append(("Journal", test_journal()))
+    results.append(("SQLite", test_sqlite()))
+    results.append(("Índices Secundários", test_indices_secundarios()))
+    results.append(("Estatísticas Incrementais", test_estatisticas_incrementais()))
+    results.append(("Operações em Lote", test_operacoes_em_lote()))
+    results.append(("Concorrência", test_concorrencia()))
+    results.append(("Fragmentos", test_fragmentos()))
+    results.append(("Resumos", test_resumos()))
+    results.append(("Representação Compacta", test_representacao_compacta()))
+    results.append(("Busca Textual", test_busca_textual()))
+    results.append(("Lista Virtual", test_lista_virtual()))
+    results.append(("Fila de Trabalho", test_fila_trabalho()))
+    results.append(("Alterações em Tempo Real", test_alteracoes_tempo_real()))
+    results.append(("Servidor HTTP", test_servidor_http()))
+    results.append(("Alocador de IDs", test_alocador_ids()))
+    results.append(("Índice de Tempo", test_indice_tempo()))
+    results.append(("Fila de Triagem", test_fila_triagem()))
+    results.append(("Atribuição Automática", test_atribuicao_automatica()))
+    results.append(("SLA e Escalada", test_sla()))
+    results.append(("Inicialização sem GUI", test_inicializacao_sem_gui()))
+    results.append(("Benchmark de Desempenho", test_benchmark_desempenho()))
+    results.append(("Instrumentação", test_instrumentacao()))
+    results.append(("Log de Eventos", test_log_eventos()))
+    results.append(("Importação e Exportação", test_importacao_exportacao()))
     
     # Resumo
     print("\n" + "="*60)